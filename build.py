@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import pathlib
+import sys
 from distutils.core import setup, Extension
 from distutils.errors import DistutilsPlatformError, CCompilerError, DistutilsExecError
 
@@ -49,9 +50,18 @@ install_requires = \
  'toposort>=1.7,<2.0']
 
 
+if sys.platform == 'win32':
+    platform_include_dir = "sampo/native/timeEstimatorLibrary/Windows"
+    openmp_args = ['/openmp']
+    platform_libraries = []
+else:
+    platform_include_dir = "sampo/native/timeEstimatorLibrary/Unix"
+    openmp_args = ['-fopenmp']
+    platform_libraries = ['dl']
+
 ext_modules = [
     Extension("native",
-              include_dirs=[numpy.get_include()],
+              include_dirs=[numpy.get_include(), "sampo/native/timeEstimatorLibrary", platform_include_dir],
               sources=[
                        # "basic_types.h",
                        # "contractor.h",
@@ -64,7 +74,10 @@ ext_modules = [
                        "sampo/native/python_deserializer.cpp",
                        "sampo/native/chromosome_evaluator.cpp",
                        # "workgraph.h"
-              ],),
+              ],
+              extra_compile_args=openmp_args,
+              extra_link_args=openmp_args,
+              libraries=platform_libraries),
 ]
 
 class BuildFailed(Exception):
@@ -6,7 +6,7 @@ from typing import Callable
 import numpy as np
 from deap import base, creator
 
-from sampo.schemas import Schedule
+from sampo.schemas.schedule_evaluation import ScheduleEvaluation
 from sampo.schemas.schedule_spec import ScheduleSpec
 
 ChromosomeType = tuple[np.ndarray, np.ndarray, np.ndarray, ScheduleSpec, np.ndarray]
@@ -14,6 +14,8 @@ ChromosomeType = tuple[np.ndarray, np.ndarray, np.ndarray, ScheduleSpec, np.ndar
 class ScheduleGenerationScheme(Enum):
     Parallel = 'Parallel'
     Serial = 'Serial'
+    # serial scheme, that reuses the decoded prefixes of previously evaluated chromosomes
+    IncrementalSerial = 'IncrementalSerial'
 
 
 class FitnessFunction(ABC):
@@ -22,15 +24,25 @@ class FitnessFunction(ABC):
     """
 
     @abstractmethod
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) \
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) \
             -> tuple[int | float]:
         """
         Calculate the value of fitness function of the chromosome.
         It is better when value is less.
+
+        The evaluator returns lightweight `ScheduleEvaluation` or None if the chromosome is incorrect.
         """
         ...
 
 
+class MakespanBound(tuple):
+    """
+    Fitness value of the chromosome, which evaluation was aborted by the makespan cutoff.
+    It holds the lower bound of the makespan instead of the exact value, so it is worse than the cutoff,
+    but it can't be used as the exact fitness value.
+    """
+
+
 # create class FitnessMin, the weights = -1 means that fitness - is function for minimum
 
 # creator.create('FitnessMin', base.Fitness, weights=(-1.0,))
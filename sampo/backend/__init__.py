@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 from random import Random
-from typing import TypeVar
+from typing import TypeVar, Callable
 
 # import sampo.scheduler
 
 from sampo.api.genetic_api import ChromosomeType, FitnessFunction, Individual, ScheduleGenerationScheme
+from sampo.backend.fitness_cache import FitnessCache
 from sampo.schemas import WorkGraph, Contractor, LandscapeConfiguration, Schedule, GraphNode, Time, WorkTimeEstimator
 from sampo.schemas.schedule_spec import ScheduleSpec
 
@@ -13,7 +14,21 @@ R = TypeVar('R')
 
 
 class ComputationalBackend(ABC):
-    def __init__(self):
+    def __init__(self,
+                 fitness_cache_size: int = 10000,
+                 islands_count: int = 0,
+                 migration_interval: int = 5,
+                 migration_size: int = 2,
+                 steady_state: bool = False):
+        """
+        :param fitness_cache_size: the number of chromosomes which fitness values are cached
+        :param islands_count: if greater than 1, genetic algorithm runs in island mode,
+        population is split into this number of independently evolving sub-populations
+        :param migration_interval: the number of generations between migrations of island mode
+        :param migration_size: the number of best individuals, that migrate to the neighbour island
+        :param steady_state: if True, genetic algorithm runs in steady-state mode,
+        each evaluated offspring is immediately inserted into the population and new offspring is submitted
+        """
         # scheduler parameters
         self._wg = None
         self._contractors = None
@@ -37,6 +52,20 @@ class ComputationalBackend(ABC):
         self._only_lft_initialization = None
         self._is_multiobjective = None
 
+        # fitness values of already computed chromosomes, shared across generations
+        self._fitness_cache = FitnessCache(fitness_cache_size)
+
+        # island model parameters
+        self.islands_count = islands_count
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+
+        self.steady_state = steady_state
+
+    @property
+    def fitness_cache(self) -> FitnessCache:
+        return self._fitness_cache
+
     @abstractmethod
     def cache_scheduler_info(self,
                              wg: WorkGraph,
@@ -66,9 +95,53 @@ class ComputationalBackend(ABC):
     @abstractmethod
     def compute_chromosomes(self,
                             fitness: FitnessFunction,
-                            chromosomes: list[ChromosomeType]) -> list[float]:
+                            chromosomes: list[ChromosomeType],
+                            cutoff: int | None = None) -> list[float]:
+        """
+        Computes fitness values of chromosomes.
+        If makespan `cutoff` is passed, evaluation of chromosomes, which makespan exceeds it, can be aborted,
+        their fitness values are `MakespanBound`. It is valid only for fitness functions equal to the makespan.
+        """
         ...
 
     @abstractmethod
     def generate_first_population(self, size_population: int) -> list[Individual]:
         ...
+
+    @property
+    def concurrency(self) -> int:
+        """
+        The number of chromosomes, that can be evaluated simultaneously
+        """
+        return 1
+
+    @abstractmethod
+    def submit_chromosome(self,
+                          fitness: FitnessFunction,
+                          chromosome: ChromosomeType,
+                          callback: Callable[[tuple[int | float]], None],
+                          error_callback: Callable[[BaseException], None]):
+        """
+        Submits chromosome to evaluation. When evaluation is done, `callback` is called with fitness value,
+        it can happen in another thread.
+        """
+        ...
+
+    @abstractmethod
+    def evolve_islands(self,
+                       fitness: FitnessFunction,
+                       islands: list[list[Individual]],
+                       generations: int,
+                       optimize_resources: bool,
+                       seeds: list[int]) -> list[list[Individual]]:
+        """
+        Independently evolves each island with evaluated individuals for the given number of generations
+
+        :param fitness: fitness function
+        :param islands: populations of islands
+        :param generations: the number of generations
+        :param optimize_resources: if True resource borders are also evolved
+        :param seeds: seeds of islands' random generators
+        :return: evaluated populations of islands after evolution
+        """
+        ...
@@ -29,6 +29,7 @@ class DefaultComputationalBackend(ComputationalBackend):
         self._rand = rand
         self._work_estimator = work_estimator
         self._toolbox = None
+        self._fitness_cache.clear()
 
     def cache_genetic_info(self,
                            population_size: int,
@@ -56,6 +57,7 @@ class DefaultComputationalBackend(ComputationalBackend):
         self._only_lft_initialization = only_lft_initialization
         self._is_multiobjective = is_multiobjective
         self._toolbox = None
+        self._fitness_cache.clear()
 
     def _ensure_toolbox_created(self):
         if self._toolbox is None:
@@ -87,10 +89,40 @@ class DefaultComputationalBackend(ComputationalBackend):
 
     def compute_chromosomes(self,
                             fitness: FitnessFunction,
-                            chromosomes: list[ChromosomeType]) -> list[tuple[int | float]]:
+                            chromosomes: list[ChromosomeType],
+                            cutoff: int | None = None) -> list[tuple[int | float]]:
         self._ensure_toolbox_created()
-        return [fitness.evaluate(chromosome, self._toolbox.evaluate_chromosome) for chromosome in chromosomes]
+
+        def evaluate_all(to_compute: list[ChromosomeType]) -> list[tuple[int | float]]:
+            return [self._toolbox.evaluate_fitness(fitness, chromosome, cutoff=cutoff) for chromosome in to_compute]
+
+        return self._fitness_cache.compute(fitness, chromosomes, evaluate_all, cutoff)
 
     def generate_first_population(self, size_population: int) -> list[Individual]:
         self._ensure_toolbox_created()
         return self._toolbox.population(size_population)
+
+    def submit_chromosome(self,
+                          fitness: FitnessFunction,
+                          chromosome: ChromosomeType,
+                          callback: Callable[[tuple[int | float]], None],
+                          error_callback: Callable[[BaseException], None]):
+        # evaluate synchronously
+        try:
+            fitness_value = self.compute_chromosomes(fitness, [chromosome])[0]
+        except Exception as e:
+            error_callback(e)
+            return
+        callback(fitness_value)
+
+    def evolve_islands(self,
+                       fitness: FitnessFunction,
+                       islands: list[list[Individual]],
+                       generations: int,
+                       optimize_resources: bool,
+                       seeds: list[int]) -> list[list[Individual]]:
+        from sampo.scheduler.genetic.schedule_builder import evolve_population
+
+        self._ensure_toolbox_created()
+        return [evolve_population(self._toolbox, island, fitness, generations, optimize_resources, Random(seed))
+                for island, seed in zip(islands, seeds)]
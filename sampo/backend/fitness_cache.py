@@ -0,0 +1,138 @@
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from sampo.api.genetic_api import ChromosomeType, FitnessFunction, MakespanBound
+from sampo.schemas.schedule_spec import WorkSpec, ScheduleSpec
+
+_DEFAULT_WORK_SPEC = WorkSpec()
+
+
+def spec_key(spec: ScheduleSpec) -> bytes:
+    """
+    Computes the key of schedule spec, that is equal for specs giving the same schedules.
+    """
+    # only non-default work specs affect the schedule
+    # ScheduleSpec is backed by defaultdict, so default entries appear there after each `get_work_spec` call
+    return repr([(work_id, work_spec) for work_id, work_spec in spec._work2spec.items()
+                 if work_spec != _DEFAULT_WORK_SPEC]).encode()
+
+
+def chromosome_digest(chromosome: ChromosomeType) -> bytes:
+    """
+    Computes fast digest of chromosome by order, resources, borders and zones parts.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(chromosome[0].tobytes())
+    h.update(chromosome[1].tobytes())
+    h.update(chromosome[2].tobytes())
+    h.update(chromosome[4].tobytes())
+    h.update(spec_key(chromosome[3]))
+    return h.digest()
+
+
+class FitnessCache:
+    """
+    Bounded cache of chromosomes' fitness values with LRU eviction policy.
+    Cached values are bound to the fitness function they were computed by.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self._max_size = max_size
+        self._cache: OrderedDict[tuple[FitnessFunction, bytes], tuple[int | float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def compute(self,
+                fitness: FitnessFunction,
+                chromosomes: list[ChromosomeType],
+                evaluator: Callable[[list[ChromosomeType]], list[tuple[int | float]]],
+                cutoff: int | None = None) -> list[tuple[int | float]]:
+        """
+        Returns fitness values of given chromosomes.
+        Only chromosomes that are not in the cache are passed to the `evaluator`,
+        duplicated chromosomes are evaluated once.
+
+        :param fitness: fitness function
+        :param chromosomes: chromosomes to compute
+        :param evaluator: function that computes fitness values for the list of chromosomes
+        :param cutoff: makespan cutoff of the evaluation. Cached `MakespanBound` values are used
+        only if they exceed it, otherwise chromosomes are evaluated again
+        :return: fitness values in the order of given chromosomes
+        """
+        if self._max_size <= 0:
+            self._misses += len(chromosomes)
+            return evaluator(chromosomes)
+
+        keys = [(fitness, chromosome_digest(chromosome)) for chromosome in chromosomes]
+
+        to_compute: dict[Hashable, ChromosomeType] = {}
+        for key, chromosome in zip(keys, chromosomes):
+            if key in self._cache and self._is_valid(self._cache[key], cutoff):
+                self._cache.move_to_end(key)
+                self._hits += 1
+            elif key in to_compute:
+                self._hits += 1
+            else:
+                to_compute[key] = chromosome
+                self._misses += 1
+
+        computed = dict(zip(to_compute.keys(), evaluator(list(to_compute.values()))))
+
+        result = [computed[key] if key in computed else self._cache[key] for key in keys]
+
+        for key, value in computed.items():
+            self._cache[key] = value
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+        return result
+
+    def get(self, fitness: FitnessFunction, chromosome: ChromosomeType) -> tuple[int | float] | None:
+        """
+        Returns cached fitness value of the chromosome or None, if it should be evaluated.
+        It's the single chromosome version of `compute` for asynchronous evaluation, see `put`.
+        """
+        if self._max_size > 0:
+            key = (fitness, chromosome_digest(chromosome))
+            if key in self._cache and self._is_valid(self._cache[key], None):
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+        self._misses += 1
+        return None
+
+    def put(self, fitness: FitnessFunction, chromosome: ChromosomeType, value: tuple[int | float]):
+        """
+        Stores fitness value of the chromosome, evaluated after the `get` miss.
+        """
+        if self._max_size <= 0:
+            return
+        self._cache[(fitness, chromosome_digest(chromosome))] = value
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _is_valid(value: tuple[int | float], cutoff: int | None) -> bool:
+        return not isinstance(value, MakespanBound) or (cutoff is not None and value[0] > cutoff)
+
+    def clear(self):
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._cache)
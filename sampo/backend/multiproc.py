@@ -1,5 +1,10 @@
+import hashlib
 import math
-from typing import Callable
+import pickle
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, NamedTuple
 
 import sampo.scheduler
 
@@ -10,6 +15,9 @@ import pathos.multiprocessing
 from sampo.api.genetic_api import ChromosomeType, FitnessFunction, ScheduleGenerationScheme
 from sampo.backend import T, R
 from sampo.backend.default import DefaultComputationalBackend
+from sampo.backend.fitness_cache import spec_key
+from sampo.backend.shared_memory import ChromosomeArena, ArrayDescriptor, attach_chromosome_parts, SharedArray, \
+    read_shared_bytes
 from sampo.scheduler.genetic.operators import Individual
 from sampo.scheduler.genetic.utils import create_toolbox_using_cached_chromosomes, init_chromosomes_f
 from sampo.scheduler.heft import HEFTScheduler, HEFTBetweenScheduler
@@ -77,40 +85,211 @@ def scheduler_info_initializer(wg: WorkGraph,
                                                             is_multiobjective)
 
 
+class WorkerParams(NamedTuple):
+    """
+    Scheduling parameters part of worker state, fields are the arguments of `scheduler_info_initializer`
+    """
+    spec: ScheduleSpec
+    selection_size: int
+    mutate_order: float
+    mutate_resources: float
+    mutate_zones: float
+    deadline: Time | None
+    weights: list[int] | None
+    init_chromosomes: dict[str, tuple[ChromosomeType, float, ScheduleSpec]] | None
+    assigned_parent_time: Time
+    fitness_weights: tuple[int | float, ...]
+    rand: Random | None
+    work_estimator_recreate_params: tuple | None
+    sgs_type: ScheduleGenerationScheme
+    only_lft_initialization: bool
+    is_multiobjective: bool
+
+
+# worker state consists of two parts: problem (graph, contractors and landscape) and scheduling parameters,
+# each part is identified by the content hash and published by the parent process in the shared memory block
+WorkerStateDescriptor = tuple[tuple[str, ArrayDescriptor], tuple[str, ArrayDescriptor]]
+
+# the number of state parts and toolboxes, cached by each worker process
+WORKER_CACHE_SIZE = 4
+
+# state parts and toolboxes, cached in the current worker process by content hashes
+g_state_parts: OrderedDict[str, tuple | WorkerParams] = OrderedDict()
+g_toolboxes: OrderedDict[tuple[str, str], object] = OrderedDict()
+g_state_key: tuple[str, str] | None = None
+
+
+
+def _put_to_worker_cache(cache: OrderedDict, key, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > WORKER_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _apply_worker_state(problem_key: str, params_key: str):
+    global g_toolbox, g_state_key
+
+    key = (problem_key, params_key)
+    problem = g_state_parts[problem_key]
+    # the state of caller's generator changes after each use, so it isn't the part of parameters,
+    # and workers use the generator seeded by the parameters
+    params = g_state_parts[params_key]._replace(rand=Random(params_key))
+    toolbox = g_toolboxes.get(key)
+    if toolbox is not None:
+        # skip toolbox creation
+        params = params._replace(init_chromosomes=None)
+    scheduler_info_initializer(*problem, **params._asdict())
+    if toolbox is None:
+        toolbox = g_toolbox
+    g_toolbox = toolbox
+    _put_to_worker_cache(g_toolboxes, key, toolbox)
+    g_state_key = key
+
+
+def worker_state_initializer(problem_key: str, problem: tuple, params_key: str, params: WorkerParams):
+    """
+    Initializes the worker process with the state, that is known at the moment of the pool creation
+    """
+    _put_to_worker_cache(g_state_parts, problem_key, problem)
+    _put_to_worker_cache(g_state_parts, params_key, params)
+    _apply_worker_state(problem_key, params_key)
+
+
+def _sync_worker_state(state: WorkerStateDescriptor):
+    (problem_key, problem_block), (params_key, params_block) = state
+    if g_state_key == (problem_key, params_key):
+        return
+    for key, block in state:
+        if key in g_state_parts:
+            g_state_parts.move_to_end(key)
+        else:
+            _put_to_worker_cache(g_state_parts, key, pickle.loads(read_shared_bytes(block)))
+    _apply_worker_state(problem_key, params_key)
+
+
+def _run_in_worker_state(state: WorkerStateDescriptor, action: Callable[[T], R], value: T) -> R:
+    _sync_worker_state(state)
+    return action(value)
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 class MultiprocessingComputationalBackend(DefaultComputationalBackend):
 
-    def __init__(self, n_cpus: int):
+    def __init__(self,
+                 n_cpus: int,
+                 fitness_cache_size: int = 10000,
+                 islands_count: int = 0,
+                 migration_interval: int = 5,
+                 migration_size: int = 2,
+                 steady_state: bool = False,
+                 use_shared_memory: bool = True):
+        """
+        The pool of worker processes is created on the first use and reused by successive scheduling calls.
+        Workers cache the problem and scheduling parameters with built toolboxes by content hash,
+        so each call transfers only the changed part of the state.
+        Use `close` or the backend as a context manager to terminate worker processes.
+
+        :param n_cpus: the number of worker processes
+        :param use_shared_memory: if True, chromosomes are transferred to the workers through shared memory
+        """
         self._n_cpus = n_cpus
         self._init_chromosomes = None
         self._pool = None
-        super().__init__()
+        self._arena = ChromosomeArena() if use_shared_memory else None
+
+        # state of worker processes
+        self._worker_state: WorkerStateDescriptor | None = None
+        self._state_blocks: dict[str, SharedArray] = {}
+        # problem content hash is computed once for the given graph object
+        self._problem_objects: tuple | None = None
+        self._problem_key: str | None = None
+        self._problem_data: bytes | None = None
+        self._fitness_cache_lock = threading.Lock()
+        super().__init__(fitness_cache_size, islands_count, migration_interval, migration_size, steady_state)
+
+    def close(self):
+        """
+        Terminates worker processes and releases shared memory
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        for block in self._state_blocks.values():
+            block.close()
+        self._state_blocks.clear()
+        self._worker_state = None
+        if self._arena is not None:
+            self._arena.close()
+
+    def __enter__(self) -> 'MultiprocessingComputationalBackend':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def concurrency(self) -> int:
+        return self._n_cpus
 
     def map(self, action: Callable[[T], R], values: list[T]) -> list[R]:
-        return self._pool.map(action, values)
+        return self._pool.map(partial(_run_in_worker_state, self._worker_state, action), values)
+
+    def _problem_state(self) -> tuple[str, tuple, bytes]:
+        problem = (self._wg, self._contractors, self._landscape)
+        # the problem is serialized once per scheduling call, workers reload it only if its content is changed
+        if self._problem_objects is None or any(a is not b for a, b in zip(self._problem_objects, problem)):
+            self._problem_data = pickle.dumps(problem)
+            self._problem_key = _content_hash(self._problem_data)
+            self._problem_objects = problem
+        return self._problem_key, problem, self._problem_data
+
+    def _params_state(self) -> tuple[str, WorkerParams, bytes]:
+        params = WorkerParams(spec=self._spec,
+                              selection_size=self._selection_size,
+                              mutate_order=self._mutate_order,
+                              mutate_resources=self._mutate_resources,
+                              mutate_zones=self._mutate_zones,
+                              deadline=self._deadline,
+                              weights=self._weights,
+                              init_chromosomes=self._init_chromosomes,
+                              assigned_parent_time=self._assigned_parent_time,
+                              fitness_weights=self._fitness_weights,
+                              # random generator is created by workers, see `_apply_worker_state`
+                              rand=None,
+                              work_estimator_recreate_params=self._work_estimator.get_recreate_info(),
+                              sgs_type=self._sgs_type,
+                              only_lft_initialization=self._only_lft_initialization,
+                              is_multiobjective=self._is_multiobjective)
+        data = pickle.dumps(params)
+        return _content_hash(data), params, data
 
     def _ensure_pool_created(self):
-        if self._pool is not None:
+        if self._worker_state is not None:
             return
-        self._pool = pathos.multiprocessing.Pool(self._n_cpus,
-                                                 initializer=scheduler_info_initializer,
-                                                 initargs=(self._wg,
-                                                           self._contractors,
-                                                           self._landscape,
-                                                           self._spec,
-                                                           self._selection_size,
-                                                           self._mutate_order,
-                                                           self._mutate_resources,
-                                                           self._mutate_zones,
-                                                           self._deadline,
-                                                           self._weights,
-                                                           self._init_chromosomes,
-                                                           self._assigned_parent_time,
-                                                           self._fitness_weights,
-                                                           self._rand,
-                                                           self._work_estimator.get_recreate_info(),
-                                                           self._sgs_type,
-                                                           self._only_lft_initialization,
-                                                           self._is_multiobjective))
+
+        problem_key, problem, problem_data = self._problem_state()
+        params_key, params, params_data = self._params_state()
+
+        # publish the state parts, that are not published yet,
+        # workers read them only if they don't have the part with the same hash
+        blocks = {}
+        for key, data in ((problem_key, problem_data), (params_key, params_data)):
+            blocks[key] = self._state_blocks.pop(key, None) or SharedArray.from_bytes(data)
+        for block in self._state_blocks.values():
+            block.close()
+        self._state_blocks = blocks
+        self._worker_state = ((problem_key, blocks[problem_key].descriptor),
+                              (params_key, blocks[params_key].descriptor))
+
+        if self._pool is None:
+            # the initial state is inherited by worker processes without serialization
+            self._pool = pathos.multiprocessing.Pool(self._n_cpus,
+                                                     initializer=worker_state_initializer,
+                                                     initargs=(problem_key, problem, params_key, params))
 
     def cache_scheduler_info(self,
                              wg: WorkGraph,
@@ -120,7 +299,9 @@ class MultiprocessingComputationalBackend(DefaultComputationalBackend):
                              rand: Random | None = None,
                              work_estimator: WorkTimeEstimator = DefaultWorkEstimator()):
         super().cache_scheduler_info(wg, contractors, landscape, spec, rand, work_estimator)
-        self._pool = None
+        self._worker_state = None
+        # the same objects could be modified in place since the previous call
+        self._problem_objects = None
 
     def cache_genetic_info(self,
                            selection_size: int,
@@ -139,23 +320,119 @@ class MultiprocessingComputationalBackend(DefaultComputationalBackend):
                                    weights, init_schedules, assigned_parent_time, fitness_weights, sgs_type,
                                    only_lft_initialization, is_multiobjective)
         self._init_chromosomes = init_chromosomes_f(self._wg, self._contractors, init_schedules, self._landscape)
-        self._pool = None
+        self._worker_state = None
 
-    def compute_chromosomes(self, fitness: FitnessFunction, chromosomes: list[ChromosomeType]) -> list[float]:
+    def compute_chromosomes(self,
+                            fitness: FitnessFunction,
+                            chromosomes: list[ChromosomeType],
+                            cutoff: int | None = None) -> list[float]:
         self._ensure_pool_created()
 
         def mapper(chromosome):
-            return fitness.evaluate(chromosome, g_toolbox.evaluate_chromosome)
+            return g_toolbox.evaluate_fitness(fitness, chromosome, cutoff=cutoff)
+
+        def shared_mapper(args: tuple[list[ArrayDescriptor], range, list[ScheduleSpec], list[int]]) -> list[tuple]:
+            descriptors, indices, specs, spec_indices = args
+            orders, resources, borders, zones = attach_chromosome_parts(descriptors)
+            return [g_toolbox.evaluate_fitness(fitness, (orders[i], resources[i], borders[i], specs[spec_index],
+                                                         zones[i]), cutoff=cutoff)
+                    for i, spec_index in zip(indices, spec_indices)]
+
+        def evaluate_all(to_compute: list[ChromosomeType]) -> list[tuple]:
+            descriptors = self._arena.write(to_compute) if self._arena is not None and to_compute else None
+            if descriptors is None:
+                return self.map(mapper, to_compute)
+
+            # only chromosome indices and distinct specs are sent to the workers
+            chunks = []
+            chunk_size = math.ceil(len(to_compute) / (4 * self._n_cpus))
+            for start in range(0, len(to_compute), chunk_size):
+                indices = range(start, min(start + chunk_size, len(to_compute)))
+                spec2index = {}
+                specs, spec_indices = [], []
+                for i in indices:
+                    key = spec_key(to_compute[i][3])
+                    if key not in spec2index:
+                        spec2index[key] = len(specs)
+                        specs.append(to_compute[i][3])
+                    spec_indices.append(spec2index[key])
+                chunks.append((descriptors, indices, specs, spec_indices))
+
+            return [fitness_value for chunk in self.map(shared_mapper, chunks) for fitness_value in chunk]
+
+        return self._fitness_cache.compute(fitness, chromosomes, evaluate_all, cutoff)
+
+    def submit_chromosome(self,
+                          fitness: FitnessFunction,
+                          chromosome: ChromosomeType,
+                          callback: Callable[[tuple[int | float]], None],
+                          error_callback: Callable[[BaseException], None]):
+        self._ensure_pool_created()
 
-        return self.map(mapper, chromosomes)
+        # the cache is checked by the caller thread and filled by the result handler thread of the pool
+        with self._fitness_cache_lock:
+            fitness_value = self._fitness_cache.get(fitness, chromosome)
+        if fitness_value is not None:
+            callback(fitness_value)
+            return
+
+        def mapper(chromosome):
+            return g_toolbox.evaluate_fitness(fitness, chromosome)
+
+        def cache_callback(fitness_value: tuple[int | float]):
+            with self._fitness_cache_lock:
+                self._fitness_cache.put(fitness, chromosome, fitness_value)
+            callback(fitness_value)
+
+        self._pool.apply_async(_run_in_worker_state, (self._worker_state, mapper, chromosome),
+                               callback=cache_callback, error_callback=error_callback)
+
+    def evolve_islands(self,
+                       fitness: FitnessFunction,
+                       islands: list[list[Individual]],
+                       generations: int,
+                       optimize_resources: bool,
+                       seeds: list[int]) -> list[list[Individual]]:
+        self._ensure_toolbox_created()
+        self._ensure_pool_created()
+
+        # individuals are transferred as chromosomes with fitness values,
+        # because fitness classes are created locally in each process
+        def mapper(args: tuple[list[tuple[ChromosomeType, tuple]], int]) -> list[tuple[ChromosomeType, tuple]]:
+            from sampo.scheduler.genetic.schedule_builder import evolve_population
+
+            island, seed = args
+            population = []
+            for chromosome, fitness_values in island:
+                ind = g_toolbox.Individual(chromosome)
+                ind.fitness.values = fitness_values
+                population.append(ind)
+            population = evolve_population(g_toolbox, population, fitness, generations, optimize_resources,
+                                           Random(seed))
+            return [(tuple(ind), ind.fitness.values) for ind in population]
+
+        results = self.map(mapper, [([(tuple(ind), ind.fitness.values) for ind in island], seed)
+                                    for island, seed in zip(islands, seeds)])
+
+        evolved_islands = []
+        for island in results:
+            population = []
+            for chromosome, fitness_values in island:
+                ind = self._toolbox.Individual(chromosome)
+                ind.fitness.values = fitness_values
+                population.append(ind)
+            evolved_islands.append(population)
+        return evolved_islands
 
     def generate_first_population(self, size_population: int) -> list[Individual]:
         self._ensure_toolbox_created()
         self._ensure_pool_created()
 
-        def mapper(key: str):
+        def mapper(args: tuple[str, int]):
+            key, seed = args
+
             def randomized_init():
-                schedule, _, _, order = RandomizedTopologicalScheduler(g_work_estimator, int(g_rand.random() * 1000000)) \
+                schedule, _, _, order = RandomizedTopologicalScheduler(g_work_estimator, seed) \
                     .schedule_with_cache(g_wg, g_contractors, landscape=g_landscape)[0]
                 return schedule, order, g_spec
 
@@ -223,7 +500,10 @@ class MultiprocessingComputationalBackend(DefaultComputationalBackend):
         counts += [count_for_topological]
 
         chromosome_keys = ['heft_end', 'heft_between', '12.5%', '25%', '75%', '87.5%', 'randomized']
-        chromosome_types = self._rand.sample(chromosome_keys, k=size_population, counts=counts)
+        rand = self._rand or Random()
+        chromosome_types = rand.sample(chromosome_keys, k=size_population, counts=counts)
+        # randomized initialization is driven by the caller's generator
+        seeds = [int(rand.random() * 1000000) for _ in chromosome_types]
 
-        chromosomes = self.map(mapper, chromosome_types)
+        chromosomes = self.map(mapper, list(zip(chromosome_types, seeds)))
         return [self._toolbox.Individual(chromosome) for chromosome in chromosomes]
@@ -0,0 +1,114 @@
+from random import Random
+
+from sampo.api.genetic_api import FitnessFunction, ChromosomeType, ScheduleGenerationScheme
+from sampo.backend.default import DefaultComputationalBackend
+from sampo.schemas import WorkGraph, Contractor, LandscapeConfiguration, WorkTimeEstimator, Schedule, GraphNode, Time
+from sampo.schemas.graph import EdgeType
+from sampo.schemas.schedule_spec import ScheduleSpec, WorkSpec
+
+
+def is_native_applicable(wg: WorkGraph,
+                         landscape: LandscapeConfiguration,
+                         spec: ScheduleSpec,
+                         sgs_type: ScheduleGenerationScheme,
+                         assigned_parent_time: Time | None) -> bool:
+    """
+    Checks that the native evaluator gives the same makespans as `parallel_schedule_generation_scheme`:
+    works don't use zones and materials, there are no work specs, all the edges are dependencies
+    and the project starts at zero
+    """
+    return sgs_type is ScheduleGenerationScheme.Parallel \
+        and (assigned_parent_time is None or assigned_parent_time.value == 0) \
+        and not landscape.zone_config.start_statuses \
+        and all(work_spec == WorkSpec() for work_spec in spec._work2spec.values()) \
+        and all(not node.work_unit.material_reqs and not node.work_unit.zone_reqs
+                and all(EdgeType.is_dependency(edge.type) for edge in node.edges_to)
+                for node in wg.nodes)
+
+
+class NativeComputationalBackend(DefaultComputationalBackend):
+    """
+    Computes makespans of chromosomes by the native C++ evaluator, see `sampo/native`.
+    Other fitness functions, problems with features unsupported by the evaluator,
+    or the absence of the built `native` module fall back to the default Python evaluation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._native_wrapper = None
+
+    def cache_scheduler_info(self,
+                             wg: WorkGraph,
+                             contractors: list[Contractor],
+                             landscape: LandscapeConfiguration,
+                             spec: ScheduleSpec,
+                             rand: Random | None = None,
+                             work_estimator: WorkTimeEstimator | None = None):
+        super().cache_scheduler_info(wg, contractors, landscape, spec, rand, work_estimator)
+        self._close_native_wrapper()
+
+    def cache_genetic_info(self,
+                           population_size: int,
+                           mutate_order: float,
+                           mutate_resources: float,
+                           mutate_zones: float,
+                           deadline: Time | None,
+                           weights: list[int] | None,
+                           init_schedules: dict[str, tuple[Schedule, list[GraphNode] | None, ScheduleSpec, float]],
+                           assigned_parent_time: Time,
+                           fitness_weights: tuple[int | float, ...],
+                           sgs_type: ScheduleGenerationScheme,
+                           only_lft_initialization: bool,
+                           is_multiobjective: bool):
+        super().cache_genetic_info(population_size, mutate_order, mutate_resources, mutate_zones, deadline, weights,
+                                   init_schedules, assigned_parent_time, fitness_weights, sgs_type,
+                                   only_lft_initialization, is_multiobjective)
+        self._close_native_wrapper()
+
+    @property
+    def is_native(self) -> bool:
+        """
+        Whether chromosomes of the cached problem are evaluated natively
+        """
+        self._ensure_toolbox_created()
+        return self._native_wrapper is not None
+
+    def _ensure_toolbox_created(self):
+        if self._toolbox is None:
+            super()._ensure_toolbox_created()
+            self._native_wrapper = self._create_native_wrapper()
+
+    def _create_native_wrapper(self):
+        from sampo.scheduler.genetic.utils import prepare_optimized_data_structures
+        from sampo.scheduler.native_wrapper import NativeWrapper, native
+        from sampo.schemas.time_estimator import DefaultWorkEstimator
+
+        if not native or not is_native_applicable(self._wg, self._landscape, self._spec, self._sgs_type,
+                                                  self._assigned_parent_time):
+            return None
+
+        _, _, _, _, worker_name2index, _, worker_pool_indices, _, _, _, parents, _, _ = \
+            prepare_optimized_data_structures(self._wg, self._contractors, self._landscape)
+        return NativeWrapper(self._toolbox, self._wg, self._contractors, worker_name2index, worker_pool_indices,
+                             parents, self._work_estimator or DefaultWorkEstimator())
+
+    def _close_native_wrapper(self):
+        if self._native_wrapper is not None:
+            self._native_wrapper.close()
+            self._native_wrapper = None
+
+    def compute_chromosomes(self,
+                            fitness: FitnessFunction,
+                            chromosomes: list[ChromosomeType],
+                            cutoff: int | None = None) -> list[tuple[int | float]]:
+        from sampo.scheduler.genetic.operators import TimeFitness
+
+        self._ensure_toolbox_created()
+        if self._native_wrapper is None or type(fitness) is not TimeFitness:
+            return super().compute_chromosomes(fitness, chromosomes, cutoff)
+
+        def evaluate_all(to_compute: list[ChromosomeType]) -> list[tuple[int | float]]:
+            # the exact makespans are valid for any cutoff
+            return [(makespan,) for makespan in self._native_wrapper.evaluate(to_compute)]
+
+        return self._fitness_cache.compute(fitness, chromosomes, evaluate_all, cutoff)
@@ -0,0 +1,147 @@
+import sys
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from sampo.api.genetic_api import ChromosomeType
+
+# parts of chromosome that are stored in shared memory: order, resources, borders and zones
+# schedule spec is not an array, so it is transferred through pipes
+SHARED_PARTS = (0, 1, 2, 4)
+
+# (shared memory block name, shape, dtype)
+ArrayDescriptor = tuple[str, tuple[int, ...], str]
+
+
+class SharedArray:
+    """
+    NumPy array, allocated in the shared memory block
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype):
+        self._shm = SharedMemory(create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1))
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        # the block should be released even if the owner isn't collected before the interpreter exits
+        self._finalizer = weakref.finalize(self, SharedArray._release, self._shm)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'SharedArray':
+        shared = SharedArray((len(data),), np.uint8)
+        shared.array[:] = np.frombuffer(data, dtype=np.uint8)
+        return shared
+
+    @property
+    def descriptor(self) -> ArrayDescriptor:
+        return self._shm.name, self.array.shape, self.array.dtype.str
+
+    @staticmethod
+    def _release(shm: SharedMemory):
+        try:
+            shm.close()
+        except BufferError:
+            # views of the block are still alive, the mapping is closed by garbage collector
+            pass
+        shm.unlink()
+
+    def close(self):
+        del self.array
+        self._finalizer()
+
+
+class ChromosomeArena:
+    """
+    Shared memory storage of the population.
+    Each array part of chromosome is stored in the contiguous block, where i-th row is the part of i-th chromosome,
+    so the worker processes receive only block descriptors and chromosome indices.
+    Blocks are reallocated when the population doesn't fit them.
+    """
+
+    def __init__(self):
+        self._arrays: dict[int, SharedArray] = {}
+
+    def write(self, chromosomes: list[ChromosomeType]) -> list[ArrayDescriptor] | None:
+        """
+        Copies array parts of chromosomes to the shared memory
+
+        :return: descriptors of shared blocks by chromosome parts
+        or None if chromosomes have different shapes and can't be stacked
+        """
+        descriptors = []
+        for part in SHARED_PARTS:
+            first = chromosomes[0][part]
+            if any(chromosome[part].shape != first.shape or chromosome[part].dtype != first.dtype
+                   for chromosome in chromosomes):
+                return None
+
+            shared = self._arrays.get(part)
+            if shared is None or shared.array.shape[1:] != first.shape or shared.array.dtype != first.dtype \
+                    or len(shared.array) < len(chromosomes):
+                if shared is not None:
+                    shared.close()
+                # allocate with reserve to avoid reallocation on slightly bigger populations
+                shared = SharedArray((2 * len(chromosomes), *first.shape), first.dtype)
+                self._arrays[part] = shared
+
+            np.stack([chromosome[part] for chromosome in chromosomes], out=shared.array[:len(chromosomes)])
+            descriptors.append(shared.descriptor)
+        return descriptors
+
+    def close(self):
+        for shared in self._arrays.values():
+            shared.close()
+        self._arrays.clear()
+
+
+def _attach_untracked(name: str) -> SharedMemory:
+    # the block is owned by the creating process, but before Python 3.13 SharedMemory registers
+    # attached blocks in the resource tracker too, so they would be unlinked when the worker exits
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def read_shared_bytes(descriptor: ArrayDescriptor) -> bytes:
+    """
+    Copies the content of the shared memory block, created by `SharedArray.from_bytes` in another process.
+    """
+    name, shape, _ = descriptor
+    shm = _attach_untracked(name)
+    try:
+        return bytes(shm.buf[:shape[0]])
+    finally:
+        shm.close()
+
+
+# blocks attached in the current worker process by part index
+_attached: dict[int, tuple[SharedMemory, np.ndarray]] = {}
+
+
+def attach_chromosome_parts(descriptors: list[ArrayDescriptor]) -> list[np.ndarray]:
+    """
+    Returns arrays of chromosome parts from the shared memory blocks, created by `ChromosomeArena` in another process.
+    Blocks are attached once and kept attached until the arena reallocates them.
+    """
+    arrays = []
+    for part, (name, shape, dtype) in zip(SHARED_PARTS, descriptors):
+        attached = _attached.get(part)
+        if attached is None or attached[0].name != name:
+            if attached is not None:
+                old_shm = _attached.pop(part)[0]
+                del attached
+                try:
+                    old_shm.close()
+                except BufferError:
+                    # some arrays of the old block are still alive, it will be closed by garbage collector
+                    pass
+            shm = _attach_untracked(name)
+            attached = shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            _attached[part] = attached
+        arrays.append(attached[1])
+    return arrays
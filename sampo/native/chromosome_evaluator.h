@@ -18,6 +18,8 @@
 #include <unordered_map>
 #include <omp.h>
 #include <set>
+#include <queue>
+#include <algorithm>
 
 #include "pycodec.h"
 #include "evaluator_types.h"
@@ -33,6 +35,7 @@ typedef vector<vector<vector<pair<int, int>>>> Timeline;
 class ChromosomeEvaluator {
 private:
     const vector<vector<int>>& parents;      // vertices' parents
+    const vector<vector<int>>& parentLags;   // lags of edges from vertices' parents
     const vector<vector<int>>& headParents;  // vertices' parents without inseparables
     const vector<vector<int>>& inseparables; // inseparable chains with self
     const vector<vector<int>>& workers;      // contractor -> worker -> count
@@ -57,11 +60,12 @@ private:
             auto res = PyObject_CallMethod(pythonWrapper, "calculate_working_time_ind", "(iii)",
                                            chromosome_ind, team_target, work);
             if (res == nullptr) {
-                cerr << "Result is NULL" << endl << flush;
-                return 0;
+                // the Python error stays set and is raised by the caller
+                return TIME_INF;
             }
+            int time = (int) PyLong_AsLong(res);
             Py_DECREF(res);
-            return (int) PyLong_AsLong(res);
+            return time;
         } else {
             // map resources from indices to names
             vector<pair<string, int>> resourcesWithNames;
@@ -91,14 +95,8 @@ private:
         }
     }
 
-    int findMinStartTime(int nodeIndex, int contractor, const int* resources, size_t teamSize,
-                         vector<int>& completed, Timeline& timeline) {
-        int maxParentTime = 0;
-        // find min start time
-        for (int parent : parents[nodeIndex]) {
-            maxParentTime = max(maxParentTime, completed[parent]);
-        }
-
+    // the time, when all the workers of the team are off from previous tasks
+    static int findMinAgentsTime(int contractor, const int* resources, size_t teamSize, Timeline& timeline) {
         int maxAgentTime = 0;
 
         for (int worker = 0; worker < teamSize; worker++) {
@@ -110,7 +108,6 @@ private:
             auto &worker_timeline = timeline[contractor][worker];
             size_t ind = worker_timeline.size() - 1;
             while (need_count > 0) {
-//                cout << "ind: " << ind << endl;
                 int offer_count = worker_timeline[ind].second;
                 maxAgentTime = max(maxAgentTime, worker_timeline[ind].first);
 
@@ -119,14 +116,13 @@ private:
                 }
                 need_count -= offer_count;
                 if (ind == 0 && need_count > 0) {
-//                    cerr << "Not enough workers" << endl;
                     return TIME_INF;
                 }
                 ind--;
             }
         }
 
-        return max(maxParentTime, maxAgentTime);
+        return maxAgentTime;
     }
 
     static void updateTimeline(int finishTime, int contractor, const int* resources, size_t teamSize, Timeline& timeline) {
@@ -163,20 +159,26 @@ private:
         }
     }
 
-    int schedule(int chromosome_ind, int nodeIndex, int startTime, int contractor, const int* resources,
+    // saturating addition like Python Time does
+    static inline int addTime(int time, int other) {
+        return (int) min((long long) time + other, (long long) TIME_INF);
+    }
+
+    // places the inseparable chain of `nodeIndex` work starting from `startTime`,
+    // the execution time of the whole chain is divided between its works
+    int schedule(int nodeIndex, int startTime, int execTime, int contractor, const int* resources,
                  size_t teamSize, vector<int>& completed, Timeline& timeline) {
         int finishTime = startTime;
+        int workingTime = execTime / (int) inseparables[nodeIndex].size();
 
         for (int dep_node : inseparables[nodeIndex]) {
             int maxParentTime = 0;
             // find min start time
-            for (int parent : parents[dep_node]) {
-                maxParentTime = max(maxParentTime, completed[parent]);
+            for (size_t i = 0; i < parents[dep_node].size(); i++) {
+                maxParentTime = max(maxParentTime, addTime(completed[parents[dep_node][i]], parentLags[dep_node][i]));
             }
-            startTime = max(startTime, maxParentTime);
-
-            int workingTime = calculate_working_time(chromosome_ind, dep_node, nodeIndex, resources, teamSize);
-            finishTime = startTime + workingTime;
+            startTime = max(finishTime, maxParentTime);
+            finishTime = addTime(startTime, workingTime);
 
             // cache finish time of scheduled work
             completed[dep_node] = finishTime;
@@ -187,14 +189,15 @@ private:
         return finishTime;
     }
 
-    inline Timeline createTimeline() {
+    // contractors' workers are limited by the borders from chromosome
+    static inline Timeline createTimeline(Chromosome* chromosome) {
         Timeline timeline;
 
-        timeline.resize(workers.size());
-        for (int contractor = 0; contractor < workers.size(); contractor++) {
-            timeline[contractor].resize(workers[0].size());
-            for (int worker = 0; worker < workers[0].size(); worker++) {
-                timeline[contractor][worker].emplace_back(0, workers[contractor][worker]);
+        timeline.resize(chromosome->numContractors());
+        for (int contractor = 0; contractor < chromosome->numContractors(); contractor++) {
+            timeline[contractor].resize(chromosome->numResources());
+            for (int worker = 0; worker < chromosome->numResources(); worker++) {
+                timeline[contractor][worker].emplace_back(0, chromosome->getContractorBorder(contractor)[worker]);
             }
         }
 
@@ -205,7 +208,7 @@ public:
     int numThreads;
 
     explicit ChromosomeEvaluator(EvaluateInfo* info)
-        : parents(info->parents), headParents(info->headParents), inseparables(info->inseparables), workers(info->workers),
+        : parents(info->parents), parentLags(info->parentLags), headParents(info->headParents), inseparables(info->inseparables), workers(info->workers),
           minReqs(info->minReq), maxReqs(info->maxReq), volumes(info->volume), id2work(info->id2work), id2res(info->id2res) {
         this->totalWorksCount = info->totalWorksCount;
         this->pythonWrapper = info->pythonWrapper;
@@ -225,7 +228,6 @@ public:
 
         this->usePythonWorkEstimator = info->usePythonWorkEstimator;
         this->numThreads = this->usePythonWorkEstimator ? 1 : omp_get_num_procs();
-        printf("Genetic running threads: %i\n", this->numThreads);
 
         if (info->useExternalWorkEstimator) {
             loader.DLOpenLib();
@@ -245,27 +247,14 @@ public:
 //    }
     ~ChromosomeEvaluator() = default;
 
+    // the same as `is_chromosome_contractors_correct` from Python:
+    // assigned contractors can supply assigned workers
     bool isValid(Chromosome* chromosome) {
-        bool* visited = new bool[chromosome->numWorks()] { false };
-
-        // check edges
-        for (int i = 0; i < chromosome->numWorks(); i++) {
-            int node = *chromosome->getOrder()[i];
-            visited[node] = true;
-            for (int parent : headParents[node]) {
-                if (!visited[parent]) {
-                    return false;
-                }
-            }
-        }
-
-        delete[] visited;
-        // check resources
         for (int node = 0; node < chromosome->numWorks(); node++) {
             int contractor = chromosome->getContractor(node);
             for (int res = 0; res < chromosome->numResources(); res++) {
-                int count = chromosome->getResources()[node][res];
-                if (count < minReqs[node][res] || count > chromosome->getContractors()[contractor][res]) {
+                int border = chromosome->getContractors()[contractor][res];
+                if (chromosome->getResources()[node][res] > border || border > workers[contractor][res]) {
                     return false;
                 }
             }
@@ -285,38 +274,125 @@ public:
         }
     }
 
+    // Parallel Schedule Generation Scheme, the same as `parallel_schedule_generation_scheme` from Python.
+    // Checkpoints are the starts and the ends of placed works, at each checkpoint works,
+    // whose parents are all placed, are tried in the order of chromosome.
+    // When checkpoints are over, time jumps to the nearest moment, when some of them can start.
     int evaluate(int chromosome_ind, Chromosome* chromosome) {
-        Timeline timeline = createTimeline();
+        int worksCount = chromosome->numWorks();
+        size_t teamSize = chromosome->numResources();
+        Timeline timeline = createTimeline(chromosome);
 
-        auto completed = vector<int>();
-        completed.resize(totalWorksCount);
+        vector<int> completed(totalWorksCount, 0);
 
-//        cout << "Evaluated" << endl;
-
-        int finishTime = 0;
+        vector<int> position(worksCount);
+        for (int i = 0; i < worksCount; i++) {
+            position[*chromosome->getOrder()[i]] = i;
+        }
 
-//        for (int w = 0; w < chromosome->numWorks(); w++) {
-//            cout << *chromosome->getOrder()[w] << " ";
-//        }
-//        cout << endl;
+        // works are eligible when the works of their parents are placed
+        vector<int> waiting(worksCount, 0);
+        vector<vector<int>> dependents(worksCount);
+        for (int i = 0; i < worksCount; i++) {
+            int workIndex = *chromosome->getOrder()[i];
+            for (int parent : headParents[workIndex]) {
+                if (parent != workIndex) {
+                    waiting[i]++;
+                    dependents[position[parent]].push_back(i);
+                }
+            }
+        }
+        set<int> eligible;
+        for (int i = 0; i < worksCount; i++) {
+            if (waiting[i] == 0) {
+                eligible.insert(i);
+            }
+        }
+        // eligible works, that can't start until the given time
+        priority_queue<pair<int, int>, vector<pair<int, int>>, greater<pair<int, int>>> postponed;
+        // parents of eligible works are already placed, so their finish is known
+        vector<int> parentsFinish(worksCount, -1);
 
-        // scheduling works one-by-one
-        for (int i = 0; i < chromosome->numWorks(); i++) {
+        auto earliestStart = [&](int i) {
             int workIndex = *chromosome->getOrder()[i];
-            int* team = chromosome->getResources()[workIndex];
-            int contractor = chromosome->getContractor(workIndex);
+            int agentsTime = findMinAgentsTime(chromosome->getContractor(workIndex),
+                                               chromosome->getResources()[workIndex], teamSize, timeline);
+            if (parentsFinish[i] < 0) {
+                parentsFinish[i] = 0;
+                for (int dep_node : inseparables[workIndex]) {
+                    for (int parent : parents[dep_node]) {
+                        // the previous work of the chain isn't the parent of the whole chain
+                        if (find(inseparables[workIndex].begin(), inseparables[workIndex].end(), parent)
+                                == inseparables[workIndex].end()) {
+                            parentsFinish[i] = max(parentsFinish[i], completed[parent]);
+                        }
+                    }
+                }
+            }
+            return max(agentsTime, parentsFinish[i]);
+        };
+
+        set<int> checkpoints { 0 };
+        int remaining = worksCount;
+        int startTime = -1;
+
+        while (remaining > 0) {
+            auto checkpoint = checkpoints.upper_bound(startTime);
+            if (checkpoint != checkpoints.end()) {
+                startTime = *checkpoint;
+                if (startTime >= TIME_INF) {
+                    // schedule already contains infinite time, that is incorrect schedule
+                    break;
+                }
+            } else {
+                int nextTime = postponed.empty() ? TIME_INF : postponed.top().first;
+                for (int i : eligible) {
+                    nextTime = min(nextTime, earliestStart(i));
+                }
+                if (nextTime >= TIME_INF) {
+                    // remaining works can't be placed
+                    break;
+                }
+                startTime = max(startTime + 1, nextTime);
+            }
 
-            int st = findMinStartTime(workIndex, contractor, team,
-                                      chromosome->numResources(), completed, timeline);
-            if (st == TIME_INF) {
-                return TIME_INF;
+            while (!postponed.empty() && postponed.top().first <= startTime) {
+                eligible.insert(postponed.top().second);
+                postponed.pop();
+            }
+            // works, that become eligible during the scan, are tried too, if they are after the current one
+            auto it = eligible.begin();
+            while (it != eligible.end()) {
+                int i = *it;
+                int time = earliestStart(i);
+                if (time > startTime) {
+                    postponed.emplace(time, i);
+                } else {
+                    int workIndex = *chromosome->getOrder()[i];
+                    int* team = chromosome->getResources()[workIndex];
+                    int execTime = calculate_working_time(chromosome_ind, workIndex, workIndex, team, teamSize);
+                    // the work `start of the project` always starts at zero
+                    int st = i == 0 ? 0 : startTime;
+                    schedule(workIndex, st, execTime, chromosome->getContractor(workIndex), team, teamSize,
+                             completed, timeline);
+                    checkpoints.insert(st);
+                    checkpoints.insert(addTime(st, execTime));
+                    remaining--;
+                    for (int dependent : dependents[i]) {
+                        if (--waiting[dependent] == 0) {
+                            eligible.insert(dependent);
+                        }
+                    }
+                }
+                eligible.erase(i);
+                it = eligible.upper_bound(i);
             }
-            int c_ft = schedule(chromosome_ind, workIndex, st, contractor, team,
-                                chromosome->numResources(), completed, timeline);
-            finishTime = max(finishTime, c_ft);
         }
 
-        return finishTime;
+        if (remaining > 0) {
+            return TIME_INF;
+        }
+        return *max_element(completed.begin(), completed.end());
     }
 };
 
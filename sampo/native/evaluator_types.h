@@ -158,6 +158,7 @@ public:
 typedef struct {
     PyObject* pythonWrapper;
     vector<vector<int>> parents;
+    vector<vector<int>> parentLags;
     vector<vector<int>> headParents;
     vector<vector<int>> inseparables;
     vector<vector<int>> workers;
@@ -38,7 +38,7 @@ static PyObject* evaluate(PyObject *self, PyObject *args) {
     EvaluateInfo* infoPtr;
     PyObject* pyChromosomes;
     if (!PyArg_ParseTuple(args, "LO", &infoPtr, &pyChromosomes)) {
-        cout << "Can't parse arguments" << endl;
+        return nullptr;
     }
     auto chromosomes = PythonDeserializer::decodeChromosomes(pyChromosomes);
 
@@ -46,11 +46,17 @@ static PyObject* evaluate(PyObject *self, PyObject *args) {
 
     evaluator.evaluate(chromosomes);
 
-    PyObject* pyList = PyList_New(chromosomes.size());
-    Py_INCREF(pyList);
-    for (int i = 0; i < chromosomes.size(); i++) {
-        PyObject* pyInt = Py_BuildValue("i", chromosomes[i]->fitness);
-        PyList_SetItem(pyList, i, pyInt);
+    PyObject* pyList = nullptr;
+    // the error can be raised by the Python work estimator
+    if (!PyErr_Occurred()) {
+        pyList = PyList_New(chromosomes.size());
+        for (int i = 0; i < chromosomes.size(); i++) {
+            PyObject* pyInt = Py_BuildValue("i", chromosomes[i]->fitness);
+            PyList_SetItem(pyList, i, pyInt);
+        }
+    }
+    for (auto chromosome : chromosomes) {
+        delete chromosome;
     }
     return pyList;
 }
@@ -90,28 +96,33 @@ static PyObject* runGenetic(PyObject* self, PyObject* args) {
 static PyObject* decodeEvaluationInfo(PyObject *self, PyObject *args) {
     PyObject* pythonWrapper;
     PyObject* pyParents;
+    PyObject* pyParentLags;
     PyObject* pyHeadParents;
     PyObject* pyInseparables;
     PyObject* pyWorkers;
     int totalWorksCount;
-    bool usePythonWorkEstimator;
-    bool useExternalWorkEstimator;
+    // 'p' format unit stores int, not bool
+    int usePythonWorkEstimator;
+    int useExternalWorkEstimator;
     PyObject* volume;
     PyObject* minReq;
     PyObject* maxReq;
     PyObject* id2work;
     PyObject* id2res;
 
-    if (!PyArg_ParseTuple(args, "OOOOOippOOOOO",
-                          &pythonWrapper, &pyParents, &pyHeadParents, &pyInseparables,
+    if (!PyArg_ParseTuple(args, "OOOOOOippOOOOO",
+                          &pythonWrapper, &pyParents, &pyParentLags, &pyHeadParents, &pyInseparables,
                           &pyWorkers, &totalWorksCount, &usePythonWorkEstimator, &useExternalWorkEstimator,
                           &volume, &minReq, &maxReq, &id2work, &id2res)) {
-        cout << "Can't parse arguments" << endl;
+        return nullptr;
     }
+    // the wrapper is called back to estimate working times, so it should live until the info is freed
+    Py_INCREF(pythonWrapper);
 
     auto* info = new EvaluateInfo {
         pythonWrapper,
         PyCodec::fromList(pyParents, decodeIntList),
+        PyCodec::fromList(pyParentLags, decodeIntList),
         PyCodec::fromList(pyHeadParents, decodeIntList),
         PyCodec::fromList(pyInseparables, decodeIntList),
         PyCodec::fromList(pyWorkers, decodeIntList),
@@ -122,20 +133,19 @@ static PyObject* decodeEvaluationInfo(PyObject *self, PyObject *args) {
         PyCodec::fromList(id2res, decodeString),
         "aaaa", // TODO Propagate workEstimatorPath from Python
         totalWorksCount,
-        usePythonWorkEstimator,
-        useExternalWorkEstimator
+        (bool) usePythonWorkEstimator,
+        (bool) useExternalWorkEstimator
     };
 
-    auto* res = PyLong_FromVoidPtr(info);
-    Py_INCREF(res);
-    return res;
+    return PyLong_FromVoidPtr(info);
 }
 
 static PyObject* freeEvaluationInfo(PyObject *self, PyObject *args) {
     EvaluateInfo* infoPtr;
     if (!PyArg_ParseTuple(args, "L", &infoPtr)) {
-        cout << "Can't parse arguments" << endl;
+        return nullptr;
     }
+    Py_XDECREF(infoPtr->pythonWrapper);
     delete infoPtr;
     Py_RETURN_NONE;
 }
@@ -200,6 +210,7 @@ int main() {
     auto* info = new EvaluateInfo {
             nullptr,
             parents,
+            vector<vector<int>>(parents.size(), vector<int>()),
             vector<vector<int>>(),
             inseparables,
             workers,
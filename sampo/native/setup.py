@@ -1,14 +1,24 @@
 import os
 import pathlib
+import sys
 from distutils.core import setup, Extension
 from distutils.errors import DistutilsPlatformError, CCompilerError, DistutilsExecError
 
 import numpy
 from setuptools.command.build_ext import build_ext as build_ext_orig
 
+if sys.platform == 'win32':
+    platform_include_dir = "timeEstimatorLibrary/Windows"
+    openmp_args = ['/openmp']
+    platform_libraries = []
+else:
+    platform_include_dir = "timeEstimatorLibrary/Unix"
+    openmp_args = ['-fopenmp']
+    platform_libraries = ['dl']
+
 ext_modules = [
     Extension("native",
-              include_dirs=[numpy.get_include(), "timeEstimatorLibrary", "timeEstimatorLibrary/Windows"],
+              include_dirs=[numpy.get_include(), "timeEstimatorLibrary", platform_include_dir],
               sources=[
                        # "basic_types.h",
                        # "contractor.h",
@@ -23,8 +33,9 @@ ext_modules = [
                        # "timeEstimatorLibrary/Windows/DLLoader.h",
                        # "workgraph.h"
               ],
-              extra_compile_args=['-fopenmp', '/openmp'],
-              extra_link_args=['-lgomp']),
+              extra_compile_args=openmp_args,
+              extra_link_args=openmp_args,
+              libraries=platform_libraries),
 ]
 
 
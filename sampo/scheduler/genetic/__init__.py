@@ -3,3 +3,4 @@ from sampo.scheduler.genetic.converter import ScheduleGenerationScheme
 from sampo.scheduler.genetic.operators import (TimeFitness, SumOfResourcesPeaksFitness, SumOfResourcesFitness,
                                                TimeWithResourcesFitness, DeadlineResourcesFitness, DeadlineCostFitness,
                                                TimeAndResourcesFitness)
+from sampo.scheduler.genetic.telemetry import GenerationRecord, GenerationRecordWriter
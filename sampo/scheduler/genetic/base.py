@@ -6,6 +6,7 @@ from sampo.scheduler.base import Scheduler, SchedulerType
 from sampo.scheduler.genetic.operators import FitnessFunction, TimeFitness
 from sampo.scheduler.genetic.schedule_builder import build_schedules
 from sampo.scheduler.genetic.converter import ScheduleGenerationScheme
+from sampo.scheduler.genetic.telemetry import GenerationCallback
 from sampo.scheduler.heft.base import HEFTScheduler, HEFTBetweenScheduler
 from sampo.scheduler.lft.base import LFTScheduler
 from sampo.scheduler.resource.average_req import AverageReqResourceOptimizer
@@ -47,7 +48,11 @@ class GeneticScheduler(Scheduler):
                  sgs_type: ScheduleGenerationScheme = ScheduleGenerationScheme.Parallel,
                  optimize_resources: bool = False,
                  is_multiobjective: bool = False,
-                 only_lft_initialization: bool = False):
+                 only_lft_initialization: bool = False,
+                 checkpoint_path: str | None = None,
+                 checkpoint_interval: int = 1,
+                 resume_from: str | None = None,
+                 telemetry: GenerationCallback | None = None):
         super().__init__(scheduler_type=scheduler_type,
                          resource_optimizer=resource_optimizer,
                          work_estimator=work_estimator)
@@ -66,6 +71,10 @@ class GeneticScheduler(Scheduler):
         self._is_multiobjective = is_multiobjective
         self._weights = weights
         self._only_lft_initialization = only_lft_initialization
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+        self._resume_from = resume_from
+        self._telemetry = telemetry
 
         self._time_border = None
         self._max_plateau_steps = None
@@ -134,6 +143,33 @@ class GeneticScheduler(Scheduler):
     def set_only_lft_initialization(self, only_lft_initialization: bool):
         self._only_lft_initialization = only_lft_initialization
 
+    def set_checkpoint(self, checkpoint_path: str | None, checkpoint_interval: int = 1):
+        """
+        Set the file to save the state of genetic algorithm
+
+        :param checkpoint_path: path of the checkpoint file, None disables checkpoints
+        :param checkpoint_interval: the number of generations between checkpoints
+        """
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+
+    def set_resume_from(self, resume_from: str | None):
+        """
+        Set the checkpoint to start from. Unfinished run of the same problem is continued exactly,
+        otherwise the population of the checkpoint is used to warm start the new run.
+
+        :param resume_from: path of the checkpoint file
+        """
+        self._resume_from = resume_from
+
+    def set_telemetry(self, telemetry: GenerationCallback | None):
+        """
+        Set the callback, that receives statistics of each generation, e.g. `GenerationRecordWriter`
+
+        :param telemetry: generation callback, None disables telemetry
+        """
+        self._telemetry = telemetry
+
     @staticmethod
     def generate_first_population(wg: WorkGraph,
                                   contractors: list[Contractor],
@@ -252,7 +288,11 @@ class GeneticScheduler(Scheduler):
                                     self._optimize_resources,
                                     deadline,
                                     self._only_lft_initialization,
-                                    self._is_multiobjective)
+                                    self._is_multiobjective,
+                                    self._checkpoint_path,
+                                    self._checkpoint_interval,
+                                    self._resume_from,
+                                    self._telemetry)
         schedules = [
             (Schedule.from_scheduled_works(scheduled_works.values(), wg), schedule_start_time, timeline, order_nodes)
             for scheduled_works, schedule_start_time, timeline, order_nodes in schedules]
@@ -0,0 +1,245 @@
+import heapq
+import json
+import os
+import pickle
+from dataclasses import dataclass
+
+import numpy as np
+
+from sampo.api.genetic_api import ChromosomeType
+from sampo.backend.fitness_cache import spec_key
+from sampo.scheduler.utils import get_worker_contractor_pool
+from sampo.schemas.contractor import Contractor
+from sampo.schemas.graph import WorkGraph
+
+
+def problem_ids(wg: WorkGraph, contractors: list[Contractor]) -> tuple[list[str], list[str], list[str]]:
+    """
+    Returns ids of works, names of worker types and ids of contractors
+    in the order of chromosome indices, see `prepare_optimized_data_structures`
+    """
+    work_ids = [node.id for node in wg.nodes if not node.is_inseparable_son()]
+    worker_names = list(get_worker_contractor_pool(contractors).keys())
+    contractor_ids = [contractor.id for contractor in contractors]
+    return work_ids, worker_names, contractor_ids
+
+
+def _stack_chromosomes(prefix: str, chromosomes: list[ChromosomeType], fitness: list[tuple]) -> dict[str, np.ndarray]:
+    # schedule specs are not arrays, so distinct ones are pickled
+    spec2index = {}
+    specs, spec_indices = [], []
+    for chromosome in chromosomes:
+        key = spec_key(chromosome[3])
+        if key not in spec2index:
+            spec2index[key] = len(specs)
+            specs.append(chromosome[3])
+        spec_indices.append(spec2index[key])
+
+    return {
+        f'{prefix}_orders': np.stack([chromosome[0] for chromosome in chromosomes]),
+        f'{prefix}_resources': np.stack([chromosome[1] for chromosome in chromosomes]),
+        f'{prefix}_borders': np.stack([chromosome[2] for chromosome in chromosomes]),
+        f'{prefix}_zones': np.stack([chromosome[4] for chromosome in chromosomes]),
+        f'{prefix}_specs': np.frombuffer(pickle.dumps(specs), dtype=np.uint8),
+        f'{prefix}_spec_indices': np.array(spec_indices, dtype=np.int64),
+        f'{prefix}_fitness': np.array(fitness, dtype=np.float64),
+    }
+
+
+def _unstack_chromosomes(prefix: str, arrays) -> tuple[list[ChromosomeType], list[tuple]]:
+    specs = pickle.loads(arrays[f'{prefix}_specs'].tobytes())
+    chromosomes = [(order, resources, borders, specs[spec_index], zones)
+                   for order, resources, borders, zones, spec_index in zip(arrays[f'{prefix}_orders'],
+                                                                           arrays[f'{prefix}_resources'],
+                                                                           arrays[f'{prefix}_borders'],
+                                                                           arrays[f'{prefix}_zones'],
+                                                                           arrays[f'{prefix}_spec_indices'])]
+    fitness = [tuple(values) for values in arrays[f'{prefix}_fitness'].tolist()]
+    return chromosomes, fitness
+
+
+@dataclass
+class GeneticCheckpoint:
+    """
+    State of the genetic algorithm between generations.
+    It is stored in the compressed NumPy archive, chromosomes are stacked into arrays.
+
+    :param population: chromosomes of the population
+    :param fitness: fitness values of the population
+    :param hall_of_fame: chromosomes of the best individuals
+    :param hall_of_fame_fitness: fitness values of the best individuals
+    :param generation: the number of the next generation
+    :param plateau_steps: the number of generations without improvement
+    :param rand_state: state of the `random.Random` of the algorithm
+    :param np_rand_state: state of the bit generator of population operators
+    :param work_ids: ids of works in the order of chromosome indices
+    :param worker_names: names of worker types in the order of chromosome indices
+    :param contractor_ids: ids of contractors in the order of chromosome indices
+    :param completed: True if the run is finished, such checkpoint can only be used for warm start
+    """
+    population: list[ChromosomeType]
+    fitness: list[tuple]
+    hall_of_fame: list[ChromosomeType]
+    hall_of_fame_fitness: list[tuple]
+    generation: int
+    plateau_steps: int
+    rand_state: tuple
+    np_rand_state: dict
+    work_ids: list[str]
+    worker_names: list[str]
+    contractor_ids: list[str]
+    completed: bool = False
+
+    def save(self, path: str):
+        """
+        Writes the checkpoint to the given path. The file is replaced atomically,
+        so the previous checkpoint survives the crash during the writing.
+        """
+        version, rand_internal_state, gauss_next = self.rand_state
+        arrays = {
+            **_stack_chromosomes('population', self.population, self.fitness),
+            **_stack_chromosomes('hall_of_fame', self.hall_of_fame, self.hall_of_fame_fitness),
+            'generation': np.array(self.generation),
+            'plateau_steps': np.array(self.plateau_steps),
+            'rand_version': np.array(version),
+            'rand_state': np.array(rand_internal_state, dtype=np.uint64),
+            'rand_gauss_next': np.array(np.nan if gauss_next is None else gauss_next),
+            # 128-bit integers of the bit generator state don't fit NumPy types
+            'np_rand_state': np.array(json.dumps(self.np_rand_state)),
+            'work_ids': np.array(self.work_ids),
+            'worker_names': np.array(self.worker_names),
+            'contractor_ids': np.array(self.contractor_ids),
+            'completed': np.array(self.completed),
+        }
+
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str) -> 'GeneticCheckpoint':
+        with np.load(path) as arrays:
+            population, fitness = _unstack_chromosomes('population', arrays)
+            hall_of_fame, hall_of_fame_fitness = _unstack_chromosomes('hall_of_fame', arrays)
+            gauss_next = float(arrays['rand_gauss_next'])
+            return GeneticCheckpoint(population=population,
+                                     fitness=fitness,
+                                     hall_of_fame=hall_of_fame,
+                                     hall_of_fame_fitness=hall_of_fame_fitness,
+                                     generation=int(arrays['generation']),
+                                     plateau_steps=int(arrays['plateau_steps']),
+                                     rand_state=(int(arrays['rand_version']),
+                                                 tuple(arrays['rand_state'].tolist()),
+                                                 None if np.isnan(gauss_next) else gauss_next),
+                                     np_rand_state=json.loads(str(arrays['np_rand_state'])),
+                                     work_ids=arrays['work_ids'].tolist(),
+                                     worker_names=arrays['worker_names'].tolist(),
+                                     contractor_ids=arrays['contractor_ids'].tolist(),
+                                     completed=bool(arrays['completed']))
+
+    def is_resumable(self, wg: WorkGraph, contractors: list[Contractor]) -> bool:
+        """
+        Checks that the run can be continued exactly: it isn't finished and the problem is the same
+        """
+        return not self.completed \
+            and (self.work_ids, self.worker_names, self.contractor_ids) == problem_ids(wg, contractors)
+
+    def adapt_population(self,
+                         wg: WorkGraph,
+                         contractors: list[Contractor],
+                         templates: list[ChromosomeType],
+                         parents: dict[int, set[int]],
+                         resources_border: np.ndarray,
+                         contractor_borders: np.ndarray) -> list[ChromosomeType]:
+        """
+        Maps the population of the checkpoint to the chromosomes of the given, possibly edited, problem.
+        Works, worker types and contractors are matched by ids.
+        Genes, that are absent in the checkpoint, are taken from template chromosomes of the new problem.
+        Orders are repaired to be topologically correct and resources are clipped to the new borders.
+
+        :param wg: graph of the new problem
+        :param contractors: contractors of the new problem
+        :param templates: chromosomes of the new problem, i-th chromosome of population is adapted using
+        the (i % len(templates))-th template
+        :param parents: parents of works by work indices of the new problem
+        :param resources_border: min and max borders of resources of works of the new problem
+        :param contractor_borders: capacities of contractors of the new problem
+        :return: adapted chromosomes in the order of the checkpoint population
+        """
+        work_ids, worker_names, contractor_ids = problem_ids(wg, contractors)
+        old_work2index = {work_id: index for index, work_id in enumerate(self.work_ids)}
+        old_worker2index = {name: index for index, name in enumerate(self.worker_names)}
+        old_contractor2index = {contractor_id: index for index, contractor_id in enumerate(self.contractor_ids)}
+
+        # (new index, old index) of common works, worker types and contractors
+        works = np.array([(index, old_work2index[work_id]) for index, work_id in enumerate(work_ids)
+                          if work_id in old_work2index], dtype=int).reshape(-1, 2)
+        workers = np.array([(index, old_worker2index[name]) for index, name in enumerate(worker_names)
+                            if name in old_worker2index], dtype=int).reshape(-1, 2)
+        contractors_map = np.full(len(self.contractor_ids), -1, dtype=int)
+        for index, contractor_id in enumerate(contractor_ids):
+            if contractor_id in old_contractor2index:
+                contractors_map[old_contractor2index[contractor_id]] = index
+        contractor_columns = np.array([(index, old_contractor2index[contractor_id])
+                                       for index, contractor_id in enumerate(contractor_ids)
+                                       if contractor_id in old_contractor2index], dtype=int).reshape(-1, 2)
+
+        adapted = []
+        for i, (old_order, old_resources, old_borders, _, _) in enumerate(self.population):
+            template = templates[i % len(templates)]
+            order, resources, borders, spec, zones = template[0], template[1].copy(), template[2].copy(), \
+                template[3], template[4].copy()
+
+            # works keep their relative positions, new works are placed right after their parents
+            old_positions = np.empty(len(old_order), dtype=float)
+            old_positions[old_order] = np.arange(len(old_order))
+            priorities = np.full(len(work_ids), np.nan)
+            priorities[works[:, 0]] = old_positions[works[:, 1]]
+            order = _topological_order(priorities, parents, template[0])
+
+            if len(works) and len(workers):
+                resources[np.ix_(works[:, 0], workers[:, 0])] = old_resources[np.ix_(works[:, 1], workers[:, 1])]
+            if len(works):
+                old_contractors = contractors_map[old_resources[works[:, 1], -1]]
+                known = old_contractors >= 0
+                resources[works[known, 0], -1] = old_contractors[known]
+            resources[:, :-1] = np.clip(resources[:, :-1], resources_border[0].T, resources_border[1].T)
+
+            if len(contractor_columns) and len(workers):
+                borders[np.ix_(contractor_columns[:, 0], workers[:, 0])] = \
+                    old_borders[np.ix_(contractor_columns[:, 1], workers[:, 1])]
+            borders = np.minimum(borders, contractor_borders)
+
+            adapted.append((order, resources, borders, spec, zones))
+        return adapted
+
+
+def _topological_order(priorities: np.ndarray, parents: dict[int, set[int]], template_order: np.ndarray) \
+        -> np.ndarray:
+    # parents of work contain the work itself
+    parents = {work: work_parents - {work} for work, work_parents in parents.items()}
+
+    # works without priority get the priority of their latest parent, so they are placed right after it
+    for work in template_order:
+        if np.isnan(priorities[work]):
+            priorities[work] = max((priorities[parent] for parent in parents[work]), default=-1) + 0.5
+
+    # Kahn's algorithm, that takes ready works by priority
+    remaining_parents = {work: len(work_parents) for work, work_parents in parents.items()}
+    children = {work: [] for work in parents}
+    for work, work_parents in parents.items():
+        for parent in work_parents:
+            children[parent].append(work)
+
+    ready = [(priorities[work], work) for work, count in remaining_parents.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, work = heapq.heappop(ready)
+        order.append(work)
+        for child in children[work]:
+            remaining_parents[child] -= 1
+            if remaining_parents[child] == 0:
+                heapq.heappush(ready, (priorities[child], child))
+    return np.array(order, dtype=template_order.dtype)
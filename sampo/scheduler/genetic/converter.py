@@ -1,13 +1,18 @@
-import copy
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from enum import Enum
+from functools import partial
+from typing import Callable
 
 import numpy as np
+from sortedcontainers import SortedList
 
 from sampo.api.genetic_api import ChromosomeType, ScheduleGenerationScheme
+from sampo.backend.fitness_cache import spec_key
 from sampo.scheduler.base import Scheduler
 from sampo.scheduler.timeline.base import Timeline
-from sampo.scheduler.timeline.general_timeline import GeneralTimeline
-from sampo.scheduler.timeline import JustInTimeTimeline, MomentumTimeline
+from sampo.scheduler.timeline import JustInTimeTimeline, MomentumTimeline, SupplyTimeline, ZoneTimeline
 from sampo.scheduler.utils import WorkerContractorPool
 from sampo.schemas import ZoneReq
 from sampo.schemas.contractor import Contractor
@@ -15,10 +20,75 @@ from sampo.schemas.graph import GraphNode
 from sampo.schemas.landscape import LandscapeConfiguration
 from sampo.schemas.resources import Worker
 from sampo.schemas.schedule import ScheduledWork, Schedule
-from sampo.schemas.schedule_spec import ScheduleSpec
-from sampo.schemas.time import Time
+from sampo.schemas.schedule_evaluation import ResourceUsageAccumulator
+from sampo.schemas.schedule_spec import ScheduleSpec, WorkSpec
+from sampo.schemas.time import Time, TIME_INF
 from sampo.schemas.time_estimator import WorkTimeEstimator, DefaultWorkEstimator
-from sampo.utilities.linked_list import LinkedList
+from sampo.schemas.works import WorkUnit
+
+
+class MakespanCutoffExceeded(Exception):
+    """
+    Raised by schedule generation schemes, when the makespan of the schedule being built
+    is proven to exceed the given cutoff, so the rest of decoding is useless.
+    """
+
+    def __init__(self, lower_bound: int):
+        super().__init__(f'Makespan lower bound {lower_bound} exceeds the cutoff')
+        self.lower_bound = lower_bound
+
+
+def makespan_tails(nodes: list[GraphNode],
+                   worker_pool: WorkerContractorPool,
+                   work_estimator: WorkTimeEstimator = DefaultWorkEstimator()) -> dict[GraphNode, int]:
+    """
+    Computes for each node the lower bound of time between its finish and the finish of the project.
+    It is the longest path by the edges' lags and the minimal durations of the following works.
+
+    The minimal duration of the work is estimated with the maximal team of each contractor,
+    so the estimator is expected not to give shorter durations for smaller teams.
+    Inseparable sons are executed by the team of their chain head, so their durations are taken as zero.
+
+    :param nodes: all the nodes of the graph
+    """
+    def min_duration(node: GraphNode) -> int:
+        reqs = node.work_unit.worker_reqs
+        if node.is_inseparable_son() or not reqs:
+            return 0
+        durations = []
+        for contractor_id in {contractor_id for req in reqs for contractor_id in worker_pool.get(req.kind, {})}:
+            team = [worker_pool[req.kind][contractor_id].copy().with_count(req.max_count)
+                    for req in reqs if contractor_id in worker_pool.get(req.kind, {})]
+            durations.append(work_estimator.estimate_time(node.work_unit, team))
+        duration = min(durations, default=Time.inf())
+        # unschedulable works give infinite fitness anyway
+        return 0 if duration.is_inf() else duration.value
+
+    durations = {node: min_duration(node) for node in nodes}
+
+    # nodes are processed from the end of the graph, each one after all its successors
+    remaining_children = {node: len(node.edges_from) for node in nodes}
+    ready = [node for node, count in remaining_children.items() if count == 0]
+    tails: dict[GraphNode, int] = {}
+    while ready:
+        node = ready.pop()
+        tails[node] = max(0, max((int(edge.lag) + durations[edge.finish] + tails[edge.finish]
+                                  for edge in node.edges_from), default=0))
+        for edge in node.edges_to:
+            remaining_children[edge.start] -= 1
+            if remaining_children[edge.start] == 0:
+                ready.append(edge.start)
+    return tails
+
+
+def _makespan_bound(node: GraphNode, node2swork: dict[GraphNode, ScheduledWork], tails: dict[GraphNode, int]) -> int:
+    return max(node2swork[chain_node].finish_time.value + tails[chain_node]
+               for chain_node in node.get_inseparable_chain_with_self())
+
+
+def _is_cutoff_applicable(cutoff: int | None, tails: dict[GraphNode, int] | None, spec: ScheduleSpec) -> bool:
+    # assigned times and workers of work specs can make works shorter than the bounds
+    return cutoff is not None and tails is not None and spec_key(spec) == spec_key(ScheduleSpec())
 
 
 def convert_schedule_to_chromosome(work_id2index: dict[str, int],
@@ -86,17 +156,29 @@ def convert_chromosome_to_schedule(chromosome: ChromosomeType,
                                    timeline: Timeline | None = None,
                                    assigned_parent_time: Time = Time(0),
                                    work_estimator: WorkTimeEstimator = DefaultWorkEstimator(),
-                                   sgs_type: ScheduleGenerationScheme = ScheduleGenerationScheme.Parallel) \
+                                   sgs_type: ScheduleGenerationScheme = ScheduleGenerationScheme.Parallel,
+                                   checkpoints: 'SerialSGSCheckpoints | None' = None,
+                                   cutoff: int | None = None,
+                                   tails: dict[GraphNode, int] | None = None,
+                                   accumulator: ResourceUsageAccumulator | None = None) \
         -> tuple[dict[GraphNode, ScheduledWork], Time, Timeline, list[GraphNode]]:
     """
     Build schedule from received chromosome
     It can be used in visualization of final solving of genetic algorithm
+
+    :param checkpoints: store of decoding states, used by incremental serial scheme
+    :param cutoff: if passed with `tails`, decoding is aborted by `MakespanCutoffExceeded`
+    as soon as the makespan is proven to exceed it
+    :param tails: lower bounds of time from works' finish to the project finish, see `makespan_tails`
+    :param accumulator: if passed, receives all the placed works
     """
     match sgs_type:
         case ScheduleGenerationScheme.Parallel:
             converter = parallel_schedule_generation_scheme
         case ScheduleGenerationScheme.Serial:
             converter = serial_schedule_generation_scheme
+        case ScheduleGenerationScheme.IncrementalSerial:
+            converter = partial(serial_schedule_generation_scheme, checkpoints=checkpoints)
         case _:
             raise ValueError('Unknown type of schedule generation scheme')
     return converter(chromosome,
@@ -110,7 +192,146 @@ def convert_chromosome_to_schedule(chromosome: ChromosomeType,
                      landscape,
                      timeline,
                      assigned_parent_time,
-                     work_estimator)
+                     work_estimator,
+                     cutoff=cutoff,
+                     tails=tails,
+                     accumulator=accumulator)
+
+
+class _EligibleWorks:
+    """
+    Works of parallel SGS, whose parents are all placed, in the order of chromosome.
+    Works with independent spec don't wait for parents, so they are eligible from the start.
+    """
+
+    def __init__(self, nodes: list[GraphNode], independent: list[bool]):
+        """
+        :param nodes: works in the order of chromosome
+        :param independent: whether the work at the same position has independent spec
+        """
+        chain_position = {chain_node: position for position, node in enumerate(nodes)
+                          for chain_node in node.get_inseparable_chain_with_self()}
+        # parents from outside the inseparable chain, they should be finished before the work starts
+        self.parents: list[list[GraphNode]] = [[p for dep_node in node.get_inseparable_chain_with_self()
+                                                for p in dep_node.parents if p != dep_node.inseparable_parent]
+                                               for node in nodes]
+        self._dependents: list[list[int]] = [[] for _ in nodes]
+        self._waiting = [0] * len(nodes)
+        for position, parents in enumerate(self.parents):
+            if independent[position]:
+                continue
+            # parents outside the chromosome are never placed, so are such works
+            parent_positions = {chain_position.get(p, -1) for p in parents}
+            self._waiting[position] = len(parent_positions)
+            for parent_position in parent_positions:
+                if parent_position >= 0:
+                    self._dependents[parent_position].append(position)
+        self._positions = SortedList(position for position, waiting in enumerate(self._waiting) if waiting == 0)
+        # heap of eligible works, that can't start until the given time
+        self._postponed: list[tuple[int, int]] = []
+        self.remaining = len(nodes)
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def postpone(self, position: int, time: int):
+        """
+        Hides the eligible work from scans until the given time
+        """
+        self._positions.remove(position)
+        heapq.heappush(self._postponed, (time, position))
+
+    def resume(self, time: int):
+        """
+        Returns the works, postponed until the given time or earlier, to scans
+        """
+        while self._postponed and self._postponed[0][0] <= time:
+            self._positions.add(heapq.heappop(self._postponed)[1])
+
+    def postponed_time(self) -> int:
+        """
+        Returns the nearest time, until which some work is postponed
+        """
+        return self._postponed[0][0] if self._postponed else TIME_INF
+
+    def scan(self):
+        """
+        Yields eligible positions in increasing order.
+        Works, that become eligible during the scan, are yielded too, if they are after the current position.
+        """
+        ind = 0
+        while ind < len(self._positions):
+            position = self._positions[ind]
+            yield position
+            ind = self._positions.bisect_right(position)
+
+    def place(self, position: int):
+        """
+        Marks the work as placed and makes its children eligible, if all their parents are placed
+        """
+        self._positions.remove(position)
+        self.remaining -= 1
+        for dependent in self._dependents[position]:
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0:
+                self._positions.add(dependent)
+
+
+def _place_by_events(eligible: _EligibleWorks,
+                     place: Callable[[int, int], tuple[int, int] | None],
+                     earliest_start: Callable[[int], int],
+                     start_time: int):
+    """
+    Event-driven loop of parallel SGS.
+    Checkpoints are the starts and the ends of placed works, at each checkpoint
+    eligible works are tried in the order of chromosome.
+    When checkpoints are over, time jumps to the nearest moment, when some of eligible works
+    gets its parents finished and its workers released. It's the same as stepping by one time unit,
+    because nothing can be placed earlier.
+    Placed works only occupy workers, so these moments never decrease and works are postponed
+    until their last found moment.
+
+    :param place: tries to place the work on the given position at the given time,
+    returns its start and end checkpoints if placed
+    :param earliest_start: returns the time, when the parents of the eligible work are finished
+    and its workers are released
+    :param start_time: the time before the first checkpoint
+    """
+    # start and finish times of all the works
+    work_timeline = SortedList([0])
+    ckpt_idx = 0
+    prev_start_time = start_time - 1
+
+    while eligible.remaining > 0:
+        if ckpt_idx < len(work_timeline):
+            start_time = work_timeline[ckpt_idx]
+            if prev_start_time == start_time:
+                ckpt_idx += 1
+                continue
+            if abs(start_time) == TIME_INF:
+                # break because schedule already contains Time.inf(), that is incorrect schedule
+                break
+            prev_start_time = start_time
+        else:
+            next_time = min((earliest_start(position) for position in eligible), default=TIME_INF)
+            next_time = min(next_time, eligible.postponed_time())
+            if next_time >= TIME_INF:
+                # break because remaining works can't be placed
+                break
+            start_time = max(start_time + 1, next_time)
+
+        # try eligible works, that can start at start_time moment
+        eligible.resume(start_time)
+        for position in eligible.scan():
+            time = earliest_start(position)
+            if time > start_time:
+                eligible.postpone(position, time)
+                continue
+            checkpoints = place(position, start_time)
+            if checkpoints is not None:
+                eligible.place(position)
+                work_timeline.update(checkpoints)
+        ckpt_idx = min(ckpt_idx + 1, len(work_timeline))
 
 
 def parallel_schedule_generation_scheme(chromosome: ChromosomeType,
@@ -124,10 +345,18 @@ def parallel_schedule_generation_scheme(chromosome: ChromosomeType,
                                         landscape: LandscapeConfiguration = LandscapeConfiguration(),
                                         timeline: Timeline | None = None,
                                         assigned_parent_time: Time = Time(0),
-                                        work_estimator: WorkTimeEstimator = DefaultWorkEstimator()) \
+                                        work_estimator: WorkTimeEstimator = DefaultWorkEstimator(),
+                                        cutoff: int | None = None,
+                                        tails: dict[GraphNode, int] | None = None,
+                                        accumulator: ResourceUsageAccumulator | None = None) \
         -> tuple[dict[GraphNode, ScheduledWork], Time, Timeline, list[GraphNode]]:
     """
     Implementation of Parallel Schedule Generation Scheme
+
+    :param cutoff: if passed with `tails`, `MakespanCutoffExceeded` is raised
+    as soon as the makespan is proven to exceed it
+    :param tails: lower bounds of time from works' finish to the project finish, see `makespan_tails`
+    :param accumulator: if passed, receives all the placed works
     """
     node2swork: dict[GraphNode, ScheduledWork] = {}
 
@@ -136,28 +365,25 @@ def parallel_schedule_generation_scheme(chromosome: ChromosomeType,
     border = chromosome[2]
     spec = chromosome[3]
     zone_statuses = chromosome[4]
-    worker_pool = copy.deepcopy(worker_pool)
-
     # use 3rd part of chromosome in schedule generator
-    for worker_index in worker_pool:
-        for contractor_index in worker_pool[worker_index]:
-            worker_pool[worker_index][contractor_index].with_count(border[contractor2index[contractor_index],
-            worker_name2index[worker_index]])
+    worker_pool = {worker_name: {contractor_id: worker.copy().with_count(border[contractor2index[contractor_id],
+                                                                                worker_name2index[worker_name]])
+                                 for contractor_id, worker in offers.items()}
+                   for worker_name, offers in worker_pool.items()}
 
     if not isinstance(timeline, JustInTimeTimeline):
         timeline = JustInTimeTimeline(worker_pool, landscape)
 
-    order_nodes = []
+    check_cutoff = _is_cutoff_applicable(cutoff, tails, spec)
 
-    # timeline to store starts and ends of all works
-    work_timeline = GeneralTimeline()
+    order_nodes = []
 
     def decode(work_index):
         cur_node = index2node[work_index]
 
         cur_work_spec = spec.get_work_spec(cur_node.id)
-        cur_resources = works_resources[work_index, :-1]
-        cur_contractor_index = works_resources[work_index, -1]
+        # chromosome can use narrow integer dtypes, so counts are converted to python ints
+        *cur_resources, cur_contractor_index = works_resources[work_index].tolist()
         cur_contractor = index2contractor[cur_contractor_index]
         cur_worker_team: list[Worker] = [worker_pool_indices[worker_index][cur_contractor_index]
                                          .copy().with_count(worker_count)
@@ -169,18 +395,24 @@ def parallel_schedule_generation_scheme(chromosome: ChromosomeType,
             cur_exec_time = work_estimator.estimate_time(cur_node.work_unit, cur_worker_team)
         return cur_node, cur_worker_team, cur_contractor, cur_exec_time, cur_work_spec
 
-    # account the remaining works
-    enumerated_works_remaining = LinkedList(iterable=enumerate(
-        [(work_index, *decode(work_index)) for work_index in works_order]
-    ))
+    works = [decode(work_index) for work_index in works_order]
+    eligible = _EligibleWorks([work[0] for work in works], [work[4].is_independent for work in works])
 
-    # declare current checkpoint index
-    ckpt_idx = 0
-    start_time = assigned_parent_time - 1
-    prev_start_time = start_time - 1
+    # parents of eligible works are already placed, so their finish is known
+    parents_finish: dict[int, int] = {}
+
+    def earliest_start(idx: int) -> int:
+        node, worker_team, contractor, exec_time, work_spec = works[idx]
+        agents_time = timeline.find_min_agents_time(worker_team, work_spec).value
+        if work_spec.is_independent:
+            return agents_time
+        if idx not in parents_finish:
+            parents_finish[idx] = max((node2swork[p].finish_time.value for p in eligible.parents[idx]), default=0)
+        return max(agents_time, parents_finish[idx])
 
-    def work_scheduled(args) -> bool:
-        idx, (work_idx, node, worker_team, contractor, exec_time, work_spec) = args
+    def work_scheduled(idx: int, start_time: int) -> tuple[int, int] | None:
+        node, worker_team, contractor, exec_time, work_spec = works[idx]
+        start_time = Time(start_time)
 
         if timeline.can_schedule_at_the_moment(node, worker_team, work_spec, node2swork, start_time, exec_time):
             # apply worker spec
@@ -201,29 +433,524 @@ def parallel_schedule_generation_scheme(chromosome: ChromosomeType,
             if idx == len(works_order) - 1:  # we are scheduling the work `end of the project`
                 node2swork[node].zones_pre = finalizing_zones
 
-            work_timeline.update_timeline(st, exec_time, None)
-            return True
-        return False
+            if accumulator is not None:
+                for chain_node in node.get_inseparable_chain_with_self():
+                    accumulator.add(node2swork[chain_node])
 
-    # while there are unprocessed checkpoints
-    while len(enumerated_works_remaining) > 0:
-        if ckpt_idx < len(work_timeline):
-            start_time = work_timeline[ckpt_idx]
-            if prev_start_time == start_time:
-                ckpt_idx += 1
+            if check_cutoff:
+                bound = _makespan_bound(node, node2swork, tails)
+                if bound > cutoff:
+                    raise MakespanCutoffExceeded(bound)
+
+            return st.value, (st + exec_time).value
+        return None
+
+    _place_by_events(eligible, work_scheduled, earliest_start, assigned_parent_time.value - 1)
+
+    return node2swork, assigned_parent_time, timeline, order_nodes
+
+
+class ArrayWorkerPool:
+    """
+    Worker pool in the form of contractors x worker types arrays for array-backed schedule generation scheme.
+    Worker objects are built from pool's templates only for the work time estimator
+    and to materialize scheduled works.
+    """
+
+    def __init__(self, worker_pool_indices: dict[int, dict[int, Worker]], contractors_count: int,
+                 worker_types_count: int):
+        """
+        :param worker_pool_indices: mapping of worker type indices to contractor indices to their workers
+        """
+        self.templates: list[list[Worker | None]] = [[None] * worker_types_count for _ in range(contractors_count)]
+        self.worker_names: list[str | None] = [None] * worker_types_count
+        self.unit_costs = np.zeros((contractors_count, worker_types_count))
+        for worker_index, offers in worker_pool_indices.items():
+            for contractor_index, worker in offers.items():
+                self.templates[contractor_index][worker_index] = worker
+                self.worker_names[worker_index] = worker.name
+                self.unit_costs[contractor_index, worker_index] = worker.cost_one_unit
+        # estimator only reads workers, so the workers with the same count are shared between teams
+        self._estimator_workers: dict[tuple[int, int, int], Worker] = {}
+
+    def estimator_team(self, contractor_index: int, team: list[list[int]]) -> list[Worker]:
+        """
+        Returns the team to pass to the work time estimator, it shouldn't be changed
+        """
+        team_workers = []
+        for worker_index, count in team:
+            key = (contractor_index, worker_index, count)
+            worker = self._estimator_workers.get(key)
+            if worker is None:
+                worker = self.templates[contractor_index][worker_index].copy().with_count(count)
+                self._estimator_workers[key] = worker
+            team_workers.append(worker)
+        return team_workers
+
+    def apply_spec(self, work_unit: WorkUnit, team: list[list[int]], work_spec: WorkSpec):
+        """
+        Applies the worker spec to the team in place,
+        the same as `Scheduler.optimize_resources_using_spec` without optimization
+        """
+        assigned_workers = work_spec.assigned_workers
+        if len(assigned_workers) == len(work_unit.worker_reqs):
+            for member in team:
+                member[1] = assigned_workers[self.worker_names[member[0]]]
+        elif assigned_workers:
+            for member in team:
+                spec_count = assigned_workers.get(self.worker_names[member[0]], 0)
+                if spec_count > 0:
+                    member[1] = spec_count
+
+    def team(self, contractor_index: int, team: list[list[int]]) -> list[Worker]:
+        """
+        Builds new Worker objects of the team
+
+        :param team: pairs of worker type index and count
+        """
+        templates = self.templates[contractor_index]
+        return [templates[worker_index].copy().with_count(count) for worker_index, count in team]
+
+
+def _descending_time_key(offer: tuple[int, int]) -> int:
+    return -offer[0]
+
+
+class _ArrayResourceTimeline:
+    """
+    Integer version of the resource part of `JustInTimeTimeline`.
+    For each contractor and worker type it stores a descending list of pairs of time and
+    number of available workers, teams are the lists of pairs of worker type index and count.
+    """
+
+    def __init__(self, border: np.ndarray):
+        self._stacks = [[[(0, count)] for count in row] for row in border.tolist()]
+
+    def agents_time(self, contractor_index: int, team: list[list[int]], is_independent: bool) -> int:
+        """
+        Returns the time, when all the workers of the team are available
+        """
+        stacks = self._stacks[contractor_index]
+        max_agent_time = 0
+        if is_independent:
+            for worker_index, _ in team:
+                max_agent_time = max(max_agent_time, stacks[worker_index][0][0])
+            return max_agent_time
+        for worker_index, needed_count in team:
+            if needed_count <= 0:
                 continue
-            if start_time.is_inf():
-                # break because schedule already contains Time.inf(), that is incorrect schedule
-                break
-            prev_start_time = start_time
+            # the stack is sorted descending, so the last grabbed pair is the latest one
+            offer_stack = stacks[worker_index]
+            ind = -1
+            needed_count -= offer_stack[-1][1]
+            while needed_count > 0:
+                ind -= 1
+                needed_count -= offer_stack[ind][1]
+            offer_time = offer_stack[ind][0]
+            if offer_time > max_agent_time:
+                max_agent_time = offer_time
+        return max_agent_time
+
+    def update(self, contractor_index: int, team: list[list[int]], finish_time: int, is_independent: bool):
+        """
+        Occupies the workers of the team until the `finish_time`
+        """
+        stacks = self._stacks[contractor_index]
+        if is_independent:
+            for worker_index, _ in team:
+                worker_timeline = stacks[worker_index]
+                count_workers = sum(count for _, count in worker_timeline)
+                worker_timeline.clear()
+                worker_timeline.append((finish_time, count_workers))
+            return
+        for worker_index, count in team:
+            needed_count = count
+            worker_timeline = stacks[worker_index]
+            while needed_count > 0:
+                next_time, next_count = worker_timeline.pop()
+                if next_count > needed_count or len(worker_timeline) == 0:
+                    worker_timeline.append((next_time, next_count - needed_count))
+                    break
+                needed_count -= next_count
+
+            # after all the pairs with not earlier time, the list is sorted descending
+            worker_timeline.insert(bisect_right(worker_timeline, -finish_time, key=_descending_time_key),
+                                   (finish_time, count))
+
+
+def _time_value(value: int) -> int:
+    # the same saturation as `Time` does
+    return max(min(value, TIME_INF), -TIME_INF)
+
+
+class ArrayScheduledWorks:
+    """
+    Works placed by array-backed schedule generation scheme.
+    `ScheduledWork` objects are built only on demand, e.g. to materialize the final schedule.
+    """
+
+    def __init__(self, array_pool: ArrayWorkerPool, index2contractor: dict[int, Contractor]):
+        self._array_pool = array_pool
+        self._index2contractor = index2contractor
+        # placed inseparable chains with their start and finish times and material deliveries,
+        # contractor index and team
+        self.chains: list[tuple[list[tuple[GraphNode, int, int, list]], int, list[list[int]]]] = []
+        self.zones_pre: dict[GraphNode, list] = {}
+
+    def materialize(self) -> dict[GraphNode, ScheduledWork]:
+        node2swork = {}
+        for chain, contractor_index, team in self.chains:
+            # all the works of the chain share the team
+            workers = self._array_pool.team(contractor_index, team)
+            contractor = self._index2contractor[contractor_index]
+            for node, start, finish, deliveries in chain:
+                node2swork[node] = ScheduledWork(work_unit=node.work_unit,
+                                                 start_end_time=(Time(start), Time(finish)),
+                                                 workers=workers,
+                                                 contractor=contractor,
+                                                 materials=deliveries)
+        for node, zones_pre in self.zones_pre.items():
+            node2swork[node].zones_pre = zones_pre
+        return node2swork
+
+    def __call__(self) -> list[ScheduledWork]:
+        return list(self.materialize().values())
+
+
+def array_parallel_schedule_generation_scheme(chromosome: ChromosomeType,
+                                              array_pool: ArrayWorkerPool,
+                                              index2node: dict[int, GraphNode],
+                                              index2contractor: dict[int, Contractor],
+                                              landscape: LandscapeConfiguration = LandscapeConfiguration(),
+                                              assigned_parent_time: Time = Time(0),
+                                              work_estimator: WorkTimeEstimator = DefaultWorkEstimator(),
+                                              cutoff: int | None = None,
+                                              tails: dict[GraphNode, int] | None = None,
+                                              accumulator: ResourceUsageAccumulator | None = None) \
+        -> ArrayScheduledWorks:
+    """
+    Array-backed version of `parallel_schedule_generation_scheme`, that gives the same schedule.
+    Resources are tracked by contractors x worker types stacks of integer times and teams are integer vectors,
+    so there are no copies of worker pool and no `ScheduledWork` objects while the works are placed.
+    It is used to evaluate chromosomes, because it doesn't build `Timeline` to continue scheduling.
+
+    :param cutoff: if passed with `tails`, `MakespanCutoffExceeded` is raised
+    as soon as the makespan is proven to exceed it
+    :param tails: lower bounds of time from works' finish to the project finish, see `makespan_tails`
+    :param accumulator: if passed, receives all the placed works
+    :return: placed works, that can be materialized to `ScheduledWork` objects
+    """
+    works_order = chromosome[0]
+    works_resources = chromosome[1]
+    spec = chromosome[3]
+    zone_statuses = chromosome[4]
+
+    resource_timeline = _ArrayResourceTimeline(chromosome[2])
+    material_timeline = SupplyTimeline(landscape)
+    zone_timeline = ZoneTimeline(landscape.zone_config)
+    placed = ArrayScheduledWorks(array_pool, index2contractor)
+    finish: dict[GraphNode, int] = {}
+
+    check_cutoff = _is_cutoff_applicable(cutoff, tails, spec)
+    parent_time = assigned_parent_time.value
+
+    def decode(work_index):
+        node = index2node[work_index]
+        work_spec = spec.get_work_spec(node.id)
+        # chromosome can use narrow integer dtypes, so counts are converted to python ints
+        *counts, contractor_index = works_resources[work_index].tolist()
+        team = [[worker_index, count] for worker_index, count in enumerate(counts) if count > 0]
+        if work_spec.assigned_time is not None:
+            exec_time = work_spec.assigned_time
         else:
-            start_time += 1
+            exec_time = work_estimator.estimate_time(node.work_unit,
+                                                     array_pool.estimator_team(contractor_index, team))
+        return node, team, contractor_index, exec_time.value, work_spec
 
-        # find all works that can start at start_time moment and remove it if scheduled
-        enumerated_works_remaining.remove_if(work_scheduled)
-        ckpt_idx = min(ckpt_idx + 1, len(work_timeline))
+    works = [decode(work_index) for work_index in works_order]
+    eligible = _EligibleWorks([work[0] for work in works], [work[4].is_independent for work in works])
 
-    return node2swork, assigned_parent_time, timeline, order_nodes
+    def can_schedule_at_the_moment(node: GraphNode, team: list[list[int]], contractor_index: int,
+                                   work_spec: WorkSpec, start_time: int, exec_time: int) -> bool:
+        if work_spec.is_independent:
+            return resource_timeline.agents_time(contractor_index, team, True) <= start_time
+        for dep_node in node.get_inseparable_chain_with_self():
+            for p in dep_node.parents:
+                if p != dep_node.inseparable_parent:
+                    parent_finish = finish.get(p, None)
+                    if parent_finish is None or parent_finish > start_time:
+                        return False
+        if resource_timeline.agents_time(contractor_index, team, False) > start_time:
+            return False
+        start = Time(start_time)
+        if not material_timeline.can_schedule_at_the_moment(node.id, start, node.work_unit.need_materials(),
+                                                            node.work_unit.workground_size):
+            return False
+        return zone_timeline.can_schedule_at_the_moment(node.work_unit.zone_reqs, start, Time(exec_time))
+
+    # parents of eligible works are already placed, so their finish is known
+    parents_finish: dict[int, int] = {}
+
+    def earliest_start(idx: int) -> int:
+        node, team, contractor_index, exec_time, work_spec = works[idx]
+        agents_time = resource_timeline.agents_time(contractor_index, team, work_spec.is_independent)
+        if work_spec.is_independent:
+            return agents_time
+        if idx not in parents_finish:
+            parents_finish[idx] = max((finish[p] for p in eligible.parents[idx]), default=0)
+        return max(agents_time, parents_finish[idx])
+
+    def work_scheduled(idx: int, start_time: int) -> tuple[int, int] | None:
+        node, team, contractor_index, exec_time, work_spec = works[idx]
+
+        if not can_schedule_at_the_moment(node, team, contractor_index, work_spec, start_time, exec_time):
+            return None
+        array_pool.apply_spec(node.work_unit, team, work_spec)
+
+        st = start_time
+        if idx == 0:  # we are scheduling the work `start of the project`
+            st = parent_time  # this work should always have st = 0, so we just re-assign it
+
+        if idx == len(works_order) - 1:  # we are scheduling the work `end of the project`
+            finish_time, finalizing_zones = zone_timeline.finish_statuses()
+            st = max(start_time, finish_time.value)
+
+        # place the inseparable chain with the assigned execution time
+        inseparable_chain = node.get_inseparable_chain_with_self()
+        working_time = exec_time // len(inseparable_chain)
+        chain = []
+        c_ft = st
+        for dep_node in inseparable_chain:
+            max_parent_time = max((_time_value(finish[edge.start] + int(edge.lag))
+                                   for edge in dep_node.edges_to if edge.start in finish), default=0)
+            c_st = max(c_ft, max_parent_time)
+            deliveries, _, new_finish_time = material_timeline.deliver_materials(
+                dep_node.id, Time(c_st), Time(c_st + working_time), dep_node.work_unit.need_materials(),
+                dep_node.work_unit.workground_size)
+            c_ft = new_finish_time.value
+            finish[dep_node] = c_ft
+            chain.append((dep_node, c_st, c_ft, deliveries))
+        placed.chains.append((chain, contractor_index, team))
+
+        zones = [zone_req.to_zone() for zone_req in node.work_unit.zone_reqs]
+        resource_timeline.update(contractor_index, team, c_ft, work_spec.is_independent)
+        placed.zones_pre[node] = zone_timeline.update_timeline(len(finish), zones, Time(st), Time(c_ft - st))
+
+        if idx == len(works_order) - 1:  # we are scheduling the work `end of the project`
+            placed.zones_pre[node] = finalizing_zones
+
+        if accumulator is not None:
+            unit_costs = array_pool.unit_costs[contractor_index]
+            for dep_node, c_st, c_ft, _ in chain:
+                accumulator.add_team(dep_node.id, c_st, c_ft, contractor_index, team, unit_costs)
+
+        if check_cutoff:
+            bound = max(finish[chain_node] + tails[chain_node] for chain_node in inseparable_chain)
+            if bound > cutoff:
+                raise MakespanCutoffExceeded(bound)
+
+        return st, _time_value(st + exec_time)
+
+    _place_by_events(eligible, work_scheduled, earliest_start, parent_time - 1)
+
+    return placed
+
+
+def is_profile_sgs_applicable(nodes: list[GraphNode], landscape: LandscapeConfiguration) -> bool:
+    """
+    Checks that there are no zones and materials in the instance, e.g. PSPLIB one,
+    so `profile_serial_schedule_generation_scheme` can be used
+    """
+    return not landscape.get_all_resources() and not landscape.zone_config.start_statuses \
+        and all(not node.work_unit.material_reqs and not node.work_unit.zone_reqs for node in nodes)
+
+
+class _ResourceProfile:
+    """
+    Integer version of the resource part of `MomentumTimeline` for one contractor.
+    The profile is the list of times, when numbers of available workers change,
+    and the matrix of numbers of available workers of each type since these times.
+    """
+
+    def __init__(self, capacity: np.ndarray):
+        self._times = [-TIME_INF]
+        # rows after the number of times are the reserve for the new times
+        self._available = np.empty((64, len(capacity)), dtype=np.int64)
+        self._available[0] = capacity
+        # times of the last events of worker types, as `MomentumTimeline` uses them for independent works
+        self._last_times = [0] * len(capacity)
+
+    def find_min_start_time(self, parent_time: int, exec_time: int, team: list[list[int]], required: np.ndarray,
+                            is_independent: bool) -> int:
+        """
+        Finds the earliest time not before `parent_time`,
+        when the required workers are available during the whole execution
+
+        :param team: pairs of worker type index and count
+        :param required: numbers of required workers of all types
+        """
+        # if the work has zero execution time, then there is no need to take resources
+        if exec_time == 0:
+            return parent_time
+        if is_independent:
+            return max([parent_time] + [self._last_times[worker_index] for worker_index, _ in team])
+
+        times = self._times
+        start = parent_time
+        while True:
+            # the window from the last change not after the start up to the end of execution
+            start_idx = bisect_right(times, start) - 1
+            end_idx = bisect_left(times, start + exec_time)
+            lacks = (self._available[start_idx:end_idx] < required).any(axis=1)
+            if not lacks.any():
+                return start
+            # the work can start only after the last lack of workers in the window
+            start = times[end_idx - int(lacks[::-1].argmax())]
+
+    def occupy(self, start: int, finish: int, team: list[list[int]], required: np.ndarray):
+        """
+        Takes the required workers from `start` until `finish`
+        """
+        # if the work has zero execution time, then there is no need to take resources
+        if finish == start:
+            return
+        times = self._times
+        for time in (start, finish):
+            ind = bisect_right(times, time)
+            if times[ind - 1] != time:
+                size = len(times)
+                if size == len(self._available):
+                    self._available = np.concatenate((self._available, np.empty_like(self._available)))
+                self._available[ind + 1:size + 1] = self._available[ind:size]
+                self._available[ind] = self._available[ind - 1]
+                times.insert(ind, time)
+        self._available[bisect_left(times, start):bisect_left(times, finish)] -= required
+        for worker_index, _ in team:
+            self._last_times[worker_index] = max(self._last_times[worker_index], finish)
+
+
+def profile_serial_schedule_generation_scheme(chromosome: ChromosomeType,
+                                              array_pool: ArrayWorkerPool,
+                                              index2node: dict[int, GraphNode],
+                                              index2contractor: dict[int, Contractor],
+                                              assigned_parent_time: Time = Time(0),
+                                              work_estimator: WorkTimeEstimator = DefaultWorkEstimator(),
+                                              cutoff: int | None = None,
+                                              tails: dict[GraphNode, int] | None = None,
+                                              accumulator: ResourceUsageAccumulator | None = None) \
+        -> ArrayScheduledWorks | None:
+    """
+    Array-backed version of `serial_schedule_generation_scheme` for instances without zones and materials,
+    see `is_profile_sgs_applicable`. It gives the same schedule.
+    Workers of each contractor are tracked by the integer resource profile, and start times are found
+    by vectorized checks of availability of all the worker types in the execution window.
+
+    :param cutoff: if passed with `tails`, `MakespanCutoffExceeded` is raised
+    as soon as the makespan is proven to exceed it
+    :param tails: lower bounds of time from works' finish to the project finish, see `makespan_tails`
+    :param accumulator: if passed, receives all the placed works
+    :return: placed works, that can be materialized to `ScheduledWork` objects,
+    or None if the chromosome requires more workers, than its contractors have
+    """
+    works_order = chromosome[0]
+    works_resources = chromosome[1]
+    border = chromosome[2].astype(np.int64)
+    spec = chromosome[3]
+
+    profiles = [_ResourceProfile(capacity) for capacity in border]
+    placed = ArrayScheduledWorks(array_pool, index2contractor)
+    finish: dict[GraphNode, int] = {}
+
+    check_cutoff = _is_cutoff_applicable(cutoff, tails, spec)
+    parent_time = assigned_parent_time.value
+    worker_name2index = {worker_name: index for index, worker_name in enumerate(array_pool.worker_names)}
+
+    def decode(work_index):
+        node = index2node[work_index]
+        work_spec = spec.get_work_spec(node.id)
+        # chromosome can use narrow integer dtypes, so counts are converted to python ints
+        *counts, contractor_index = works_resources[work_index].tolist()
+        # the team keeps the order of worker requirements, as in `serial_schedule_generation_scheme`
+        team = [[worker_name2index[req.kind], counts[worker_name2index[req.kind]]]
+                for req in node.work_unit.worker_reqs]
+        array_pool.apply_spec(node.work_unit, team, work_spec)
+        return node, team, contractor_index, work_spec
+
+    works = [decode(work_index) for work_index in works_order.tolist()]
+    for node, team, contractor_index, _ in works:
+        inseparable_chain = node.get_inseparable_chain_with_self()
+        if not team or all(chain_node.work_unit.is_service_unit for chain_node in inseparable_chain):
+            continue
+        # `MomentumTimeline` can't place such works at all
+        for chain_node in inseparable_chain:
+            for i, req in enumerate(chain_node.work_unit.worker_reqs):
+                if border[contractor_index, worker_name2index[req.kind]] < team[i][1]:
+                    return None
+
+    def chain_times(inseparable_chain: list[GraphNode], parents_times: list[int], workers: list[Worker]) \
+            -> tuple[list[tuple[int, int]], int]:
+        # the same as `MomentumTimeline.find_min_start_time_with_additional` does
+        exec_time = 0
+        exec_times = []
+        for chain_node, parents_time in zip(inseparable_chain, parents_times):
+            node_exec_time = 0 if len(chain_node.work_unit.worker_reqs) == 0 else \
+                work_estimator.estimate_time(chain_node.work_unit, workers).value
+            lag = max(parents_time - parents_times[0] - exec_time, 0)
+            exec_times.append((lag, node_exec_time))
+            exec_time += lag + node_exec_time
+        return exec_times, exec_time
+
+    for order_index, (node, team, contractor_index, work_spec) in enumerate(works):
+        inseparable_chain = node.get_inseparable_chain_with_self()
+        workers = array_pool.estimator_team(contractor_index, team)
+        profile = profiles[contractor_index]
+        required = np.zeros(border.shape[1], dtype=np.int64)
+        for worker_index, count in team:
+            required[worker_index] = count
+
+        # the earliest start times of the chain works by their parents from outside the chain
+        parents_times = [max(max((_time_value(finish[edge.start] + int(edge.lag))
+                                  for edge in chain_node.edges_to if edge.start in finish), default=0),
+                             parent_time)
+                         for chain_node in inseparable_chain]
+
+        _, exec_time = chain_times(inseparable_chain, parents_times, workers)
+        if not team or all(chain_node.work_unit.is_service_unit for chain_node in inseparable_chain):
+            st = parents_times[0]
+        else:
+            st = profile.find_min_start_time(parents_times[0], exec_time, team, required, work_spec.is_independent)
+
+        if order_index == 0:  # we are scheduling the work `start of the project`
+            st = parent_time  # this work should always have st = 0, so we just re-assign it
+
+        # execution times are estimated again for the found start time, as `MomentumTimeline.schedule` does
+        parents_times = [max(time, st) for time in parents_times]
+        exec_times, _ = chain_times(inseparable_chain, parents_times, workers)
+        start_time = st if team else parents_times[0]
+        if work_spec.assigned_time is not None:
+            exec_times = [(0, work_spec.assigned_time.value // len(inseparable_chain))] * len(inseparable_chain)
+
+        chain = []
+        c_ft = start_time
+        for dep_node, (lag, node_exec_time) in zip(inseparable_chain, exec_times):
+            c_st = _time_value(c_ft + lag)
+            c_ft = _time_value(c_st + node_exec_time)
+            finish[dep_node] = c_ft
+            chain.append((dep_node, c_st, c_ft, []))
+        placed.chains.append((chain, contractor_index, team))
+        profile.occupy(start_time, c_ft, team, required)
+
+        if accumulator is not None:
+            unit_costs = array_pool.unit_costs[contractor_index]
+            for dep_node, c_st, c_ft, _ in chain:
+                accumulator.add_team(dep_node.id, c_st, c_ft, contractor_index, team, unit_costs)
+
+        if check_cutoff:
+            bound = max(finish[chain_node] + tails[chain_node] for chain_node in inseparable_chain)
+            if bound > cutoff:
+                raise MakespanCutoffExceeded(bound)
+
+    return placed
 
 
 def serial_schedule_generation_scheme(chromosome: ChromosomeType,
@@ -237,10 +964,22 @@ def serial_schedule_generation_scheme(chromosome: ChromosomeType,
                                       landscape: LandscapeConfiguration = LandscapeConfiguration(),
                                       timeline: Timeline | None = None,
                                       assigned_parent_time: Time = Time(0),
-                                      work_estimator: WorkTimeEstimator = DefaultWorkEstimator()) \
+                                      work_estimator: WorkTimeEstimator = DefaultWorkEstimator(),
+                                      checkpoints: 'SerialSGSCheckpoints | None' = None,
+                                      cutoff: int | None = None,
+                                      tails: dict[GraphNode, int] | None = None,
+                                      accumulator: ResourceUsageAccumulator | None = None) \
         -> tuple[dict[GraphNode, ScheduledWork], Time, Timeline, list[GraphNode]]:
     """
     Implementation of Serial Schedule Generation Scheme
+
+    :param checkpoints: if passed, decoding is resumed from the saved state of the most similar previously
+    decoded chromosome, and the states of this decoding are saved for the next ones.
+    Used only if `timeline` is not passed
+    :param cutoff: if passed with `tails`, `MakespanCutoffExceeded` is raised
+    as soon as the makespan is proven to exceed it
+    :param tails: lower bounds of time from works' finish to the project finish, see `makespan_tails`
+    :param accumulator: if passed, receives all the placed works
     """
     node2swork: dict[GraphNode, ScheduledWork] = {}
 
@@ -249,27 +988,49 @@ def serial_schedule_generation_scheme(chromosome: ChromosomeType,
     border = chromosome[2]
     spec = chromosome[3]
     zone_statuses = chromosome[4]
-    worker_pool = copy.deepcopy(worker_pool)
-
     # use 3rd part of chromosome in schedule generator
-    for worker_index in worker_pool:
-        for contractor_index in worker_pool[worker_index]:
-            worker_pool[worker_index][contractor_index].with_count(border[contractor2index[contractor_index],
-            worker_name2index[worker_index]])
+    worker_pool = {worker_name: {contractor_id: worker.copy().with_count(border[contractor2index[contractor_id],
+                                                                                worker_name2index[worker_name]])
+                                 for contractor_id, worker in offers.items()}
+                   for worker_name, offers in worker_pool.items()}
+
+    order_nodes = []
+    start_index = 0
+    snapshots = None
+
+    if checkpoints is not None and not isinstance(timeline, MomentumTimeline):
+        snapshots, snapshot = checkpoints.find(chromosome, assigned_parent_time)
+        if snapshot is not None:
+            start_index, timeline, node2swork = snapshot.restore()
+            order_nodes = [index2node[work_index] for work_index in works_order[:start_index]]
+            if accumulator is not None:
+                for swork in node2swork.values():
+                    accumulator.add(swork)
 
     if not isinstance(timeline, MomentumTimeline):
         timeline = MomentumTimeline(worker_pool, landscape)
 
-    order_nodes = []
+    snapshot_step = checkpoints.snapshot_step(len(works_order)) if snapshots is not None else 0
+
+    check_cutoff = _is_cutoff_applicable(cutoff, tails, spec)
+    if check_cutoff and node2swork:
+        # works restored from the snapshot
+        bound = max(swork.finish_time.value + tails[node] for node, swork in node2swork.items())
+        if bound > cutoff:
+            raise MakespanCutoffExceeded(bound)
+
+    for order_index in range(start_index, len(works_order)):
+        work_index = works_order[order_index]
+        if snapshots is not None and order_index > start_index and order_index % snapshot_step == 0:
+            snapshots.append(SGSSnapshot(order_index, timeline.fork(), dict(node2swork)))
 
-    for order_index, work_index in enumerate(works_order):
         node = index2node[work_index]
         order_nodes.append(node)
 
         work_spec = spec.get_work_spec(node.id)
 
-        resources = works_resources[work_index, :-1]
-        contractor_index = works_resources[work_index, -1]
+        # chromosome can use narrow integer dtypes, so counts are converted to python ints
+        *resources, contractor_index = works_resources[work_index].tolist()
         contractor = index2contractor[contractor_index]
         worker_team: list[Worker] = [worker_pool[wreq.kind][contractor.id]
                                      .copy().with_count(resources[worker_name2index[wreq.kind]])
@@ -288,6 +1049,15 @@ def serial_schedule_generation_scheme(chromosome: ChromosomeType,
         # finish using time spec
         ft = timeline.schedule(node, node2swork, worker_team, contractor, work_spec,
                                st, work_spec.assigned_time, assigned_parent_time, work_estimator)
+
+        if accumulator is not None:
+            for chain_node in node.get_inseparable_chain_with_self():
+                accumulator.add(node2swork[chain_node])
+
+        if check_cutoff:
+            bound = _makespan_bound(node, node2swork, tails)
+            if bound > cutoff:
+                raise MakespanCutoffExceeded(bound)
         # process zones
         zone_reqs = [ZoneReq(index2zone[i], zone_status) for i, zone_status in enumerate(zone_statuses[work_index])]
         zone_start_time = timeline.zone_timeline.find_min_start_time(zone_reqs, ft, 0)
@@ -299,7 +1069,113 @@ def serial_schedule_generation_scheme(chromosome: ChromosomeType,
                                                                                  [z.to_zone() for z in zone_reqs],
                                                                                  zone_start_time, 0)
 
+    if snapshots is not None:
+        checkpoints.save(chromosome, assigned_parent_time, snapshots)
+
     schedule_start_time = min((swork.start_time for swork in node2swork.values() if
                                len(swork.workers) != 0), default=assigned_parent_time)
 
     return node2swork, schedule_start_time, timeline, order_nodes
+
+
+class SGSSnapshot:
+    """
+    State of serial schedule generation scheme before scheduling the work at `position` of the order.
+    Saved state is never modified, each restoring returns its independent fork.
+    """
+
+    def __init__(self, position: int, timeline: MomentumTimeline, node2swork: dict[GraphNode, ScheduledWork]):
+        self.position = position
+        self._timeline = timeline
+        self._node2swork = node2swork
+
+    def restore(self) -> tuple[int, MomentumTimeline, dict[GraphNode, ScheduledWork]]:
+        return self.position, self._timeline.fork(), dict(self._node2swork)
+
+
+class _CheckpointsEntry:
+    def __init__(self, chromosome: ChromosomeType, assigned_parent_time: Time, snapshots: list[SGSSnapshot]):
+        self.order = chromosome[0].copy()
+        self.resources = chromosome[1].copy()
+        self.border = chromosome[2].copy()
+        self.spec_key = spec_key(chromosome[3])
+        self.zones = chromosome[4].copy()
+        self.assigned_parent_time = assigned_parent_time
+        self.snapshots = snapshots
+        self.positions = [snapshot.position for snapshot in snapshots]
+
+    def common_prefix(self, chromosome: ChromosomeType) -> int:
+        """
+        Returns the length of order prefix, that is decoded identically for this entry and given chromosome
+        """
+        order, resources, _, _, zones = chromosome
+        order_diff = np.flatnonzero(self.order != order)
+        prefix = order_diff[0] if len(order_diff) > 0 else len(order)
+        changed_works = (self.resources != resources).any(axis=1) | (self.zones != zones).any(axis=1)
+        changed_positions = np.flatnonzero(changed_works[order[:prefix]])
+        return changed_positions[0] if len(changed_positions) > 0 else prefix
+
+
+class SerialSGSCheckpoints:
+    """
+    Store of serial schedule generation scheme states of recently decoded chromosomes.
+    Offspring usually shares the beginning of decoding with one of its parents,
+    so it can be decoded starting from the saved state of this parent instead of the full replay.
+    """
+
+    def __init__(self, snapshots_count: int = 8, max_chromosomes: int = 64):
+        """
+        :param snapshots_count: the number of states saved for each chromosome
+        :param max_chromosomes: the number of chromosomes, which states are stored
+        """
+        self._snapshots_count = snapshots_count
+        self._max_chromosomes = max_chromosomes
+        self._entries: OrderedDict[int, _CheckpointsEntry] = OrderedDict()
+        self._next_entry_id = 0
+        self.restored = 0
+
+    def snapshot_step(self, works_count: int) -> int:
+        return max(1, works_count // (self._snapshots_count + 1))
+
+    def find(self, chromosome: ChromosomeType, assigned_parent_time: Time) \
+            -> tuple[list[SGSSnapshot], SGSSnapshot | None]:
+        """
+        Finds the latest state, that can be used to resume decoding of given chromosome
+
+        :return: the saved states up to the found one, that are valid for given chromosome, and the found state
+        """
+        border = chromosome[2]
+        key = spec_key(chromosome[3])
+        best_entry_id, best_index = None, -1
+        best_position = 0
+        for entry_id, entry in self._entries.items():
+            if entry.assigned_parent_time != assigned_parent_time or entry.spec_key != key \
+                    or entry.order.shape != chromosome[0].shape or not np.array_equal(entry.border, border):
+                continue
+            index = bisect_right(entry.positions, entry.common_prefix(chromosome)) - 1
+            if index >= 0 and entry.positions[index] > best_position:
+                best_entry_id, best_index = entry_id, index
+                best_position = entry.positions[index]
+
+        if best_entry_id is None:
+            return [], None
+
+        self._entries.move_to_end(best_entry_id)
+        self.restored += 1
+        snapshots = self._entries[best_entry_id].snapshots
+        return snapshots[:best_index + 1], snapshots[best_index]
+
+    def save(self, chromosome: ChromosomeType, assigned_parent_time: Time, snapshots: list[SGSSnapshot]):
+        """
+        Saves the states of decoding of given chromosome, evicting the least recently used chromosomes
+        """
+        if self._max_chromosomes <= 0 or not snapshots:
+            return
+        self._entries[self._next_entry_id] = _CheckpointsEntry(chromosome, assigned_parent_time, snapshots)
+        self._next_entry_id += 1
+        while len(self._entries) > self._max_chromosomes:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.restored = 0
@@ -0,0 +1,89 @@
+import numpy as np
+
+from sampo.api.genetic_api import ChromosomeType
+
+
+def narrowest_int_dtype(max_value: int) -> np.dtype:
+    """
+    Returns the narrowest signed integer dtype, that can hold values up to `max_value`
+    """
+    for dtype in (np.int16, np.int32):
+        if max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class ChromosomeLayout:
+    """
+    Compact encoding of chromosomes.
+    Array parts of chromosome (order, resources with contractors, contractor borders and zone statuses)
+    are views of one contiguous buffer of the narrowest integer dtype, that fits the problem dimensions.
+    The spec is shared by reference, because it isn't changed by genetic operators.
+    So the copy of the chromosome is the copy of one small buffer.
+    """
+
+    def __init__(self, works_count: int, resources_count: int, contractors_count: int, zones_count: int,
+                 max_value: int):
+        """
+        :param max_value: the maximum value of chromosome's genes, e.g. the maximum contractor's capacity
+        """
+        # values are doubled to leave the room for intermediate sums in operators
+        self.dtype = narrowest_int_dtype(2 * max(works_count, contractors_count, max_value))
+        self.shapes = ((works_count,),
+                       (works_count, resources_count + 1),
+                       (contractors_count, resources_count),
+                       (works_count, zones_count))
+        sizes = [int(np.prod(shape)) for shape in self.shapes]
+        self.offsets = np.concatenate(([0], np.cumsum(sizes))).tolist()
+        self.size = self.offsets[-1]
+
+    def _views(self, buffer: np.ndarray) -> tuple[np.ndarray, ...]:
+        return tuple(buffer[start:end].reshape(shape)
+                     for start, end, shape in zip(self.offsets, self.offsets[1:], self.shapes))
+
+    def is_packed(self, chromosome: ChromosomeType) -> bool:
+        """
+        Checks that array parts of chromosome are views of one buffer of this layout
+        """
+        buffer = chromosome[0].base
+        # arrays can be also backed by other objects, e.g. bytes of unpickled arrays
+        if not isinstance(buffer, np.ndarray) or buffer.dtype != self.dtype or buffer.shape != (self.size,):
+            return False
+        parts = (chromosome[0], chromosome[1], chromosome[2], chromosome[4])
+        return all(part.base is buffer and part.shape == shape for part, shape in zip(parts, self.shapes))
+
+    def pack(self, chromosome: ChromosomeType) -> ChromosomeType:
+        """
+        Converts the chromosome to the compact form, packed chromosome is returned as is
+        """
+        if self.is_packed(chromosome):
+            return tuple(chromosome)
+        buffer = np.empty(self.size, dtype=self.dtype)
+        order, resources, borders, zones = self._views(buffer)
+        order[:] = chromosome[0]
+        resources[:] = chromosome[1]
+        borders[:] = chromosome[2]
+        zones[:] = chromosome[4]
+        return order, resources, borders, chromosome[3], zones
+
+    def copy(self, chromosome: ChromosomeType) -> ChromosomeType:
+        """
+        Returns the compact copy of the chromosome, the spec is shared with the original
+        """
+        if not self.is_packed(chromosome):
+            return self.pack(chromosome)
+        return self.unpack(chromosome[0].base.copy(), chromosome[3])
+
+    def unpack(self, buffer: np.ndarray, spec) -> ChromosomeType:
+        """
+        Builds the chromosome from views of the given buffer of this layout
+        """
+        order, resources, borders, zones = self._views(buffer)
+        return order, resources, borders, spec, zones
+
+    @staticmethod
+    def buffer(chromosome: ChromosomeType) -> np.ndarray:
+        """
+        Returns the buffer of packed chromosome, e.g. to transfer the chromosome in one array
+        """
+        return chromosome[0].base
@@ -1,16 +1,21 @@
 import math
 import random
-from copy import deepcopy
+from functools import partial
 from operator import attrgetter
 from typing import Callable, Iterable
 
 import numpy as np
-from deap import base, tools
+from deap import base
 from deap.base import Toolbox
 
-from sampo.api.genetic_api import ChromosomeType, FitnessFunction, Individual
+from sampo.api.genetic_api import ChromosomeType, FitnessFunction, Individual, MakespanBound
 from sampo.scheduler.genetic.converter import (convert_schedule_to_chromosome, convert_chromosome_to_schedule,
-                                               ScheduleGenerationScheme)
+                                               ScheduleGenerationScheme, SerialSGSCheckpoints,
+                                               MakespanCutoffExceeded, makespan_tails, ArrayWorkerPool,
+                                               ArrayScheduledWorks, array_parallel_schedule_generation_scheme,
+                                               is_profile_sgs_applicable, profile_serial_schedule_generation_scheme)
+from sampo.scheduler.genetic.encoding import ChromosomeLayout
+from sampo.scheduler.genetic.pareto import non_dominated_ranks, crowding_distances
 from sampo.scheduler.topological.base import RandomizedTopologicalScheduler
 from sampo.scheduler.lft.base import RandomizedLFTScheduler
 from sampo.scheduler.utils import WorkerContractorPool
@@ -18,18 +23,17 @@ from sampo.schemas.contractor import Contractor
 from sampo.schemas.graph import GraphNode, WorkGraph
 from sampo.schemas.landscape import LandscapeConfiguration
 from sampo.schemas.resources import Worker
-from sampo.schemas.schedule import Schedule
+from sampo.schemas.schedule_evaluation import ScheduleEvaluation, ResourceUsageAccumulator
 from sampo.schemas.schedule_spec import ScheduleSpec
 from sampo.schemas.time import Time
 from sampo.schemas.time_estimator import WorkTimeEstimator, DefaultWorkEstimator
-from sampo.utilities.resource_usage import resources_peaks_sum, resources_costs_sum, resources_sum
 
 
 class TimeFitness(FitnessFunction):
     """
     Fitness function that relies on finish time.
     """
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) \
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) \
             -> tuple[int | float]:
         schedule = evaluator(chromosome)
         if schedule is None:
@@ -45,11 +49,12 @@ class SumOfResourcesPeaksFitness(FitnessFunction):
     def __init__(self, resources_names: Iterable[str] | None = None):
         self._resources_names = list(resources_names) if resources_names is not None else None
 
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) -> tuple[float]:
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) \
+            -> tuple[float]:
         schedule = evaluator(chromosome)
         if schedule is None:
             return (Time.inf().value, )
-        return (resources_peaks_sum(schedule, self._resources_names), )
+        return (schedule.resources_peaks_sum(self._resources_names), )
 
 
 class SumOfResourcesFitness(FitnessFunction):
@@ -60,11 +65,11 @@ class SumOfResourcesFitness(FitnessFunction):
     def __init__(self, resources_names: Iterable[str] | None = None):
         self._resources_names = list(resources_names) if resources_names is not None else None
 
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) -> float:
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) -> float:
         schedule = evaluator(chromosome)
         if schedule is None:
             return Time.inf().value
-        return resources_sum(schedule, self._resources_names)
+        return schedule.resources_sum(self._resources_names)
 
 
 class TimeWithResourcesFitness(FitnessFunction):
@@ -75,11 +80,11 @@ class TimeWithResourcesFitness(FitnessFunction):
     def __init__(self, resources_names: Iterable[str] | None = None):
         self._resources_names = list(resources_names) if resources_names is not None else None
 
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) -> float:
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) -> float:
         schedule = evaluator(chromosome)
         if schedule is None:
             return Time.inf().value
-        return schedule.execution_time.value + resources_peaks_sum(schedule, self._resources_names)
+        return schedule.execution_time.value + schedule.resources_peaks_sum(self._resources_names)
 
 
 class DeadlineResourcesFitness(FitnessFunction):
@@ -93,12 +98,12 @@ class DeadlineResourcesFitness(FitnessFunction):
         self._deadline = deadline
         self._resources_names = list(resources_names) if resources_names is not None else None
 
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) \
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) \
             -> tuple[int | float]:
         schedule = evaluator(chromosome)
         if schedule is None:
             return (Time.inf().value, )
-        return (resources_peaks_sum(schedule, self._resources_names) \
+        return (schedule.resources_peaks_sum(self._resources_names) \
                     * max(1.0, schedule.execution_time.value / self._deadline.value), )
 
 
@@ -113,12 +118,12 @@ class DeadlineCostFitness(FitnessFunction):
         self._deadline = deadline
         self._resources_names = list(resources_names) if resources_names is not None else None
 
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) \
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) \
             -> tuple[int | float]:
         schedule = evaluator(chromosome)
         if schedule is None:
             return (Time.inf().value, )
-        return (resources_costs_sum(schedule, self._resources_names) \
+        return (schedule.resources_costs_sum(self._resources_names) \
                 * max(1.0, schedule.execution_time.value / self._deadline.value), )
 
 
@@ -130,12 +135,12 @@ class TimeAndResourcesFitness(FitnessFunction):
     def __init__(self, resources_names: Iterable[str] | None = None):
         self._resources_names = list(resources_names) if resources_names is not None else None
 
-    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], Schedule]) \
+    def evaluate(self, chromosome: ChromosomeType, evaluator: Callable[[ChromosomeType], ScheduleEvaluation]) \
             -> tuple[int, int]:
         schedule = evaluator(chromosome)
         if schedule is None:
             return Time.inf().value, Time.inf().value
-        return schedule.execution_time.value, resources_peaks_sum(schedule, self._resources_names)
+        return schedule.execution_time.value, schedule.resources_peaks_sum(self._resources_names)
 
 
 def init_toolbox(wg: WorkGraph,
@@ -175,7 +180,12 @@ def init_toolbox(wg: WorkGraph,
     :return: Object, included tools for genetic algorithm
     """
     toolbox = base.Toolbox()
-    toolbox.register('register_individual_constructor', register_individual_constructor, toolbox=toolbox)
+    # chromosomes are packed into compact buffers, see `ChromosomeLayout`
+    layout = ChromosomeLayout(len(node_indices), len(worker_name2index), len(contractor2index),
+                              len(landscape.zone_config.start_statuses),
+                              max(int(contractor_borders.max(initial=0)), statuses_available))
+    toolbox.register('register_individual_constructor', register_individual_constructor, toolbox=toolbox,
+                     layout=layout)
     toolbox.register_individual_constructor(fitness_weights)
     # generate chromosome
     toolbox.register('generate_chromosome', generate_chromosome, wg=wg, contractors=contractors,
@@ -190,7 +200,7 @@ def init_toolbox(wg: WorkGraph,
                      init_chromosomes=init_chromosomes, rand=rand, work_estimator=work_estimator, landscape=landscape,
                      only_lft_initialization=only_lft_initialization, toolbox=toolbox)
     # selection
-    selection = tools.selNSGA2 if is_multiobjective else select_new_population
+    selection = select_nsga2 if is_multiobjective else select_new_population
     toolbox.register('select', selection, k=selection_size)
     # combined crossover
     toolbox.register('mate', mate, rand=rand, toolbox=toolbox)
@@ -211,47 +221,141 @@ def init_toolbox(wg: WorkGraph,
     # mutation for resource borders
     toolbox.register('mutate_resource_borders', mutate_resource_borders, contractor_borders=contractor_borders,
                      mutpb=mut_res_pb, rand=rand)
+    # population versions of operators
+    works_count = len(node_indices)
+    np_rand = np.random.default_rng(rand.getrandbits(64))
+    # the generator is exposed to save and restore its state in checkpoints
+    toolbox.register('np_rand', lambda: np_rand)
+    toolbox.register('mate_population', mate_population, rand=np_rand)
+    toolbox.register('mutate_population', mutate_population, resources_border=resources_border,
+                     parents=build_adjacency_arrays(parents, works_count),
+                     children=build_adjacency_arrays(children, works_count),
+                     order_mutpb=mut_order_pb, res_mutpb=mut_res_pb, rand=np_rand)
+    toolbox.register('mutate_resource_borders_population', mutate_resource_borders_population,
+                     contractor_borders=contractor_borders, mutpb=mut_res_pb, rand=np_rand)
     toolbox.register('mate_post_zones', mate_for_zones, rand=rand, toolbox=toolbox)
     toolbox.register('mutate_post_zones', mutate_for_zones, rand=rand, mutpb=mut_zone_pb,
                      statuses_available=landscape.zone_config.statuses.statuses_available())
 
-    toolbox.register('validate', is_chromosome_correct, node_indices=node_indices, parents=parents,
+    toolbox.register('validate', is_chromosome_correct, node_indices=node_indices,
+                     precedence=build_precedence_arrays(parents, works_count), contractor_borders=contractor_borders)
+    # order operators keep orders topologically correct, so only contractors are checked before evaluation
+    toolbox.register('validate_contractors', is_chromosome_contractors_correct, work_indices=node_indices,
                      contractor_borders=contractor_borders)
     toolbox.register('schedule_to_chromosome', convert_schedule_to_chromosome,
                      work_id2index=work_id2index, worker_name2index=worker_name2index,
                      contractor2index=contractor2index, contractor_borders=contractor_borders, spec=spec,
                      landscape=landscape)
-    toolbox.register('evaluate_chromosome', evaluate, wg=wg, toolbox=toolbox)
+    # inseparable sons are not presented in chromosome, so they are indexed after all the chromosome works
+    evaluation_work_id2index = dict(work_id2index)
+    for node in wg.nodes:
+        if node.id not in evaluation_work_id2index:
+            evaluation_work_id2index[node.id] = len(evaluation_work_id2index)
+    # only chromosomes evaluation resumes decoding from saved states,
+    # final schedules are always built by the full replay
+    checkpoints = SerialSGSCheckpoints() if sgs_type is ScheduleGenerationScheme.IncrementalSerial else None
+    # parallel and serial schemes evaluate chromosomes by their array-backed versions, that give the same schedules
+    array_sgs = None
+    if sgs_type is ScheduleGenerationScheme.Parallel:
+        array_sgs = partial(array_parallel_schedule_generation_scheme,
+                            array_pool=ArrayWorkerPool(worker_pool_indices, len(contractor2index),
+                                                       len(worker_name2index)),
+                            index2node=index2node, index2contractor=index2contractor_obj, landscape=landscape,
+                            assigned_parent_time=assigned_parent_time, work_estimator=work_estimator)
+    # serial scheme is evaluated by the integer resource profiles, if there are no zones and materials
+    elif sgs_type is ScheduleGenerationScheme.Serial and is_profile_sgs_applicable(wg.nodes, landscape):
+        array_sgs = partial(profile_serial_schedule_generation_scheme,
+                            array_pool=ArrayWorkerPool(worker_pool_indices, len(contractor2index),
+                                                       len(worker_name2index)),
+                            index2node=index2node, index2contractor=index2contractor_obj,
+                            assigned_parent_time=assigned_parent_time, work_estimator=work_estimator)
+    toolbox.register('evaluate_chromosome', evaluate, work_id2index=evaluation_work_id2index,
+                     worker_name2index=worker_name2index, contractor2index=contractor2index,
+                     checkpoints=checkpoints, tails=makespan_tails(wg.nodes, worker_pool, work_estimator),
+                     array_sgs=array_sgs, toolbox=toolbox)
+    toolbox.register('evaluate_fitness', evaluate_fitness, toolbox=toolbox)
     toolbox.register('chromosome_to_schedule', convert_chromosome_to_schedule, worker_pool=worker_pool,
                      index2node=index2node, index2contractor=index2contractor_obj,
                      worker_pool_indices=worker_pool_indices, assigned_parent_time=assigned_parent_time,
                      work_estimator=work_estimator, worker_name2index=worker_name2index,
                      contractor2index=contractor2index, index2zone=index2zone,
                      landscape=landscape, sgs_type=sgs_type)
-    toolbox.register('copy_individual', copy_individual, toolbox=toolbox)
+    toolbox.register('copy_individual', copy_individual, toolbox=toolbox, layout=layout)
 
     return toolbox
 
 
-def evaluate(chromosome: ChromosomeType, wg: WorkGraph, toolbox: Toolbox) -> Schedule | None:
-    if toolbox.validate(chromosome):
-        sworks = toolbox.chromosome_to_schedule(chromosome)[0]
-        return Schedule.from_scheduled_works(sworks.values(), wg)
+def evaluate(chromosome: ChromosomeType, work_id2index: dict[str, int], worker_name2index: dict[str, int],
+             contractor2index: dict[str, int], toolbox: Toolbox,
+             checkpoints: SerialSGSCheckpoints | None = None,
+             tails: dict[GraphNode, int] | None = None,
+             cutoff: int | None = None,
+             array_sgs: Callable[..., ArrayScheduledWorks] | None = None) -> ScheduleEvaluation | None:
+    """
+    Decodes the chromosome into lightweight `ScheduleEvaluation`.
+    Building of the full `Schedule` is avoided here, it is needed only for the final solutions.
+
+    :param work_id2index: mapping of all the graph works (including inseparable sons) to their indices
+    :param checkpoints: store of decoding states for incremental serial scheme
+    :param tails: lower bounds of time from works' finish to the project finish
+    :param cutoff: if passed, `MakespanCutoffExceeded` is raised as soon as the makespan is proven to exceed it
+    :param array_sgs: if passed, array-backed schedule generation scheme used instead of `chromosome_to_schedule`,
+    if it doesn't support the chromosome, it should return None before placing works
+    """
+    if toolbox.validate_contractors(chromosome):
+        # resource usage is collected while works are placed
+        accumulator = ResourceUsageAccumulator(work_id2index, worker_name2index, contractor2index)
+        if array_sgs is not None:
+            works = array_sgs(chromosome, cutoff=cutoff, tails=tails, accumulator=accumulator)
+            # scheduled works are materialized only if the schedule is requested
+            if works is not None:
+                return accumulator.to_evaluation(works)
+        sworks = toolbox.chromosome_to_schedule(chromosome, checkpoints=checkpoints, cutoff=cutoff, tails=tails,
+                                                accumulator=accumulator)[0]
+        return accumulator.to_evaluation(sworks.values())
     else:
         return None
 
 
-def register_individual_constructor(fitness_weights: tuple[int | float, ...], toolbox: base.Toolbox):
+def evaluate_fitness(fitness: FitnessFunction, chromosome: ChromosomeType, toolbox: Toolbox,
+                     cutoff: int | None = None) -> tuple[int | float]:
+    """
+    Computes fitness value of the chromosome.
+    If makespan `cutoff` is passed, the decoding of chromosome is aborted as soon as its makespan
+    is proven to exceed the cutoff, and `MakespanBound` is returned.
+    It is valid only for fitness functions, that are equal to the makespan.
+    """
+    if cutoff is None:
+        return fitness.evaluate(chromosome, toolbox.evaluate_chromosome)
+    try:
+        return fitness.evaluate(chromosome, partial(toolbox.evaluate_chromosome, cutoff=cutoff))
+    except MakespanCutoffExceeded as e:
+        return MakespanBound((e.lower_bound,))
+
+
+def register_individual_constructor(fitness_weights: tuple[int | float, ...], toolbox: base.Toolbox,
+                                    layout: ChromosomeLayout | None = None):
     class IndividualFitness(base.Fitness):
         weights = fitness_weights
 
-    toolbox.register('Individual', Individual.prepare(IndividualFitness))
+    constructor = Individual.prepare(IndividualFitness)
+    if layout is not None:
+        constructor = partial(_packed_individual, constructor=constructor, layout=layout)
+    toolbox.register('Individual', constructor)
 
 
-def copy_individual(ind: Individual, toolbox: Toolbox) -> Individual:
-    return toolbox.Individual(
-        (ind[0].copy(), ind[1].copy(), ind[2].copy(), deepcopy(ind[3]), ind[4].copy())
-    )
+def _packed_individual(chromosome: ChromosomeType, constructor: Callable[[ChromosomeType], Individual],
+                       layout: ChromosomeLayout) -> Individual:
+    return constructor(layout.pack(chromosome))
+
+
+def copy_individual(ind: Individual, toolbox: Toolbox, layout: ChromosomeLayout | None = None) -> Individual:
+    """
+    Copies the chromosome of individual, the spec is shared with the original, because operators don't change it
+    """
+    if layout is not None:
+        return toolbox.Individual(layout.copy(ind))
+    return toolbox.Individual((ind[0].copy(), ind[1].copy(), ind[2].copy(), ind[3], ind[4].copy()))
 
 
 def generate_chromosomes(n: int,
@@ -379,12 +483,37 @@ def select_new_population(population: list[Individual], k: int) -> list[Individu
     return population[:k]
 
 
-def is_chromosome_correct(ind: Individual, node_indices: list[int], parents: dict[int, set[int]],
+def select_nsga2(population: list[Individual], k: int) -> list[Individual]:
+    """
+    NSGA-II selection operator for multiobjective genetic algorithm, the replacement of `deap.tools.selNSGA2`.
+    Individuals are taken by non-dominated fronts, the last taken front is truncated by crowding distance.
+    Fronts are sorted in O(N log N) for two objectives, see `non_dominated_ranks`.
+    """
+    if k >= len(population):
+        return list(population)
+    # fitness weights turn all objectives into minimized ones
+    points = -np.array([ind.fitness.wvalues for ind in population], dtype=float)
+    ranks = non_dominated_ranks(points)
+
+    # stable sorting keeps the order of population inside fronts
+    order = np.argsort(ranks, kind='stable')
+    last_rank = ranks[order[k - 1]]
+    chosen = order[ranks[order] < last_rank]
+    last_front = order[ranks[order] == last_rank]
+    distances = crowding_distances(points[last_front])
+    # the most distant individuals of the last front first
+    last_front = last_front[np.argsort(-distances, kind='stable')]
+    return [population[i] for i in chosen] + [population[i] for i in last_front[:k - len(chosen)]]
+
+
+def is_chromosome_correct(ind: Individual, node_indices: list[int], precedence: tuple[np.ndarray, np.ndarray],
                           contractor_borders: np.ndarray) -> bool:
     """
     Check correctness of works order and contractors borders.
+
+    :param precedence: `build_precedence_arrays` form of works' parents
     """
-    return is_chromosome_order_correct(ind, parents) and \
+    return bool(is_population_order_correct(ind[0][None, :], precedence)[0]) and \
         is_chromosome_contractors_correct(ind, node_indices, contractor_borders)
 
 
@@ -392,14 +521,35 @@ def is_chromosome_order_correct(ind: Individual, parents: dict[int, set[int]]) -
     """
     Checks that assigned order of works are topologically correct.
     """
-    work_order = ind[0]
-    used = set()
-    for work_index in work_order:
-        used.add(work_index)
-        if not parents[work_index].issubset(used):
-            # logger.error(f'Order validation failed: {work_order}')
-            return False
-    return True
+    return bool(is_population_order_correct(ind[0][None, :], build_precedence_arrays(parents, len(ind[0])))[0])
+
+
+def build_precedence_arrays(parents: dict[int, set[int]], works_count: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts mapping of works to their parents to the arrays of parents and children of all precedence relations
+
+    :return: parent and child works of each relation
+    """
+    indptr, indices = build_adjacency_arrays(parents, works_count)
+    return indices, np.repeat(np.arange(works_count), np.diff(indptr))
+
+
+def is_population_order_correct(orders: np.ndarray, precedence: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Vectorized check, that orders are permutations of works, where each work is placed after all its parents.
+    Order operators keep orders correct by construction, so it's needed only for orders of other origin
+    and for debugging.
+
+    :param orders: population x works tensor of scheduling orders
+    :param precedence: `build_precedence_arrays` form of works' parents
+    :return: correctness of each order
+    """
+    n, works_count = orders.shape
+    is_permutation = (np.sort(orders, axis=1) == np.arange(works_count)).all(axis=1)
+    positions = np.zeros_like(orders)
+    positions[np.arange(n)[:, None], orders] = np.arange(works_count)
+    parent_works, child_works = precedence
+    return is_permutation & (positions[:, parent_works] < positions[:, child_works]).all(axis=1)
 
 
 def is_chromosome_contractors_correct(ind: Individual, work_indices: Iterable[int],
@@ -490,6 +640,8 @@ def mutate_scheduling_order(ind: Individual, mutpb: float, rand: random.Random,
                             parents: dict[int, set[int]], children: dict[int, set[int]]) -> Individual:
     """
     Mutation operator for works scheduling order.
+    Each selected work is moved to the random position between its last parent and its first child,
+    so the topologically correct order stays correct.
 
     :param ind: the individual to be mutated
     :param mutpb: probability of gene mutation
@@ -500,49 +652,42 @@ def mutate_scheduling_order(ind: Individual, mutpb: float, rand: random.Random,
     :return: mutated individual
     """
     order = ind[0]
+    works_count = len(order)
     # number of possible mutations = number of works except start and finish works
-    num_possible_muts = len(order) - 2
+    num_possible_muts = works_count - 2
     # generate mask of works to mutate based on mutation probability
     mask = np.array([rand.random() < mutpb for _ in range(num_possible_muts)])
     if mask.any():
-        # get indexes of works to mutate based on generated mask
+        # positions of works in the order
+        positions = np.empty_like(order)
+        positions[order] = np.arange(works_count)
         # +1 because start work was not taken into account in mask generation
-        indexes_of_works_to_mutate = np.where(mask)[0] + 1
+        works_to_mutate = order[np.where(mask)[0] + 1]
         # shuffle order of mutations
-        rand.shuffle(indexes_of_works_to_mutate)
-        # get works to mutate based on shuffled indexes
-        works_to_mutate = order[indexes_of_works_to_mutate]
+        rand.shuffle(works_to_mutate)
         for work in works_to_mutate:
-            # pop index of the current work
-            i, indexes_of_works_to_mutate = indexes_of_works_to_mutate[0], indexes_of_works_to_mutate[1:]
-            # find max index of parent of the current work
-            # +1 because insertion should be righter
-            i_parent = np.max(np.where(np.isin(order[:i], list(parents[work]), assume_unique=True))[0],
-                              initial=i - 1) + 1
-            # find min index of child of the current work
-            # +i because the slice [i + 1:] was taken, and +1 is not needed because these indexes will be shifted left
-            # after current work deletion
-            i_children = np.min(np.where(np.isin(order[i + 1:], list(children[work]), assume_unique=True))[0],
-                                initial=0) + i
-            if i_parent == i_children:
-                # if child and parent indexes are equal then no mutation can be done
+            i = positions[work]
+            # the work should stay after all its parents and before all its children,
+            # start and finish works are not moved
+            i_parent = max((positions[parent] for parent in parents[work] if parent != work), default=0) + 1
+            i_children = min(min((positions[child] for child in children[work] if child != work),
+                                 default=works_count - 1) - 1, works_count - 2)
+            # range potential indexes to insert the current work
+            choices = np.concatenate((np.arange(max(i_parent, 1), i), np.arange(i + 1, i_children + 1)))
+            if len(choices) == 0:
                 continue
+            # set weights to potential indexes based on their distance from the current one
+            weights = 1 / np.abs(choices - i)
+            # generate new index for the current work
+            new_i = rand.choices(choices, weights=weights)[0]
+            # shift works between the current and the new positions and update their positions
+            if new_i < i:
+                order[new_i + 1:i + 1] = order[new_i:i]
             else:
-                # shift work indexes (which are to the right of the current index) to the left
-                # after the current work deletion
-                indexes_of_works_to_mutate[indexes_of_works_to_mutate > i] -= 1
-                # range potential indexes to insert the current work
-                choices = np.concatenate((np.arange(i_parent, i), np.arange(i + 1, i_children + 1)))
-                # set weights to potential indexes based on their distance from the current one
-                weights = 1 / np.abs(choices - i)
-                # generate new index for the current work
-                new_i = rand.choices(choices, weights=weights)[0]
-                # delete current work from current index, insert in new generated index and update scheduling order
-                # in chromosome
-                order[:] = np.insert(np.delete(order, i), new_i, work)
-                # shift work indexes (which are to the right or equal to the new index) to the right
-                # after the current work insertion in new generated index
-                indexes_of_works_to_mutate[indexes_of_works_to_mutate >= new_i] += 1
+                order[i:new_i] = order[i + 1:new_i + 1]
+            order[new_i] = work
+            low, high = min(i, new_i), max(i, new_i)
+            positions[order[low:high + 1]] = np.arange(low, high + 1)
 
     return ind
 
@@ -815,3 +960,292 @@ def mutate_for_zones(ind: Individual, mutpb: float, rand: random.Random, statuse
         zones[mask] = new_zones
 
     return ind
+
+
+def build_adjacency_arrays(neighbours: dict[int, set[int]], works_count: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts mapping of works to their neighbours (parents or children) to the compressed sparse row form,
+    that is used by population operators. Neighbours of work `i` are `indices[indptr[i]:indptr[i + 1]]`.
+
+    :return: indptr and indices arrays
+    """
+    # inseparable chains are collapsed into one work, so the work can be a neighbour of itself
+    neighbours_lists = [sorted(neighbours.get(work, set()) - {work}) for work in range(works_count)]
+    indptr = np.zeros(works_count + 1, dtype=int)
+    indptr[1:] = np.cumsum([len(work_neighbours) for work_neighbours in neighbours_lists])
+    indices = np.array([neighbour for work_neighbours in neighbours_lists for neighbour in work_neighbours],
+                       dtype=int)
+    return indptr, indices
+
+
+def stack_population(population: list[ChromosomeType]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stacks order, resources and resource borders parts of chromosomes into population tensors
+    of shapes (population x works), (population x works x resources) and (population x contractors x resources)
+    """
+    return (np.stack([chromosome[0] for chromosome in population]),
+            np.stack([chromosome[1] for chromosome in population]),
+            np.stack([chromosome[2] for chromosome in population]))
+
+
+def sample_shifts(left: np.ndarray, right: np.ndarray, rand: np.random.Generator) -> np.ndarray:
+    """
+    Vectorized choice of the new value used by population mutations.
+    For each element chooses non-zero shift from the interval [-left, right]
+    with weights inversely proportional to the shift's absolute value, as `mutate_values` does.
+    All the intervals should be non-empty.
+    """
+    max_shift = max(left.max(initial=0), right.max(initial=0))
+    # harmonic[k] is the total weight of shifts 1..k
+    harmonic = np.concatenate(([0], np.cumsum(1 / np.arange(1, max_shift + 1))))
+    left_weights = harmonic[left]
+    points = rand.random(len(left)) * (left_weights + harmonic[right])
+    is_left = points < left_weights
+    shifts = np.searchsorted(harmonic, np.where(is_left, points, points - left_weights), side='right')
+    # protect from float rounding on the borders of intervals
+    shifts = np.minimum(shifts, np.where(is_left, left, right))
+    return np.where(is_left, -shifts, shifts)
+
+
+def mutate_values_population(values: np.ndarray, masks: np.ndarray, low_borders: np.ndarray,
+                             up_borders: np.ndarray, rand: np.random.Generator) -> None:
+    """
+    Vectorized version of `mutate_values` working on the population tensor.
+    Changes values selected by `masks` to the new ones from the interval given by borders.
+    """
+    current = values[masks]
+    left = np.maximum(current - low_borders[masks], 0)
+    right = np.maximum(up_borders[masks] - current, 0)
+    # values which interval contains only the current value can't be mutated
+    movable = left + right > 0
+    current[movable] += sample_shifts(left[movable], right[movable], rand)
+    values[masks] = current
+
+
+def two_point_order_crossover_population(children: np.ndarray, other_parents: np.ndarray, min_mating_amount: int,
+                                         rand: np.random.Generator) -> np.ndarray:
+    """
+    Vectorized version of `two_point_order_crossover`, mates each row of `children` with the row of `other_parents`.
+    """
+    n, works_count = children.shape
+    rows = np.arange(n)[:, None]
+    mating_amount = rand.integers(min_mating_amount, 3 * min_mating_amount, size=n, endpoint=True)
+    is_mated = mating_amount > 1
+    crossover_head_point = rand.integers(1, np.maximum(mating_amount, 2))
+    crossover_tail_point = mating_amount - crossover_head_point
+    # not mated children keep all their works
+    crossover_head_point[~is_mated] = works_count
+    crossover_tail_point[~is_mated] = 0
+
+    positions = np.arange(works_count)[None, :]
+    is_kept_position = (positions < crossover_head_point[:, None]) \
+        | (positions >= works_count - crossover_tail_point[:, None])
+    is_kept_work = np.zeros_like(is_kept_position)
+    is_kept_work[rows, children] = is_kept_position
+    # the number of not kept works of other parent is equal to the mating part length in each row,
+    # so row-major order of boolean indexing puts them into the right rows
+    children[~is_kept_position] = other_parents[~is_kept_work[rows, other_parents]]
+
+    return children
+
+
+def mate_resources_population(resources1: np.ndarray, resources2: np.ndarray,
+                              borders1: np.ndarray, borders2: np.ndarray,
+                              optimize_resources: bool, rand: np.random.Generator) -> None:
+    """
+    Vectorized version of `mate_resources`, mates in place each pair of rows of given tensors.
+    """
+    n, works_count = resources1.shape[:2]
+    min_mating_amount = works_count // 4
+    cxpoints = rand.integers(min_mating_amount, works_count - min_mating_amount, size=n, endpoint=True)
+    # random positions of each row are the first `cxpoint` ones in the random permutation
+    mate_mask = rand.random((n, works_count)).argsort(axis=1).argsort(axis=1) < cxpoints[:, None]
+
+    resources1[mate_mask], resources2[mate_mask] = resources2[mate_mask], resources1[mate_mask]
+
+    if optimize_resources:
+        rows = np.broadcast_to(np.arange(n)[:, None], mate_mask.shape)[mate_mask]
+        max_borders = np.maximum(borders1, borders2)
+        for resources, borders in ((resources1, borders1), (resources2, borders2)):
+            mated_contractors = np.zeros(borders.shape[:2], dtype=bool)
+            mated_contractors[rows, resources[mate_mask][:, -1]] = True
+            borders[mated_contractors] = max_borders[mated_contractors]
+
+
+def mate_population(orders: np.ndarray, resources: np.ndarray, borders: np.ndarray, optimize_resources: bool,
+                    rand: np.random.Generator) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Population version of `mate`. Individuals are mated in pairs of neighbouring rows,
+    the last individual of odd-sized population is skipped.
+
+    :param orders: population x works tensor of scheduling orders
+    :param resources: population x works x (resources + 1) tensor of assigned resources and contractors
+    :param borders: population x contractors x resources tensor of contractors' resource borders
+    :param optimize_resources: if True resource borders should be changed after mating
+    :param rand: the rand object used for randomized operations
+
+    :return: tensors of children, two children of each pair are placed in neighbouring rows
+    """
+    pairs_count = len(orders) // 2
+    first, second = slice(0, 2 * pairs_count, 2), slice(1, 2 * pairs_count, 2)
+
+    children_orders = orders[:2 * pairs_count].copy()
+    children_resources = resources[:2 * pairs_count].copy()
+    children_borders = borders[:2 * pairs_count].copy()
+
+    min_mating_amount = orders.shape[1] // 4
+    children_orders[first] = two_point_order_crossover_population(children_orders[first], orders[second],
+                                                                  min_mating_amount, rand)
+    children_orders[second] = two_point_order_crossover_population(children_orders[second], orders[first],
+                                                                   min_mating_amount, rand)
+
+    # strided slices are views, so children tensors are mated in place
+    mate_resources_population(children_resources[first], children_resources[second],
+                              children_borders[first], children_borders[second], optimize_resources, rand)
+
+    return children_orders, children_resources, children_borders
+
+
+def mutate_scheduling_order_population(orders: np.ndarray, mutpb: float, rand: np.random.Generator,
+                                       parents: tuple[np.ndarray, np.ndarray],
+                                       children: tuple[np.ndarray, np.ndarray]) -> None:
+    """
+    Population version of `mutate_scheduling_order`, mutates orders in place.
+    Each selected work is moved to the random position between its last parent and its first child.
+    Mutations of all the individuals are done simultaneously, one work of each individual at a time.
+
+    :param orders: population x works tensor of scheduling orders
+    :param mutpb: probability of gene mutation
+    :param rand: the rand object used for randomized operations
+    :param parents: `build_adjacency_arrays` form of works' parents
+    :param children: `build_adjacency_arrays` form of works' children
+    """
+    n, works_count = orders.shape
+    if works_count <= 2:
+        return
+    position_indices = np.arange(works_count)
+    positions = np.empty_like(orders)
+    positions[np.arange(n)[:, None], orders] = position_indices
+
+    # start and finish works are not mutated
+    mask = np.zeros(orders.shape, dtype=bool)
+    mask[:, 1:-1] = rand.random((n, works_count - 2)) < mutpb
+    # shuffle order of mutations
+    shuffle_keys = np.where(mask, rand.random(orders.shape), np.inf)
+    works_to_mutate = np.take_along_axis(orders, shuffle_keys.argsort(axis=1), axis=1)
+    mutations_count = mask.sum(axis=1)
+
+    def neighbours_positions(adjacency: tuple[np.ndarray, np.ndarray], individuals: np.ndarray,
+                             works: np.ndarray, reduce: np.ufunc, initial: int) -> np.ndarray:
+        indptr, indices = adjacency
+        starts = indptr[works]
+        degrees = indptr[works + 1] - starts
+        owners = np.repeat(np.arange(len(works)), degrees)
+        neighbours = indices[np.arange(degrees.sum()) + np.repeat(starts - (np.cumsum(degrees) - degrees), degrees)]
+        result = np.full(len(works), initial)
+        reduce.at(result, owners, positions[individuals[owners], neighbours])
+        return result
+
+    for step in range(mutations_count.max(initial=0)):
+        individuals = np.flatnonzero(mutations_count > step)
+        works = works_to_mutate[individuals, step]
+        i = positions[individuals, works]
+        # the work should stay after all its parents and before all its children
+        i_parent = np.maximum(neighbours_positions(parents, individuals, works, np.maximum, 0) + 1, 1)
+        i_children = np.minimum(neighbours_positions(children, individuals, works, np.minimum, works_count) - 1,
+                                works_count - 2)
+        left, right = np.maximum(i - i_parent, 0), np.maximum(i_children - i, 0)
+
+        movable = left + right > 0
+        individuals, i = individuals[movable], i[movable]
+        new_i = i + sample_shifts(left[movable], right[movable], rand)
+
+        # move the work from position `i` to `new_i` shifting works between them
+        new_positions = np.broadcast_to(position_indices, (len(individuals), works_count)).copy()
+        new_positions -= (position_indices > new_i[:, None]) & (position_indices <= i[:, None])
+        new_positions += (position_indices >= i[:, None]) & (position_indices < new_i[:, None])
+        new_positions[np.arange(len(individuals)), new_i] = i
+
+        orders[individuals] = np.take_along_axis(orders[individuals], new_positions, axis=1)
+        positions[individuals[:, None], orders[individuals]] = position_indices
+
+
+def mutate_resources_population(resources: np.ndarray, borders: np.ndarray, mutpb: float,
+                                rand: np.random.Generator, resources_border: np.ndarray) -> None:
+    """
+    Population version of `mutate_resources`, mutates resources in place.
+
+    :param resources: population x works x (resources + 1) tensor of assigned resources and contractors
+    :param borders: population x contractors x resources tensor of contractors' resource borders
+    :param mutpb: probability of gene mutation
+    :param rand: the rand object used for randomized operations
+    :param resources_border: low and up borders of resources amounts
+    """
+    n, works_count = resources.shape[:2]
+    rows = np.arange(n)[:, None]
+    contractors = resources[:, :, -1]
+    workers = resources[:, :, :-1]
+
+    num_contractors = borders.shape[1]
+    if num_contractors > 1:
+        mask = rand.random((n, works_count)) < mutpb
+        new_contractors = rand.integers(0, num_contractors, size=(n, works_count))
+        # new contractor should be able to supply assigned workers
+        mask &= (workers <= borders[rows, new_contractors]).all(axis=2)
+        contractors[mask] = new_contractors[mask]
+
+    masks = rand.random(workers.shape) < mutpb
+    # up borders are the minimum of work's maximum and assigned contractor's borders
+    res_up_borders = np.minimum(resources_border[1].T.astype(int), borders[rows, contractors])
+    res_low_borders = np.broadcast_to(resources_border[0].T.astype(int), res_up_borders.shape)
+    masks &= res_up_borders != res_low_borders
+
+    mutate_values_population(workers, masks, res_low_borders, res_up_borders, rand)
+
+
+def mutate_population(orders: np.ndarray, resources: np.ndarray, borders: np.ndarray,
+                      resources_border: np.ndarray, parents: tuple[np.ndarray, np.ndarray],
+                      children: tuple[np.ndarray, np.ndarray], order_mutpb: float, res_mutpb: float,
+                      rand: np.random.Generator) -> None:
+    """
+    Population version of `mutate`, mutates given tensors in place.
+
+    :param orders: population x works tensor of scheduling orders
+    :param resources: population x works x (resources + 1) tensor of assigned resources and contractors
+    :param borders: population x contractors x resources tensor of contractors' resource borders
+    :param resources_border: low and up borders of resources amounts
+    :param parents: `build_adjacency_arrays` form of works' parents
+    :param children: `build_adjacency_arrays` form of works' children
+    :param order_mutpb: probability of order's gene mutation
+    :param res_mutpb: probability of resources' gene mutation
+    :param rand: the rand object used for randomized operations
+    """
+    mutate_scheduling_order_population(orders, order_mutpb, rand, parents, children)
+    mutate_resources_population(resources, borders, res_mutpb, rand, resources_border)
+
+
+def mutate_resource_borders_population(resources: np.ndarray, borders: np.ndarray, mutpb: float,
+                                       rand: np.random.Generator, contractor_borders: np.ndarray) -> None:
+    """
+    Population version of `mutate_resource_borders`, mutates borders in place.
+
+    :param resources: population x works x (resources + 1) tensor of assigned resources and contractors
+    :param borders: population x contractors x resources tensor of contractors' resource borders
+    :param mutpb: probability of gene mutation
+    :param rand: the rand object used for randomized operations
+    :param contractor_borders: up borders of contractors capacity
+    """
+    rows = np.broadcast_to(np.arange(len(resources))[:, None], resources.shape[:2])
+    contractors = resources[:, :, -1]
+    # low borders are the maximum of resources assigned to contractor's works
+    contractor_low_borders = np.zeros_like(borders)
+    np.maximum.at(contractor_low_borders, (rows, contractors), resources[:, :, :-1])
+    # only contractors assigned to works are mutated
+    is_used = np.zeros(borders.shape[:2], dtype=bool)
+    is_used[rows, contractors] = True
+    contractor_up_borders = np.broadcast_to(contractor_borders, borders.shape)
+
+    masks = (rand.random(borders.shape) < mutpb) & is_used[:, :, None] \
+        & (contractor_up_borders != contractor_low_borders)
+
+    mutate_values_population(borders, masks, contractor_low_borders, contractor_up_borders, rand)
@@ -0,0 +1,192 @@
+from bisect import bisect_left
+from copy import deepcopy
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from sampo.api.genetic_api import Individual
+
+
+def dominates(first: tuple[float, ...], second: tuple[float, ...]) -> bool:
+    """
+    Checks that the first point dominates the second one, both are minimized
+    """
+    not_equal = False
+    for first_value, second_value in zip(first, second):
+        if first_value > second_value:
+            return False
+        if first_value < second_value:
+            not_equal = True
+    return not_equal
+
+
+class ParetoArchive:
+    """
+    Archive of non-dominated individuals, it replaces `deap.tools.ParetoFront`.
+    Individuals with equal fitness values are twins, only the first of them is kept.
+
+    Points are kept sorted lexicographically from the best to the worst, so the new point
+    can be dominated only by the points before its position and can dominate only the points after it.
+    For one and two objectives the sorted front is monotone by the last objective,
+    so only the neighbours of the position are checked, and the update is logarithmic.
+    """
+
+    def __init__(self):
+        self.items: list[Individual] = []
+        # minimized fitness values of items
+        self._keys: list[tuple[float, ...]] = []
+        self._key_set: set[tuple[float, ...]] = set()
+
+    @staticmethod
+    def _key(ind: Individual) -> tuple[float, ...]:
+        return tuple(-value for value in ind.fitness.wvalues)
+
+    def update(self, population: Iterable[Individual]):
+        """
+        Inserts non-dominated individuals of the population and removes individuals, dominated by them
+        """
+        for ind in population:
+            self.insert(ind)
+
+    def insert(self, ind: Individual) -> bool:
+        """
+        Inserts the copy of individual, if it isn't dominated and has no twin in the archive
+
+        :return: True if the individual is inserted
+        """
+        key = self._key(ind)
+        if key in self._key_set:
+            return False
+
+        position = bisect_left(self._keys, key)
+        if len(key) <= 2:
+            if position > 0 and dominates(self._keys[position - 1], key):
+                return False
+            end = position
+            while end < len(self._keys) and dominates(key, self._keys[end]):
+                end += 1
+            removed = range(position, end)
+        else:
+            if any(dominates(other, key) for other in self._keys[:position]):
+                return False
+            removed = [i for i in range(position, len(self._keys)) if dominates(key, self._keys[i])]
+
+        for i in reversed(removed):
+            self._key_set.discard(self._keys[i])
+            del self._keys[i]
+            del self.items[i]
+
+        self._keys.insert(position, key)
+        self._key_set.add(key)
+        self.items.insert(position, deepcopy(ind))
+        return True
+
+    def restore(self, items: list[Individual]):
+        """
+        Replaces the content of the archive with given items, that are mutually non-dominated and sorted
+        from the best to the worst, e.g. the items of the saved archive
+        """
+        self.items = list(items)
+        self._keys = [self._key(ind) for ind in self.items]
+        self._key_set = set(self._keys)
+
+    def clear(self):
+        self.items.clear()
+        self._keys.clear()
+        self._key_set.clear()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, i: int) -> Individual:
+        return self.items[i]
+
+    def __iter__(self) -> Iterator[Individual]:
+        return iter(self.items)
+
+    def __reversed__(self) -> Iterator[Individual]:
+        return reversed(self.items)
+
+    def __str__(self) -> str:
+        return str(self.items)
+
+
+def non_dominated_ranks(points: np.ndarray) -> np.ndarray:
+    """
+    Computes the index of non-dominated front of each point, all objectives are minimized.
+    Equal points get the same front.
+    Two objectives are sorted by the sweep in O(N log N), more objectives by vectorized dominance checks.
+
+    :param points: points count x objectives count matrix
+    :return: front indices of points, starting from 0
+    """
+    if len(points) == 0:
+        return np.zeros(0, dtype=int)
+    # equal points share the front, so only the distinct ones are sorted
+    unique_points, inverse = np.unique(points, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    objectives = points.shape[1]
+    if objectives == 1:
+        # unique values are sorted, each of them is the separate front
+        return inverse
+    if objectives == 2:
+        return _sweep_ranks(unique_points)[inverse]
+    return _peeling_ranks(unique_points)[inverse]
+
+
+def _sweep_ranks(points: np.ndarray) -> np.ndarray:
+    # points are distinct and sorted lexicographically, so each point can be dominated only by the previous ones.
+    # The last point of each front has the lowest second objective in the front and it is dominated
+    # by the last point of the previous front, so fronts are ordered by their last points
+    ranks = np.empty(len(points), dtype=int)
+    last_points: list[tuple[float, float]] = []
+    for i, (first, second) in enumerate(points.tolist()):
+        key = (second, first)
+        rank = bisect_left(last_points, key)
+        if rank == len(last_points):
+            last_points.append(key)
+        else:
+            last_points[rank] = key
+        ranks[i] = rank
+    return ranks
+
+
+def _peeling_ranks(points: np.ndarray) -> np.ndarray:
+    # dominance matrix: dominated[i, j] is True if the i-th point dominates the j-th one
+    not_worse = (points[:, None, :] <= points[None, :, :]).all(axis=2)
+    better = (points[:, None, :] < points[None, :, :]).any(axis=2)
+    dominated = not_worse & better
+    dominators_count = dominated.sum(axis=0)
+
+    ranks = np.full(len(points), -1, dtype=int)
+    front = np.flatnonzero(dominators_count == 0)
+    rank = 0
+    while len(front) > 0:
+        ranks[front] = rank
+        dominators_count = dominators_count - dominated[front].sum(axis=0)
+        dominators_count[front] = -1
+        front = np.flatnonzero(dominators_count == 0)
+        rank += 1
+    return ranks
+
+
+def crowding_distances(points: np.ndarray) -> np.ndarray:
+    """
+    Computes crowding distances of points of one front, as in NSGA-II.
+    Boundary points of each objective get infinite distance.
+
+    :param points: points count x objectives count matrix
+    """
+    count, objectives = points.shape
+    distances = np.zeros(count)
+    if count == 0:
+        return distances
+    for objective in range(objectives):
+        order = np.argsort(points[:, objective], kind='stable')
+        values = points[order, objective]
+        distances[order[0]] = distances[order[-1]] = np.inf
+        if values[-1] == values[0]:
+            continue
+        norm = objectives * float(values[-1] - values[0])
+        distances[order[1:-1]] += (values[2:] - values[:-2]) / norm
+    return distances
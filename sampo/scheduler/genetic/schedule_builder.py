@@ -1,13 +1,20 @@
+import queue
 import random
 import time
+from typing import Callable
 
-from deap import tools
+import numpy as np
 from deap.base import Toolbox
 
 from sampo.api.genetic_api import Individual
 from sampo.base import SAMPO
+from sampo.scheduler.genetic.checkpoint import GeneticCheckpoint, problem_ids
 from sampo.scheduler.genetic.converter import convert_schedule_to_chromosome, ScheduleGenerationScheme
-from sampo.scheduler.genetic.operators import init_toolbox, ChromosomeType, FitnessFunction, TimeFitness
+from sampo.scheduler.genetic.operators import (init_toolbox, ChromosomeType, FitnessFunction, TimeFitness,
+                                              stack_population, select_new_population)
+from sampo.scheduler.genetic.pareto import ParetoArchive
+from sampo.scheduler.genetic.telemetry import GenerationCallback, GenerationRecord, population_diversity, \
+    count_infeasible
 from sampo.scheduler.genetic.utils import prepare_optimized_data_structures
 from sampo.scheduler.timeline.base import Timeline
 from sampo.schemas.contractor import Contractor
@@ -109,7 +116,11 @@ def build_schedules(wg: WorkGraph,
                     optimize_resources: bool = False,
                     deadline: Time | None = None,
                     only_lft_initialization: bool = False,
-                    is_multiobjective: bool = False) \
+                    is_multiobjective: bool = False,
+                    checkpoint_path: str | None = None,
+                    checkpoint_interval: int = 1,
+                    resume_from: str | None = None,
+                    telemetry: GenerationCallback | None = None) \
         -> list[tuple[ScheduleWorkDict, Time, Timeline, list[GraphNode]]]:
     """
     Genetic algorithm.
@@ -124,6 +135,14 @@ def build_schedules(wg: WorkGraph,
     Generate resources from min to max.
     Overall initial population is valid.
 
+    If `checkpoint_path` is given, the state of the algorithm is saved there every `checkpoint_interval` generations
+    and after the finish. If `resume_from` is given and the checkpoint is unfinished run of the same problem,
+    the run is continued exactly, otherwise the population of the checkpoint is used to warm start the new run.
+
+    If `telemetry` is given, it receives `GenerationRecord` after the first population and each generation.
+    In island mode the record is made after each migration interval, in steady-state mode
+    after each `population_size` evaluations.
+
     :return: schedule
     """
     global_start = start = time.time()
@@ -141,8 +160,15 @@ def build_schedules(wg: WorkGraph,
                                      init_schedules, assigned_parent_time, fitness_weights,
                                      sgs_type, only_lft_initialization, is_multiobjective)
 
-    # create population of a given size
-    pop = SAMPO.backend.generate_first_population(population_size)
+    checkpoint = GeneticCheckpoint.load(resume_from) if resume_from is not None else None
+    resume = checkpoint is not None and checkpoint.is_resumable(wg, contractors)
+
+    if not resume:
+        # create population of a given size
+        pop = SAMPO.backend.generate_first_population(population_size)
+
+        if checkpoint is not None:
+            pop = warm_start_population(toolbox, pop, checkpoint, wg, contractors, landscape)
 
     SAMPO.logger.info(f'Toolbox initialization & first population took {(time.time() - start) * 1000} ms')
 
@@ -152,50 +178,107 @@ def build_schedules(wg: WorkGraph,
         toolbox.register_individual_constructor((-1,))
     evaluation_start = time.time()
 
-    hof = tools.ParetoFront(similar=compare_individuals)
-
-    # map to each individual fitness function
-    fitness = SAMPO.backend.compute_chromosomes(fitness_f, pop)
+    hof = ParetoArchive()
+    # makespan cutoff of offspring evaluation is valid only for minimized makespan
+    use_cutoff = isinstance(fitness_f, TimeFitness) and not is_multiobjective \
+        and (have_deadline or fitness_weights[0] < 0)
+
+    if resume:
+        pop = restore_individuals(toolbox, checkpoint.population, checkpoint.fitness)
+        hof.restore(restore_individuals(toolbox, checkpoint.hall_of_fame, checkpoint.hall_of_fame_fitness))
+        generation = checkpoint.generation
+        plateau_steps = checkpoint.plateau_steps
+        rand.setstate(checkpoint.rand_state)
+        toolbox.np_rand().bit_generator.state = checkpoint.np_rand_state
+        evaluation_time = 0
+        SAMPO.logger.info(f'Resumed from generation {generation}')
+    else:
+        cache_counters = fitness_cache_counters()
+
+        # map to each individual fitness function
+        fitness = SAMPO.backend.compute_chromosomes(fitness_f, pop)
+
+        evaluation_time = time.time() - evaluation_start
+
+        for ind, fit in zip(pop, fitness):
+            ind.fitness.values = fit
 
-    evaluation_time = time.time() - evaluation_start
+        selection_start = time.time()
+        hof.update(pop)
+        report_generation(telemetry, 0, pop, hof, fitness, evaluation_time, 0, time.time() - selection_start,
+                          cache_counters)
+        generation = 1
+        plateau_steps = 0
 
-    for ind, fit in zip(pop, fitness):
-        ind.fitness.values = fit
+        SAMPO.logger.info(f'First population evaluation took {evaluation_time * 1000} ms')
 
-    hof.update(pop)
     best_fitness = hof[0].fitness.values
 
-    SAMPO.logger.info(f'First population evaluation took {evaluation_time * 1000} ms')
-
     start = time.time()
-
-    generation = 1
-    plateau_steps = 0
     new_generation_number = generation_number if not have_deadline else generation_number // 2
     new_max_plateau_steps = max_plateau_steps if max_plateau_steps is not None else new_generation_number
 
+    # the last completed generation, that is saved to the checkpoint
+    checkpoint_generation = generation - 1
+
+    def save_checkpoint(population: list[Individual], next_generation: int, steps: int):
+        nonlocal checkpoint_generation
+        if checkpoint_path is None or next_generation - 1 - checkpoint_generation < checkpoint_interval:
+            return
+        checkpoint_generation = next_generation - 1
+        make_checkpoint(toolbox, population, hof, next_generation, steps, rand, wg, contractors) \
+            .save(checkpoint_path)
+
+    # alternative modes stop by the same rules, so the loop below is skipped after them
+    if SAMPO.backend.steady_state and len(pop) >= 2 and not have_deadline:
+        # offspring is made of two parents, smaller populations evolve by the loop below
+        pop, generation, plateau_steps = run_steady_state(toolbox, pop, hof, fitness_f, rand, new_generation_number,
+                                                          new_max_plateau_steps, time_border, global_start,
+                                                          optimize_resources, telemetry, save_checkpoint,
+                                                          generation, plateau_steps)
+        best_fitness = hof[0].fitness.values
+    elif SAMPO.backend.islands_count > 1 and len(pop) >= 4 and not have_deadline:
+        # each island holds at least two individuals, smaller populations evolve by the loop below
+        pop, generation, plateau_steps = run_islands(toolbox, pop, hof, fitness_f, rand, new_generation_number,
+                                                     new_max_plateau_steps, time_border, global_start,
+                                                     optimize_resources, telemetry, save_checkpoint,
+                                                     generation, plateau_steps)
+        best_fitness = hof[0].fitness.values
+
     while generation <= new_generation_number and plateau_steps < new_max_plateau_steps \
             and (time_border is None or time.time() - global_start < time_border):
         SAMPO.logger.info(f'-- Generation {generation}, population={len(pop)}, best fitness={best_fitness} --')
 
+        operators_start = time.time()
+
         rand.shuffle(pop)
 
         offspring = make_offspring(toolbox, pop, optimize_resources)
 
         evaluation_start = time.time()
+        cache_counters = fitness_cache_counters()
 
-        offspring_fitness = SAMPO.backend.compute_chromosomes(fitness_f, offspring)
+        # truncation selection keeps the population, so the offspring worse than all the population
+        # is never selected, and its evaluation can be aborted as soon as it is proven
+        cutoff = max(ind.fitness.values[0] for ind in pop) \
+            if use_cutoff and len(pop) >= population_size else None
+        offspring_fitness = SAMPO.backend.compute_chromosomes(fitness_f, offspring, cutoff)
 
         for ind, fit in zip(offspring, offspring_fitness):
             ind.fitness.values = fit
 
-        evaluation_time += time.time() - evaluation_start
+        generation_evaluation_time = time.time() - evaluation_start
+        evaluation_time += generation_evaluation_time
 
         # renewing population
+        selection_start = time.time()
         pop += offspring
         pop = toolbox.select(pop)
         hof.update(pop)
 
+        report_generation(telemetry, generation, pop, hof, offspring_fitness, generation_evaluation_time,
+                          evaluation_start - operators_start, time.time() - selection_start, cache_counters)
+
         prev_best_fitness = best_fitness
         best_fitness = hof[0].fitness.values
         plateau_steps = plateau_steps + 1 if best_fitness == prev_best_fitness else 0
@@ -206,6 +289,8 @@ def build_schedules(wg: WorkGraph,
 
         generation += 1
 
+        save_checkpoint(pop, generation, plateau_steps)
+
     # Second stage to optimize resources if deadline is assigned
 
     if have_deadline:
@@ -264,11 +349,14 @@ def build_schedules(wg: WorkGraph,
                     and (time_border is None or time.time() - global_start < time_border):
                 SAMPO.logger.info(f'-- Generation {generation}, population={len(pop)}, best peak={best_fitness} --')
 
+                operators_start = time.time()
+
                 rand.shuffle(pop)
 
                 offspring = make_offspring(toolbox, pop, optimize_resources)
 
                 evaluation_start = time.time()
+                cache_counters = fitness_cache_counters()
 
                 fitness = SAMPO.backend.compute_chromosomes(fitness_f, offspring)
 
@@ -282,13 +370,18 @@ def build_schedules(wg: WorkGraph,
                 for ind, res_fit in zip(offspring, fitness_res):
                     ind.fitness.values = res_fit
 
-                evaluation_time += time.time() - evaluation_start
+                generation_evaluation_time = time.time() - evaluation_start
+                evaluation_time += generation_evaluation_time
 
                 # renewing population
+                selection_start = time.time()
                 pop += offspring
                 pop = toolbox.select(pop)
                 hof.update(pop)
 
+                report_generation(telemetry, generation, pop, hof, fitness, generation_evaluation_time,
+                                  evaluation_start - operators_start, time.time() - selection_start, cache_counters)
+
                 prev_best_fitness = best_fitness
                 best_fitness = hof[0].fitness.values
                 plateau_steps = plateau_steps + 1 if best_fitness == prev_best_fitness else 0
@@ -299,6 +392,11 @@ def build_schedules(wg: WorkGraph,
     SAMPO.logger.info(f'Generations processing took {(time.time() - start) * 1000} ms')
     SAMPO.logger.info(f'Full genetic processing took {(time.time() - global_start) * 1000} ms')
     SAMPO.logger.info(f'Evaluation time: {evaluation_time * 1000}')
+    SAMPO.logger.info(f'Fitness cache hit rate: {SAMPO.backend.fitness_cache.hit_rate:.2%}')
+
+    if checkpoint_path is not None:
+        make_checkpoint(toolbox, pop, hof, generation, plateau_steps, rand, wg, contractors, completed=True) \
+            .save(checkpoint_path)
 
     best_chromosomes = [chromosome for chromosome in hof]
 
@@ -311,24 +409,288 @@ def build_schedules(wg: WorkGraph,
     return best_schedules
 
 
-def compare_individuals(first: ChromosomeType, second: ChromosomeType) -> bool:
-    return ((first[0] == second[0]).all() and (first[1] == second[1]).all() and (first[2] == second[2]).all()
-            or first.fitness == second.fitness)
+def fitness_cache_counters() -> tuple[int, int]:
+    return SAMPO.backend.fitness_cache.hits, SAMPO.backend.fitness_cache.misses
 
 
-def make_offspring(toolbox: Toolbox, population: list[ChromosomeType], optimize_resources: bool) \
+def report_generation(telemetry: GenerationCallback | None, generation: int, population: list[Individual],
+                      hof: ParetoArchive, evaluated_fitness: list[tuple], evaluation_time: float,
+                      operators_time: float, selection_time: float, cache_counters: tuple[int, int]):
+    """
+    Passes the record of the generation to the telemetry callback
+
+    :param evaluated_fitness: fitness values, evaluated in the generation
+    :param cache_counters: hits and misses of the fitness cache before the evaluation
+    """
+    if telemetry is None:
+        return
+    hits, misses = fitness_cache_counters()
+    population_fitness = np.array([ind.fitness.values for ind in population], dtype=float)
+    telemetry(GenerationRecord(generation=generation,
+                               population_size=len(population),
+                               evaluation_time=evaluation_time,
+                               operators_time=operators_time,
+                               selection_time=selection_time,
+                               cache_hits=hits - cache_counters[0],
+                               cache_misses=misses - cache_counters[1],
+                               infeasible_count=count_infeasible(evaluated_fitness),
+                               diversity=population_diversity(np.array([ind[0] for ind in population])),
+                               best_fitness=tuple(float(value) for value in hof[0].fitness.values),
+                               median_fitness=tuple(np.median(population_fitness, axis=0).tolist())))
+
+
+def make_checkpoint(toolbox: Toolbox, population: list[Individual], hof: ParetoArchive, generation: int,
+                    plateau_steps: int, rand: random.Random, wg: WorkGraph, contractors: list[Contractor],
+                    completed: bool = False) -> GeneticCheckpoint:
+    work_ids, worker_names, contractor_ids = problem_ids(wg, contractors)
+    return GeneticCheckpoint(population=list(population),
+                             fitness=[ind.fitness.values for ind in population],
+                             hall_of_fame=list(hof),
+                             hall_of_fame_fitness=[ind.fitness.values for ind in hof],
+                             generation=generation,
+                             plateau_steps=plateau_steps,
+                             rand_state=rand.getstate(),
+                             np_rand_state=toolbox.np_rand().bit_generator.state,
+                             work_ids=work_ids,
+                             worker_names=worker_names,
+                             contractor_ids=contractor_ids,
+                             completed=completed)
+
+
+def restore_individuals(toolbox: Toolbox, chromosomes: list[ChromosomeType], fitness: list[tuple]) \
+        -> list[Individual]:
+    individuals = []
+    for chromosome, fitness_values in zip(chromosomes, fitness):
+        ind = toolbox.Individual(chromosome)
+        ind.fitness.values = fitness_values
+        individuals.append(ind)
+    return individuals
+
+
+def warm_start_population(toolbox: Toolbox, population: list[Individual], checkpoint: GeneticCheckpoint,
+                          wg: WorkGraph, contractors: list[Contractor], landscape: LandscapeConfiguration) \
         -> list[Individual]:
+    """
+    Replaces individuals of the first population with the population of the checkpoint,
+    adapted to the given problem. Adapted chromosomes, that are incorrect for the problem, are skipped.
+    """
+    _, _, _, _, _, _, _, _, contractor_borders, _, parents, _, resources_border = \
+        prepare_optimized_data_structures(wg, contractors, landscape)
+    adapted = checkpoint.adapt_population(wg, contractors, population, parents, resources_border, contractor_borders)
+    warm = [toolbox.Individual(chromosome) for chromosome in adapted][:len(population)]
+    warm = [ind for ind in warm if toolbox.validate(ind)]
+
+    SAMPO.logger.info(f'Warm start with {len(warm)} individuals of the checkpoint')
+
+    return warm + population[:len(population) - len(warm)]
+
+
+def evolve_population(toolbox: Toolbox, population: list[Individual], fitness: FitnessFunction, generations: int,
+                      optimize_resources: bool, rand: random.Random) -> list[Individual]:
+    """
+    Evolves evaluated population for the given number of generations without any external communication.
+    It is the generation loop of island model, that is executed by the computational backend.
+    """
+    population_size = len(population)
+    for _ in range(generations):
+        rand.shuffle(population)
+
+        offspring = make_offspring(toolbox, population, optimize_resources)
+
+        for ind in offspring:
+            ind.fitness.values = fitness.evaluate(ind, toolbox.evaluate_chromosome)
+
+        # renewing population
+        population = toolbox.select(population + offspring, k=population_size)
+
+    return population
+
+
+def run_islands(toolbox: Toolbox, population: list[Individual], hof: ParetoArchive, fitness: FitnessFunction,
+                rand: random.Random, generation_number: int, max_plateau_steps: int, time_border: int | None,
+                global_start: float, optimize_resources: bool, telemetry: GenerationCallback | None = None,
+                save_checkpoint: Callable[[list[Individual], int, int], None] | None = None,
+                generation: int = 1, plateau_steps: int = 0) -> tuple[list[Individual], int, int]:
+    """
+    Island model of genetic algorithm.
+    Population is split into islands, that evolve independently by the computational backend.
+    Every `migration_interval` generations copies of the best individuals of each island
+    replace the worst individuals of the next island in the ring.
+    Telemetry record is made after each migration with the number of the last generation before it,
+    and `save_checkpoint` is called with the merged population, the next generation and plateau steps.
+
+    :return: the merged population, the number of the next generation and the number of plateau steps
+    """
+    islands_count = max(min(SAMPO.backend.islands_count, len(population) // 2), 1)
+    migration_interval = max(SAMPO.backend.migration_interval, 1)
+    migration_size = max(SAMPO.backend.migration_size, 0)
+
+    rand.shuffle(population)
+    islands = [population[i::islands_count] for i in range(islands_count)]
+
+    best_fitness = hof[0].fitness.values
+
+    while generation <= generation_number and plateau_steps < max_plateau_steps \
+            and (time_border is None or time.time() - global_start < time_border):
+        generations = min(migration_interval, generation_number - generation + 1)
+        SAMPO.logger.info(f'-- Generations {generation}-{generation + generations - 1}, islands={islands_count}, '
+                          f'best fitness={best_fitness} --')
+
+        seeds = [rand.randint(0, 2 ** 32 - 1) for _ in islands]
+        evaluation_start = time.time()
+        cache_counters = fitness_cache_counters()
+        islands = SAMPO.backend.evolve_islands(fitness, islands, generations, optimize_resources, seeds)
+        evaluation_time = time.time() - evaluation_start
+
+        selection_start = time.time()
+        for island in islands:
+            hof.update(island)
+
+        # ring migration
+        migrants = []
+        for island in islands:
+            island_migrants = []
+            for ind in select_new_population(island, min(migration_size, len(island) // 2)):
+                migrant = toolbox.copy_individual(ind)
+                migrant.fitness.values = ind.fitness.values
+                island_migrants.append(migrant)
+            migrants.append(island_migrants)
+        for i, island in enumerate(islands):
+            island_migrants = migrants[i - 1]
+            islands[i] = select_new_population(island, len(island) - len(island_migrants)) + island_migrants
+
+        # islands evolve with operators and evaluations together, so their time is reported as evaluation one
+        population = [ind for island in islands for ind in island]
+        report_generation(telemetry, generation + generations - 1, population, hof,
+                          [ind.fitness.values for ind in population], evaluation_time, 0,
+                          time.time() - selection_start, cache_counters)
+
+        prev_best_fitness = best_fitness
+        best_fitness = hof[0].fitness.values
+        plateau_steps = plateau_steps + generations if best_fitness == prev_best_fitness else 0
+
+        generation += generations
+
+        if save_checkpoint is not None:
+            save_checkpoint(population, generation, plateau_steps)
+
+    return [ind for island in islands for ind in island], generation, plateau_steps
+
+
+def run_steady_state(toolbox: Toolbox, population: list[Individual], hof: ParetoArchive,
+                     fitness: FitnessFunction, rand: random.Random, generation_number: int, max_plateau_steps: int,
+                     time_border: int | None, global_start: float, optimize_resources: bool,
+                     telemetry: GenerationCallback | None = None,
+                     save_checkpoint: Callable[[list[Individual], int, int], None] | None = None,
+                     generation: int = 1, plateau_steps: int = 0) -> tuple[list[Individual], int, int]:
+    """
+    Steady-state genetic algorithm.
+    Offspring is evaluated asynchronously by the computational backend. As soon as the evaluation is done,
+    the individual is inserted into the population and the new offspring is submitted,
+    so the evaluators don't wait for the slowest chromosome of the generation.
+    Each `len(population)` evaluations are counted as one generation, and telemetry record is made after it,
+    where evaluation time is the time of waiting for evaluation results,
+    and `save_checkpoint` is called with the population, the next generation and plateau steps.
+    If an evaluation fails, no new offspring is submitted, and the error is raised
+    after all the submitted evaluations are finished.
+
+    :return: the population, the number of the next generation and the number of plateau steps
+    """
+    population_size = len(population)
+    # evaluation results are put here by the backend callbacks
+    results = queue.Queue()
     offspring = []
+    in_flight = 0
+    evaluations = 0
+    failure = None
+    # telemetry of the current generation
+    generation_start = time.time()
+    operators_time = 0
+    selection_time = 0
+    evaluated_fitness = []
+    cache_counters = fitness_cache_counters()
+
+    best_fitness = hof[0].fitness.values
 
-    for ind1, ind2 in zip(population[::2], population[1::2]):
-        # mate
-        offspring.extend(toolbox.mate(ind1, ind2, optimize_resources))
+    def submit(ind: Individual):
+        SAMPO.backend.submit_chromosome(fitness, ind,
+                                        lambda fit: results.put((ind, fit, None)),
+                                        lambda error: results.put((ind, None, error)))
+
+    def is_running() -> bool:
+        return failure is None and generation <= generation_number and plateau_steps < max_plateau_steps \
+            and (time_border is None or time.time() - global_start < time_border)
+
+    while True:
+        # keep all the evaluators busy
+        while in_flight < SAMPO.backend.concurrency and is_running():
+            if not offspring:
+                operators_start = time.time()
+                offspring = make_offspring(toolbox, rand.sample(population, 2), optimize_resources)
+                operators_time += time.time() - operators_start
+            submit(offspring.pop())
+            in_flight += 1
+
+        if in_flight == 0:
+            break
+
+        ind, fit, error = results.get()
+        in_flight -= 1
+        if error is not None:
+            failure = failure or error
+        if failure is not None:
+            continue
 
-    for mutant in offspring:
-        if optimize_resources:
-            # resource borders mutation
-            toolbox.mutate_resource_borders(mutant)
-        # other mutation
-        toolbox.mutate(mutant)
+        ind.fitness.values = fit
+        evaluated_fitness.append(fit)
+        selection_start = time.time()
+        population = toolbox.select(population + [ind])
+        hof.update([ind])
+        selection_time += time.time() - selection_start
+
+        evaluations += 1
+        if evaluations % population_size == 0:
+            report_generation(telemetry, generation, population, hof, evaluated_fitness,
+                              time.time() - generation_start - operators_time - selection_time,
+                              operators_time, selection_time, cache_counters)
+            generation_start = time.time()
+            operators_time = 0
+            selection_time = 0
+            evaluated_fitness = []
+            cache_counters = fitness_cache_counters()
+
+            prev_best_fitness = best_fitness
+            best_fitness = hof[0].fitness.values
+            plateau_steps = plateau_steps + 1 if best_fitness == prev_best_fitness else 0
+
+            generation += 1
+            SAMPO.logger.info(f'-- Generation {generation}, population={len(population)}, '
+                              f'best fitness={best_fitness} --')
+
+            if save_checkpoint is not None:
+                save_checkpoint(population, generation, plateau_steps)
+
+    if failure is not None:
+        raise failure
 
-    return offspring
+    return population, generation, plateau_steps
+
+
+def make_offspring(toolbox: Toolbox, population: list[ChromosomeType], optimize_resources: bool) \
+        -> list[Individual]:
+    # operators are applied to the whole population at once
+    orders, resources, borders = stack_population(population)
+
+    # mate
+    orders, resources, borders = toolbox.mate_population(orders, resources, borders, optimize_resources)
+
+    if optimize_resources:
+        # resource borders mutation
+        toolbox.mutate_resource_borders_population(resources, borders)
+    # other mutation
+    toolbox.mutate_population(orders, resources, borders)
+
+    # children take spec and zones of the parent which order they inherit,
+    # the spec is shared and zones are copied by packing of the chromosome
+    return [toolbox.Individual((order, res, border, parent[3], parent[4]))
+            for order, res, border, parent in zip(orders, resources, borders, population)]
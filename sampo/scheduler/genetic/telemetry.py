@@ -0,0 +1,117 @@
+import csv
+import json
+import os
+from dataclasses import dataclass, asdict
+from typing import Callable, TextIO
+
+import numpy as np
+
+from sampo.schemas.time import Time
+
+
+@dataclass
+class GenerationRecord:
+    """
+    Statistics of one generation of genetic algorithm. Generation 0 is the first population.
+
+    :param generation: the number of generation
+    :param population_size: the size of the population after selection
+    :param evaluation_time: wall time of fitness evaluation, in seconds
+    :param operators_time: wall time of mate and mutation operators, in seconds
+    :param selection_time: wall time of selection and hall of fame update, in seconds
+    :param cache_hits: the number of fitness values, taken from the fitness cache
+    :param cache_misses: the number of evaluated chromosomes
+    :param infeasible_count: the number of evaluated chromosomes with infinite fitness
+    :param diversity: mean pairwise Hamming distance of orders of the population, normalized to [0, 1]
+    :param best_fitness: fitness values of the best individual
+    :param median_fitness: medians of fitness values of the population
+    """
+    generation: int
+    population_size: int
+    evaluation_time: float
+    operators_time: float
+    selection_time: float
+    cache_hits: int
+    cache_misses: int
+    infeasible_count: int
+    diversity: float
+    best_fitness: tuple[float, ...]
+    median_fitness: tuple[float, ...]
+
+
+# receives the record after each generation
+GenerationCallback = Callable[[GenerationRecord], None]
+
+
+def population_diversity(orders: np.ndarray) -> float:
+    """
+    Computes mean pairwise Hamming distance of orders, normalized by the number of works.
+    It is computed by counts of works at each position, without comparing each pair of orders.
+
+    :param orders: population size x works count matrix of orders
+    """
+    if len(orders) < 2 or orders.shape[1] == 0:
+        return 0.0
+    population_size, works_count = orders.shape
+    # counts of (position, work) pairs
+    _, counts = np.unique((np.arange(works_count) * works_count + orders).ravel(), return_counts=True)
+    equal_pairs = (counts * (counts - 1)).sum()
+    all_pairs = population_size * (population_size - 1) * works_count
+    return float(1 - equal_pairs / all_pairs)
+
+
+def count_infeasible(fitness: list[tuple]) -> int:
+    return sum(1 for values in fitness if values[0] >= Time.inf().value)
+
+
+class GenerationRecordWriter:
+    """
+    Generation callback, that writes records to the file in CSV or JSON lines format.
+    In CSV format fitness values are written in separate columns, e.g. `best_fitness_0`.
+    The file is flushed after each record, so it can be watched during the run.
+    """
+
+    def __init__(self, path: str, file_format: str | None = None):
+        """
+        :param path: path of the output file
+        :param file_format: 'csv' or 'jsonl', if None it's taken from the file extension
+        """
+        if file_format is None:
+            file_format = os.path.splitext(path)[1].lstrip('.').lower()
+        if file_format not in ('csv', 'jsonl'):
+            raise ValueError(f'Unsupported telemetry format: {file_format}')
+        self._path = path
+        self._format = file_format
+        self._file: TextIO | None = None
+        self._csv_writer: csv.DictWriter | None = None
+
+    def __call__(self, record: GenerationRecord):
+        if self._file is None:
+            self._file = open(self._path, 'w', newline='')
+
+        if self._format == 'jsonl':
+            self._file.write(json.dumps(asdict(record)) + '\n')
+        else:
+            row = {}
+            for name, value in asdict(record).items():
+                if isinstance(value, (tuple, list)):
+                    row.update({f'{name}_{i}': v for i, v in enumerate(value)})
+                else:
+                    row[name] = value
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(self._file, fieldnames=list(row.keys()))
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def __enter__(self) -> 'GenerationRecordWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,7 +1,7 @@
+import numpy as np
 from deap.base import Toolbox
 
 from sampo.api.genetic_api import ChromosomeType
-from sampo.schemas.schedule import Schedule
 
 native = True
 try:
@@ -21,6 +21,7 @@ except ImportError:
 from sampo.schemas.contractor import Contractor
 from sampo.schemas.graph import WorkGraph, GraphNode
 from sampo.schemas.resources import Worker
+from sampo.schemas.time import Time
 from sampo.schemas.time_estimator import WorkTimeEstimator
 from sampo.utilities.collections_util import reverse_dictionary
 
@@ -36,17 +37,15 @@ class NativeWrapper:
                  time_estimator: WorkTimeEstimator):
         self.native = native
         if not native:
-            def fit(chromosome: ChromosomeType) -> Schedule | None:
-                if toolbox.validate(chromosome):
-                    sworks = toolbox.chromosome_to_schedule(chromosome)[0]
-                    return Schedule.from_scheduled_works(sworks.values(), wg)
-                else:
-                    return None
-            self.evaluator = lambda _, chromosomes: [fit(chromosome) for chromosome in chromosomes]
+            def makespan(chromosome: ChromosomeType) -> int:
+                evaluation = toolbox.evaluate_chromosome(chromosome)
+                return Time.inf().value if evaluation is None else evaluation.execution_time.value
+            self.evaluator = lambda _, chromosomes: [makespan(chromosome) for chromosome in chromosomes]
             self._cache = None
             return
 
         # the outer numeration. Begins with inseparable heads, continuous with tails.
+        # Heads are numbered as in chromosomes.
         numeration: dict[int, GraphNode] = {i: node for i, node in
                                             enumerate(filter(lambda node: not node.is_inseparable_son(), wg.nodes))}
         heads_count = len(numeration)
@@ -54,11 +53,11 @@ class NativeWrapper:
             numeration[heads_count + i] = node
         rev_numeration = reverse_dictionary(numeration)
 
-        # TODO remove assignment unuseful info to self
-
         self.numeration = numeration
         # for each vertex index store list of parents' indices
         self.parents = [[rev_numeration[p] for p in numeration[index].parents] for index in range(wg.vertex_count)]
+        # lags of the same edges, all the edges should be dependencies
+        parent_lags = [[int(edge.lag) for edge in numeration[index].edges_to] for index in range(wg.vertex_count)]
         head_parents = [list(parents[i]) for i in range(len(parents))]
         # for each vertex index store list of whole it's inseparable chain indices
         self.inseparables = [[rev_numeration[p] for p in numeration[index].get_inseparable_chain_with_self()]
@@ -69,8 +68,8 @@ class NativeWrapper:
             for worker in contractor.workers.values():
                 self.workers[i][worker_name2index[worker.name]] = worker.count
 
-        min_req = [[] for _ in range(len(numeration))]  # np.zeros((len(numeration), len(worker_pool_indices)))
-        max_req = [[] for _ in range(len(numeration))]  # np.zeros((len(numeration), len(worker_pool_indices)))
+        min_req = [[] for _ in range(len(numeration))]
+        max_req = [[] for _ in range(len(numeration))]
         for work_index, node in numeration.items():
             cur_min_req = [0 for _ in worker_name2index]
             cur_max_req = [0 for _ in worker_name2index]
@@ -94,31 +93,39 @@ class NativeWrapper:
 
         self.evaluator = evaluator
 
-        # os.add_dll_directory('C:\\Users\\Quarter\\PycharmProjects\\sampo\\tests')
-        # os.add_dll_directory('C:\\Users\\Quarter\\PycharmProjects\\sampo')
-        # os.chdir('C:\\Users\\Quarter\\PycharmProjects\\sampo\\tests')
-
-        import ctypes.util
-
-        name = ctypes.util.find_library('C:\\Users\\Quarter\\PycharmProjects\\sampo\\tests\\native.dll')
-        lib = ctypes.WinDLL(name)
-        # lib = CDLL(r'C:\Users\Quarter\PycharmProjects\sampo\tests\native.dll')
-
-        # preparing C++ cache
-        self._cache = decodeEvaluationInfo(self, self.parents, head_parents, self.inseparables, self.workers,
-                                           self.totalWorksCount, False, True, volume, min_req, max_req, id2work, id2res)
-
-    def calculate_working_time(self, chromosome_ind: int, team_target: int, work: int) -> int:
-        team = self._current_chromosomes[chromosome_ind][1][team_target]
-        workers = [self.worker_pool_indices[worker_index][team[len(self.workers[0])]]
-                   .copy().with_count(team[worker_index])
-                   for worker_index in range(len(self.workers[0]))
-                   if team[worker_index] > 0]
+        # preparing C++ cache, working times are estimated by `time_estimator` through `calculate_working_time_ind`
+        self._cache = decodeEvaluationInfo(self, self.parents, parent_lags, head_parents, self.inseparables,
+                                           self.workers, self.totalWorksCount, True, False, volume, min_req, max_req,
+                                           id2work, id2res)
+
+    def calculate_working_time_ind(self, chromosome_ind: int, team_target: int, work: int) -> int:
+        """
+        Estimates the working time of `work` executed by the team of `team_target` work
+        from the chromosome of the current evaluation batch
+        """
+        *team, contractor_index = self._current_chromosomes[chromosome_ind][1][team_target].tolist()
+        workers = [self.worker_pool_indices[worker_index][contractor_index].copy().with_count(worker_count)
+                   for worker_index, worker_count in enumerate(team)
+                   if worker_count > 0]
         return self.time_estimator.estimate_time(self.numeration[work].work_unit, workers).value
 
-    def evaluate(self, chromosomes: list[ChromosomeType]):
+    @staticmethod
+    def _encode(chromosome: ChromosomeType) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # native side reads C int arrays, while chromosomes use the narrowest dtypes
+        return tuple(np.ascontiguousarray(part, dtype=np.intc) for part in chromosome[:3])
+
+    def evaluate(self, chromosomes: list[ChromosomeType]) -> list[int]:
+        """
+        Computes makespans of chromosomes by the parallel SGS, unschedulable chromosomes get `Time.inf()`
+        """
+        if not self.native:
+            return self.evaluator(self._cache, chromosomes)
         self._current_chromosomes = chromosomes
-        return self.evaluator(self._cache, chromosomes)
+        try:
+            makespans = self.evaluator(self._cache, [self._encode(chromosome) for chromosome in chromosomes])
+        finally:
+            self._current_chromosomes = None
+        return [min(makespan, Time.inf().value) for makespan in makespans]
 
     def run_genetic(self, chromosomes: list[ChromosomeType],
                     mutate_order, mate_order, mutate_resources, mate_resources,
@@ -128,4 +135,6 @@ class NativeWrapper:
                           mate_order, mate_resources, mate_contractors, selection_size)
 
     def close(self):
-        freeEvaluationInfo(self._cache)
+        if self._cache is not None:
+            freeEvaluationInfo(self._cache)
+            self._cache = None
@@ -4,3 +4,4 @@ from sampo.scheduler.timeline.just_in_time_timeline import JustInTimeTimeline
 from sampo.scheduler.timeline.material_timeline import SupplyTimeline
 from sampo.scheduler.timeline.momentum_timeline import MomentumTimeline
 from sampo.scheduler.timeline.zone_timeline import ZoneTimeline
+from sampo.scheduler.timeline.segment_tree_timeline import SegmentTreeTimeline
@@ -88,3 +88,19 @@ class Timeline(ABC):
                         worker_team: list[Worker],
                         spec: WorkSpec):
         ...
+
+    @abstractmethod
+    def fork(self) -> 'Timeline':
+        """
+        Returns the timeline in the same state, which can be modified independently of this one.
+        Unlike the deep copy, states of resources are shared until one of the timelines modifies them,
+        so tentative placements can be tried on the fork and thrown away cheaply.
+        """
+        ...
+
+    @abstractmethod
+    def rollback(self):
+        """
+        Discards all the modifications made to this timeline since it was created by `fork`
+        """
+        ...
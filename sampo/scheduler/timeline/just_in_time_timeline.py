@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import Optional
 
 from sampo.scheduler.timeline.base import Timeline
@@ -14,6 +15,10 @@ from sampo.schemas.time import Time
 from sampo.schemas.time_estimator import WorkTimeEstimator, DefaultWorkEstimator
 
 
+def _descending_time_key(offer: tuple[Time, int]) -> int:
+    return -offer[0].value
+
+
 class JustInTimeTimeline(Timeline):
     """
     Timeline that stored the time of resources release.
@@ -30,6 +35,40 @@ class JustInTimeTimeline(Timeline):
 
         self._material_timeline = SupplyTimeline(landscape)
         self.zone_timeline = ZoneTimeline(landscape.zone_config)
+        # stacks, that are not shared with other timelines, so they can be modified in-place.
+        # Shared stacks are copied before the first modification, see `fork`
+        self._owned: set[tuple[str, str]] = set(self._timeline.keys())
+        # the state this timeline was forked with, it's restored by `rollback`
+        self._base = None
+
+    def fork(self) -> 'JustInTimeTimeline':
+        # stacks become shared by both timelines and the base of the fork
+        self._owned = set()
+        timeline = JustInTimeTimeline.__new__(JustInTimeTimeline)
+        timeline._base = (dict(self._timeline), self._material_timeline.copy(), self.zone_timeline.copy())
+        timeline.rollback()
+        return timeline
+
+    def rollback(self):
+        if self._base is None:
+            raise ValueError('Only the forked timeline can be rolled back')
+        stacks, material_timeline, zone_timeline = self._base
+        self._timeline = dict(stacks)
+        self._owned = set()
+        self._material_timeline = material_timeline.copy()
+        self.zone_timeline = zone_timeline.copy()
+
+    def _own_stack(self, agent_id: tuple[str, str]) -> list[tuple[Time, int]]:
+        """
+        Returns the stack of the worker type, that can be modified in-place
+        """
+        stack = self._timeline[agent_id]
+        if agent_id not in self._owned:
+            # items are immutable tuples, so the shallow copy is enough
+            stack = stack.copy()
+            self._timeline[agent_id] = stack
+            self._owned.add(agent_id)
+        return stack
 
     def find_min_start_time_with_additional(self, node: GraphNode,
                                             worker_team: list[Worker],
@@ -65,29 +104,7 @@ class JustInTimeTimeline(Timeline):
         # define the max end time of all parent tasks
         max_parent_time = max(node.min_start_time(node2swork), assigned_parent_time)
         # define the max agents time when all needed workers are off from previous tasks
-        max_agent_time = Time(0)
-
-        if spec.is_independent:
-            # grab from the end
-            for worker in worker_team:
-                offer_stack = self._timeline[worker.get_agent_id()]
-                max_agent_time = max(max_agent_time, offer_stack[0][0])
-        else:
-            # grab from whole sequence
-            # for each resource type
-            for worker in worker_team:
-                needed_count = worker.count
-                offer_stack = self._timeline[worker.get_agent_id()]
-                # traverse list while not enough resources and grab it
-                ind = len(offer_stack) - 1
-                while needed_count > 0:
-                    offer_time, offer_count = offer_stack[ind]
-                    max_agent_time = max(max_agent_time, offer_time)
-
-                    if needed_count < offer_count:
-                        offer_count = needed_count
-                    needed_count -= offer_count
-                    ind -= 1
+        max_agent_time = self.find_min_agents_time(worker_team, spec)
 
         c_st = max(max_agent_time, max_parent_time)
 
@@ -117,6 +134,40 @@ class JustInTimeTimeline(Timeline):
         c_ft = c_st + exec_time
         return c_st, c_ft, None
 
+    def find_min_agents_time(self, worker_team: list[Worker], spec: WorkSpec) -> Time:
+        """
+        Define the time, when all the workers of the team are off from previous tasks
+
+        :param worker_team: the worker team under testing
+        :param spec: given work specification
+        :return: the time of agents release
+        """
+        max_agent_time = Time(0)
+
+        if spec.is_independent:
+            # grab from the end
+            for worker in worker_team:
+                offer_stack = self._timeline[worker.get_agent_id()]
+                max_agent_time = max(max_agent_time, offer_stack[0][0])
+            return max_agent_time
+
+        # grab from whole sequence
+        # for each resource type
+        for worker in worker_team:
+            needed_count = worker.count
+            if needed_count <= 0:
+                continue
+            offer_stack = self._timeline[worker.get_agent_id()]
+            # traverse list from the earliest release while not enough resources and grab it,
+            # the list is sorted descending, so the last grabbed pair is the latest one
+            ind = -1
+            needed_count -= offer_stack[-1][1]
+            while needed_count > 0:
+                ind -= 1
+                needed_count -= offer_stack[ind][1]
+            max_agent_time = max(max_agent_time, offer_stack[ind][0])
+        return max_agent_time
+
     def can_schedule_at_the_moment(self,
                                    node: GraphNode,
                                    worker_team: list[Worker],
@@ -126,12 +177,7 @@ class JustInTimeTimeline(Timeline):
                                    exec_time: Time) -> bool:
         if spec.is_independent:
             # squash all the timeline to the last point
-            for worker in worker_team:
-                worker_timeline = self._timeline[(worker.contractor_id, worker.name)]
-                last_cpkt_time, _ = worker_timeline[0]
-                if last_cpkt_time > start_time:
-                    return False
-            return True
+            return self.find_min_agents_time(worker_team, spec) <= start_time
         else:
             # checking edges
             for dep_node in node.get_inseparable_chain_with_self():
@@ -141,22 +187,7 @@ class JustInTimeTimeline(Timeline):
                         if swork is None or swork.finish_time > start_time:
                             return False
 
-            max_agent_time = Time(0)
-            for worker in worker_team:
-                needed_count = worker.count
-                offer_stack = self._timeline[worker.get_agent_id()]
-                # traverse list while not enough resources and grab it
-                ind = len(offer_stack) - 1
-                while needed_count > 0:
-                    offer_time, offer_count = offer_stack[ind]
-                    max_agent_time = max(max_agent_time, offer_time)
-
-                    if needed_count < offer_count:
-                        offer_count = needed_count
-                    needed_count -= offer_count
-                    ind -= 1
-
-            if not max_agent_time <= start_time:
+            if not self.find_min_agents_time(worker_team, spec) <= start_time:
                 return False
 
             if not self._material_timeline.can_schedule_at_the_moment(node.id, start_time,
@@ -187,17 +218,16 @@ class JustInTimeTimeline(Timeline):
         if spec.is_independent:
             # squash all the timeline to the last point
             for worker in worker_team:
-                worker_timeline = self._timeline[(worker.contractor_id, worker.name)]
+                worker_timeline = self._own_stack((worker.contractor_id, worker.name))
                 count_workers = sum([count for _, count in worker_timeline])
                 worker_timeline.clear()
                 worker_timeline.append((finish_time, count_workers))
         else:
             # For each worker type consume the nearest available needed worker amount
             # and re-add it to the time when current work should be finished.
-            # Addition performed as step in bubble-sort algorithm.
             for worker in worker_team:
                 needed_count = worker.count
-                worker_timeline = self._timeline[(worker.contractor_id, worker.name)]
+                worker_timeline = self._own_stack((worker.contractor_id, worker.name))
                 # Consume needed workers
                 while needed_count > 0:
                     next_time, next_count = worker_timeline.pop()
@@ -206,12 +236,9 @@ class JustInTimeTimeline(Timeline):
                         break
                     needed_count -= next_count
 
-                # Add to the right place
-                worker_timeline.append((finish_time, worker.count))
-                ind = len(worker_timeline) - 1
-                while ind > 0 and worker_timeline[ind][0] > worker_timeline[ind - 1][0]:
-                    worker_timeline[ind], worker_timeline[ind - 1] = worker_timeline[ind - 1], worker_timeline[ind]
-                    ind -= 1
+                # Add to the right place, after all the pairs with not earlier time
+                ind = bisect_right(worker_timeline, -finish_time.value, key=_descending_time_key)
+                worker_timeline.insert(ind, (finish_time, worker.count))
 
     def schedule(self,
                  node: GraphNode,
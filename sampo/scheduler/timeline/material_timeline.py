@@ -1,13 +1,17 @@
 import math
-from operator import itemgetter
 
 from sampo.schemas.exceptions import NotEnoughMaterialsInDepots, NoAvailableResources
 from sampo.schemas.landscape import LandscapeConfiguration, MaterialDelivery
 from sampo.schemas.resources import Material
-from sampo.schemas.sorted_list import ExtendedSortedList
+from sampo.schemas.sorted_list import ExtendedSortedList, copy_sorted_key_list
 from sampo.schemas.time import Time
 
 
+def _entry_time(entry: tuple[Time, int]) -> int:
+    # keys hold plain time values, because they are compared on each bisection of the timeline
+    return entry[0].value
+
+
 class SupplyTimeline:
     def __init__(self, landscape_config: LandscapeConfiguration):
         self._timeline = {}
@@ -16,7 +20,7 @@ class SupplyTimeline:
         self._resource_sources: dict[str, dict[str, int]] = {}
         for landscape in landscape_config.get_all_resources():
             self._timeline[landscape.id] = ExtendedSortedList([(Time(0), landscape.count), (Time.inf(), 0)],
-                                                              itemgetter(0))
+                                                              _entry_time)
             self._capacity[landscape.id] = landscape.count
             for count, res in landscape.get_available_resources():
                 res_source = self._resource_sources.get(res, None)
@@ -24,6 +28,23 @@ class SupplyTimeline:
                     res_source = {}
                     self._resource_sources[res] = res_source
                 res_source[landscape.id] = count
+        # material -> depots, that can supply this type of resource, in the order of preference
+        # among the equally loaded ones: by decreasing capacity, then by the order in the landscape
+        self._material_depots: dict[str, list[str]] = {
+            res: sorted(res_source, key=lambda depot_id: -self._capacity[depot_id])
+            for res, res_source in self._resource_sources.items()
+        }
+
+    def copy(self) -> 'SupplyTimeline':
+        """
+        Returns the independent copy of this timeline.
+        """
+        timeline = SupplyTimeline.__new__(SupplyTimeline)
+        timeline._timeline = {depot: copy_sorted_key_list(state) for depot, state in self._timeline.items()}
+        timeline._capacity = self._capacity
+        timeline._resource_sources = {res: dict(res_source) for res, res_source in self._resource_sources.items()}
+        timeline._material_depots = self._material_depots
+        return timeline
 
     def can_schedule_at_the_moment(self, id: str, start_time: Time, materials: list[Material], batch_size: int) -> bool:
         return self.find_min_material_time(id, start_time, materials, batch_size) == start_time
@@ -67,20 +88,33 @@ class SupplyTimeline:
         return deliveries, start_time, max_finish_time
 
     def _find_best_supply(self, material: str, count: int, deadline: Time) -> str:
-        # TODO Make better algorithm
-        if self._resource_sources.get(material, None) is None:
+        """
+        Chooses the depot with the least deliveries before `deadline` among the ones having `count` of `material`.
+        Ties are resolved by the order of preference of depots, so the first depot without such deliveries is taken
+        without looking at the rest ones.
+        """
+        material_sources = self._resource_sources.get(material, None)
+        if material_sources is None:
             raise NoAvailableResources(
                 f'Schedule can not be built. No available resource sources with material {material}')
-        depots = [depot_id for depot_id, depot_count in self._resource_sources[material].items()
-                  if depot_count >= count]
-        if not depots:
+
+        deadline = deadline.value
+        best_depot = None
+        best_deliveries = 0
+        for depot_id in self._material_depots[material]:
+            if material_sources[depot_id] < count:
+                continue
+            deliveries = self._timeline[depot_id].bisect_key_left(deadline)
+            if best_depot is None or deliveries < best_deliveries:
+                best_depot = depot_id
+                best_deliveries = deliveries
+                if not deliveries:
+                    break
+
+        if best_depot is None:
             raise NotEnoughMaterialsInDepots(
                 f"Schedule can not be built. No one supplier has enough '{material}' material")
-        depots = [(depot_id, self._timeline[depot_id].bisect_key_left(deadline), -self._capacity[depot_id])
-                  for depot_id in depots]
-        depots.sort(key=itemgetter(1, 2))
-
-        return depots[0][0]
+        return best_depot
 
     def supply_resources(self, work_id: str, deadline: Time, materials: list[Material], simulate: bool,
                          min_supply_start_time: Time = Time(0)) \
@@ -108,7 +142,7 @@ class SupplyTimeline:
         def update_material_timeline_and_res_sources(timeline: ExtendedSortedList, mat_sources: dict[str, int]):
             for time, count in material_delivery_list:
                 mat_sources[depot] -= count
-                ind = timeline.bisect_key_left(time)
+                ind = timeline.bisect_key_left(time.value)
                 timeline_time, timeline_count = timeline[ind]
                 if timeline_time == time:
                     timeline[ind] = (time, timeline_count - count)
@@ -138,7 +172,7 @@ class SupplyTimeline:
             material_timeline = self._timeline[depot]
             capacity = self._capacity[depot]
             need_count = material.count
-            idx_left = idx_base = material_timeline.bisect_key_right(deadline) - 1
+            idx_left = idx_base = material_timeline.bisect_key_right(deadline.value) - 1
             cur_time = deadline - 1
             material_delivery_list = [] if not simulate else None
 
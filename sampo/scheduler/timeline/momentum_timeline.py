@@ -14,6 +14,7 @@ from sampo.schemas.requirements import WorkerReq
 from sampo.schemas.resources import Worker
 from sampo.schemas.schedule_spec import WorkSpec
 from sampo.schemas.scheduled_work import ScheduledWork
+from sampo.schemas.sorted_list import copy_sorted_key_list
 from sampo.schemas.time import Time
 from sampo.schemas.time_estimator import WorkTimeEstimator, DefaultWorkEstimator
 from sampo.schemas.types import ScheduleEvent, EventType
@@ -69,6 +70,71 @@ class MomentumTimeline(Timeline):
         self._task_index = 0
         self._material_timeline = SupplyTimeline(landscape)
         self.zone_timeline = ZoneTimeline(landscape.zone_config)
+        self._init_ownership()
+
+    def _init_ownership(self):
+        # states of resources, that are not shared with other timelines, so they can be modified in-place.
+        # Shared states are copied before the first modification, see `fork`
+        self._owned: set[tuple[str, str]] = {(contractor, worker_name)
+                                             for contractor, contractor_timeline in self._timeline.items()
+                                             for worker_name in contractor_timeline}
+        # the state this timeline was forked with, it's restored by `rollback`
+        self._base = None
+
+    @staticmethod
+    def _copy_state(state: SortedList[ScheduleEvent]) -> SortedList[ScheduleEvent]:
+        def copy_event(event: ScheduleEvent) -> ScheduleEvent:
+            return ScheduleEvent(event.seq_id, event.event_type, event.time, event.swork,
+                                 event.available_workers_count)
+
+        return copy_sorted_key_list(state, copy_event)
+
+    def _own_state(self, contractor_id: str, worker_name: str) -> SortedList[ScheduleEvent]:
+        """
+        Returns the state of the resource, that can be modified in-place
+        """
+        state = self._timeline[contractor_id][worker_name]
+        if (contractor_id, worker_name) not in self._owned:
+            state = self._copy_state(state)
+            self._timeline[contractor_id][worker_name] = state
+            self._owned.add((contractor_id, worker_name))
+        return state
+
+    def copy(self) -> 'MomentumTimeline':
+        """
+        Returns the independent copy of this timeline, which can be modified without affecting the original one.
+        """
+        timeline = type(self).__new__(type(self))
+        timeline._timeline = {contractor: {worker_name: self._copy_state(state)
+                                           for worker_name, state in contractor_timeline.items()}
+                              for contractor, contractor_timeline in self._timeline.items()}
+        timeline._task_index = self._task_index
+        timeline._material_timeline = self._material_timeline.copy()
+        timeline.zone_timeline = self.zone_timeline.copy()
+        timeline._init_ownership()
+        return timeline
+
+    def fork(self) -> 'MomentumTimeline':
+        # states of resources become shared by both timelines and the base of the fork
+        self._owned = set()
+        timeline = type(self).__new__(type(self))
+        timeline._base = ({contractor: dict(contractor_timeline)
+                           for contractor, contractor_timeline in self._timeline.items()},
+                          self._task_index, self._material_timeline.copy(), self.zone_timeline.copy())
+        timeline.rollback()
+        return timeline
+
+    def rollback(self):
+        if self._base is None:
+            raise ValueError('Only the forked timeline can be rolled back')
+        resources, task_index, material_timeline, zone_timeline = self._base
+        self._timeline = {contractor: dict(contractor_timeline)
+                          for contractor, contractor_timeline in resources.items()}
+        self._owned = set()
+        self._task_index = task_index
+        # materials and zones are copied at once, they are usually much smaller than resources
+        self._material_timeline = material_timeline.copy()
+        self.zone_timeline = zone_timeline.copy()
 
     def find_min_start_time_with_additional(self,
                                             node: GraphNode,
@@ -193,10 +259,8 @@ class MomentumTimeline(Timeline):
 
         for node in inseparable_chain:
             for i, wreq in enumerate(node.work_unit.worker_reqs):
-                initial_event: ScheduleEvent = resource_timeline[wreq.kind][0]
-                assert initial_event.event_type is EventType.INITIAL
                 # if this contractor initially has fewer workers of this type, then needed...
-                if initial_event.available_workers_count < passed_workers[i].count:
+                if self._initial_workers_count(resource_timeline[wreq.kind]) < passed_workers[i].count:
                     return Time.inf()
 
         # here we look for the earliest time slot that can satisfy all the worker's specializations
@@ -239,6 +303,15 @@ class MomentumTimeline(Timeline):
 
         return start
 
+    @staticmethod
+    def _initial_workers_count(state: SortedList[ScheduleEvent]) -> int:
+        """
+        Returns the number of workers of the resource available before any work is scheduled
+        """
+        initial_event: ScheduleEvent = state[0]
+        assert initial_event.event_type is EventType.INITIAL
+        return initial_event.available_workers_count
+
     @staticmethod
     def _find_earliest_time_slot(state: SortedList[ScheduleEvent],
                                  parent_time: Time,
@@ -369,7 +442,7 @@ class MomentumTimeline(Timeline):
         start = finish_time - exec_time
         end = finish_time
         for w in worker_team:
-            state = self._timeline[w.contractor_id][w.name]
+            state = self._own_state(w.contractor_id, w.name)
             start_idx = state.bisect_right(start)
             end_idx = state.bisect_left((end, -1, EventType.INITIAL))
             available_workers_count = state[start_idx - 1].available_workers_count
@@ -0,0 +1,257 @@
+from sampo.scheduler.timeline.material_timeline import SupplyTimeline
+from sampo.scheduler.timeline.momentum_timeline import MomentumTimeline
+from sampo.scheduler.timeline.zone_timeline import ZoneTimeline
+from sampo.scheduler.utils import WorkerContractorPool
+from sampo.schemas.graph import GraphNode
+from sampo.schemas.landscape import LandscapeConfiguration
+from sampo.schemas.resources import Worker
+from sampo.schemas.schedule_spec import WorkSpec
+from sampo.schemas.scheduled_work import ScheduledWork
+from sampo.schemas.time import Time
+
+# the power of two covering all the time points up to `Time.inf()`
+TIME_DOMAIN = 1 << 31
+
+
+class ResourceSegmentTree:
+    """
+    Numbers of available workers of one type of one contractor at each integer time point.
+
+    It is the range-add/range-min/range-max segment tree over the whole time axis `[0, TIME_DOMAIN)`.
+    Time points aren't known in advance, so nodes are allocated lazily, only when an update splits the range
+    of a node. The tree has `O(u * log(TIME_DOMAIN))` nodes after `u` updates,
+    and each operation touches `O(log(TIME_DOMAIN))` of them.
+    The value of a node is its own addition plus the minimum (maximum) of children,
+    a node without children represents the constant on its whole range.
+    """
+
+    __slots__ = ('capacity', 'last_time', '_add', '_min', '_max', '_left')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        # time of the last finish of works using this resource
+        self.last_time = 0
+        # node 0 is the root, so zero child index means the absence of children.
+        # Children are allocated in pairs, so the right child of the node is `_left[node] + 1`
+        self._add = [capacity]
+        self._min = [capacity]
+        self._max = [capacity]
+        self._left = [0]
+
+    def copy(self) -> 'ResourceSegmentTree':
+        tree = ResourceSegmentTree.__new__(ResourceSegmentTree)
+        tree.capacity = self.capacity
+        tree.last_time = self.last_time
+        tree._add = self._add.copy()
+        tree._min = self._min.copy()
+        tree._max = self._max.copy()
+        tree._left = self._left.copy()
+        return tree
+
+    def add(self, start: int, end: int, delta: int):
+        """
+        Adds `delta` workers to all the time points of `[start, end)`
+        """
+        start = max(start, 0)
+        end = min(end, TIME_DOMAIN)
+        if start < end:
+            self._update(0, 0, TIME_DOMAIN, start, end, delta)
+
+    def _update(self, node: int, lo: int, hi: int, start: int, end: int, delta: int):
+        if start <= lo and hi <= end:
+            self._add[node] += delta
+            self._min[node] += delta
+            self._max[node] += delta
+            return
+
+        left = self._left[node]
+        if not left:
+            left = len(self._add)
+            self._left[node] = left
+            self._add += (0, 0)
+            self._min += (0, 0)
+            self._max += (0, 0)
+            self._left += (0, 0)
+
+        mid = (lo + hi) >> 1
+        if start < mid:
+            self._update(left, lo, mid, start, end, delta)
+        if end > mid:
+            self._update(left + 1, mid, hi, start, end, delta)
+
+        add = self._add[node]
+        self._min[node] = add + min(self._min[left], self._min[left + 1])
+        self._max[node] = add + max(self._max[left], self._max[left + 1])
+
+    def find_last_less(self, start: int, end: int, count: int) -> int:
+        """
+        Returns the last time point of `[start, end)` with less than `count` available workers or -1 if there is none
+        """
+        start = max(start, 0)
+        end = min(end, TIME_DOMAIN)
+        if start >= end:
+            return -1
+        return self._last_less(0, 0, TIME_DOMAIN, start, end, count)
+
+    def _last_less(self, node: int, lo: int, hi: int, start: int, end: int, count: int) -> int:
+        # `count` is reduced by the additions of ancestors
+        if self._min[node] >= count:
+            return -1
+        left = self._left[node]
+        if not left:
+            return min(hi, end) - 1
+
+        count -= self._add[node]
+        mid = (lo + hi) >> 1
+        if end > mid:
+            found = self._last_less(left + 1, mid, hi, start, end, count)
+            if found >= 0:
+                return found
+        if start < mid:
+            return self._last_less(left, lo, mid, start, end, count)
+        return -1
+
+    def find_first_at_least(self, start: int, count: int) -> int:
+        """
+        Returns the first time point since `start` with at least `count` available workers or -1 if there is none
+        """
+        start = max(start, 0)
+        if start >= TIME_DOMAIN:
+            return -1
+        return self._first_at_least(0, 0, TIME_DOMAIN, start, count)
+
+    def _first_at_least(self, node: int, lo: int, hi: int, start: int, count: int) -> int:
+        # `count` is reduced by the additions of ancestors
+        if self._max[node] < count:
+            return -1
+        left = self._left[node]
+        if not left:
+            return max(lo, start)
+
+        count -= self._add[node]
+        mid = (lo + hi) >> 1
+        if start < mid:
+            found = self._first_at_least(left, lo, mid, start, count)
+            if found >= 0:
+                return found
+        return self._first_at_least(left + 1, mid, hi, start, count)
+
+
+class SegmentTreeTimeline(MomentumTimeline):
+    """
+    `MomentumTimeline` that stores the available resources in segment trees instead of lists of events.
+
+    Searching for the time slot jumps over whole intervals of lacking workers
+    and scheduling of the work is one range update, both take `O(log T)` per resource and per jump,
+    while `MomentumTimeline` scans all the events of the execution window.
+    Produces the same schedules as `MomentumTimeline`.
+    """
+
+    def __init__(self, worker_pool: WorkerContractorPool, landscape: LandscapeConfiguration):
+        self._timeline: dict[str, dict[str, ResourceSegmentTree]] = {}
+        for worker_name, worker_counts in worker_pool.items():
+            for contractor, worker in worker_counts.items():
+                if contractor not in self._timeline:
+                    self._timeline[contractor] = {}
+                self._timeline[contractor][worker_name] = ResourceSegmentTree(worker.count)
+
+        self._task_index = 0
+        self._material_timeline = SupplyTimeline(landscape)
+        self.zone_timeline = ZoneTimeline(landscape.zone_config)
+        self._init_ownership()
+
+    @staticmethod
+    def _copy_state(state: ResourceSegmentTree) -> ResourceSegmentTree:
+        return state.copy()
+
+    @staticmethod
+    def _initial_workers_count(state: ResourceSegmentTree) -> int:
+        return state.capacity
+
+    @staticmethod
+    def _find_earliest_time_slot(state: ResourceSegmentTree,
+                                 parent_time: Time,
+                                 exec_time: Time,
+                                 required_worker_count: int,
+                                 spec: WorkSpec) -> Time:
+        """
+        Searches for the earliest time starting from start_time, when a time slot
+        of exec_time is available, when required_worker_count of resources is available
+
+        :param state: stores available workers of the certain resource
+        :param parent_time: the minimum start time starting from the end of the parent task
+        :param exec_time: execution time of work
+        :param required_worker_count: requirements amount of Worker
+        :return: the earliest start time
+        """
+        # if the work has zero execution time, then there is no need to take resources
+        if exec_time == 0:
+            return parent_time
+
+        if spec.is_independent:
+            return max(parent_time, Time(state.last_time))
+
+        start = parent_time.value
+        duration = exec_time.value
+        # after the last finish all the workers are available, so the task can be put there
+        while start < state.last_time:
+            lack_time = state.find_last_less(start, start + duration, required_worker_count)
+            if lack_time < 0:
+                break
+            # the slot can start only after the whole interval of lacking workers
+            start = state.find_first_at_least(lack_time + 1, required_worker_count)
+            if start < 0:
+                start = max(lack_time + 1, state.last_time)
+
+        return Time(start)
+
+    def can_schedule_at_the_moment(self,
+                                   node: GraphNode,
+                                   worker_team: list[Worker],
+                                   spec: WorkSpec,
+                                   node2swork: dict[GraphNode, ScheduledWork],
+                                   start_time: Time,
+                                   exec_time: Time) -> bool:
+        if spec.is_independent:
+            # squash all the timeline to the last point
+            return all(self._timeline[worker.contractor_id][worker.name].last_time <= start_time
+                       for worker in worker_team)
+
+        start = start_time.value
+        end = (start_time + exec_time).value
+
+        # checking availability of renewable resources including the moment of the finish
+        for w in worker_team:
+            if self._timeline[w.contractor_id][w.name].find_last_less(start, end + 1, w.count) >= 0:
+                return False
+
+        if not self._material_timeline.can_schedule_at_the_moment(node.id, start_time,
+                                                                  node.work_unit.need_materials(),
+                                                                  node.work_unit.workground_size):
+            return False
+        if not self.zone_timeline.can_schedule_at_the_moment(node.work_unit.zone_reqs, start_time, exec_time):
+            return False
+
+        return True
+
+    def update_timeline(self,
+                        finish_time: Time,
+                        exec_time: Time,
+                        node: GraphNode,
+                        worker_team: list[Worker],
+                        spec: WorkSpec):
+        """
+        Takes workers of `worker_team` for the execution interval of the work
+        """
+        # if the work has zero execution time, then there is no need to take resources
+        if exec_time == 0:
+            return
+
+        self._task_index += 1
+
+        start = (finish_time - exec_time).value
+        end = finish_time.value
+        for w in worker_team:
+            state = self._own_state(w.contractor_id, w.name)
+            state.add(start, end, -w.count)
+            state.last_time = max(state.last_time, end)
@@ -3,35 +3,75 @@ from collections import deque
 from sortedcontainers import SortedList
 
 from sampo.schemas.requirements import ZoneReq
-from sampo.schemas.time import Time
+from sampo.schemas.sorted_list import copy_sorted_key_list
+from sampo.schemas.time import Time, TIME_INF
 from sampo.schemas.types import EventType, ScheduleEvent
 from sampo.schemas.zones import ZoneConfiguration, Zone, ZoneTransition
 from sampo.utilities.collections_util import build_index
 
 
-class ZoneTimeline:
+def event_cmp(event: ScheduleEvent | Time | tuple[int, int, int]) -> tuple[int, int, int]:
+    # keys hold plain time values, because they are compared on each bisection of the timeline
+    if isinstance(event, ScheduleEvent):
+        if event.event_type is EventType.INITIAL:
+            return -1, -1, event.event_type.priority
 
-    def __init__(self, config: ZoneConfiguration):
-        def event_cmp(event: ScheduleEvent | Time | tuple[Time, int, int]) -> tuple[Time, int, int]:
-            if isinstance(event, ScheduleEvent):
-                if event.event_type is EventType.INITIAL:
-                    return Time(-1), -1, event.event_type.priority
+        return event.time.value, event.seq_id, event.event_type.priority
+
+    if isinstance(event, Time):
+        # instances of Time must be greater than almost all ScheduleEvents with same time point
+        return event.value, TIME_INF, 2
+
+    if isinstance(event, tuple):
+        return event
 
-                return event.time, event.seq_id, event.event_type.priority
+    raise ValueError(f'Incorrect type of value: {type(event)}')
 
-            if isinstance(event, Time):
-                # instances of Time must be greater than almost all ScheduleEvents with same time point
-                return event, Time.inf().value, 2
 
-            if isinstance(event, tuple):
-                return event
+class ZoneTimeline:
+    """
+    Statuses of zones as the lists of events.
 
-            raise ValueError(f'Incorrect type of value: {type(event)}')
+    Besides the events themselves each zone is indexed by the lists of its START events
+    and of its events with each status, both ordered as the events.
+    They answer whether the point is inside the interval and where the last incompatible status of the window is
+    in `O(log n)` instead of scanning the events.
+    """
 
-        self._timeline = {zone: SortedList([ScheduleEvent(-1, EventType.INITIAL, Time(0), None, status)],
-                                           key=event_cmp)
-                          for zone, status in config.start_statuses.items()}
+    def __init__(self, config: ZoneConfiguration):
+        self._timeline: dict[str, SortedList[ScheduleEvent]] = {}
+        self._starts: dict[str, SortedList[ScheduleEvent]] = {}
+        self._status_events: dict[str, dict[int, SortedList[ScheduleEvent]]] = {}
+        for zone, status in config.start_statuses.items():
+            self._timeline[zone] = SortedList(key=event_cmp)
+            self._starts[zone] = SortedList(key=event_cmp)
+            self._status_events[zone] = {}
+            self._add_event(zone, ScheduleEvent(-1, EventType.INITIAL, Time(0), None, status))
         self._config = config
+        self._incompatible_statuses: dict[int, list[int]] = {}
+
+    def copy(self) -> 'ZoneTimeline':
+        """
+        Returns the independent copy of this timeline. Events are not modified after insertion, so they are shared.
+        """
+        timeline = ZoneTimeline.__new__(ZoneTimeline)
+        timeline._timeline = {zone: copy_sorted_key_list(state) for zone, state in self._timeline.items()}
+        timeline._starts = {zone: copy_sorted_key_list(starts) for zone, starts in self._starts.items()}
+        timeline._status_events = {zone: {status: copy_sorted_key_list(events) for status, events in index.items()}
+                                   for zone, index in self._status_events.items()}
+        timeline._config = self._config
+        timeline._incompatible_statuses = self._incompatible_statuses
+        return timeline
+
+    def _add_event(self, zone: str, event: ScheduleEvent):
+        self._timeline[zone].add(event)
+        status_events = self._status_events[zone].get(event.available_workers_count)
+        if status_events is None:
+            status_events = SortedList(key=event_cmp)
+            self._status_events[zone][event.available_workers_count] = status_events
+        status_events.add(event)
+        if event.event_type is EventType.START:
+            self._starts[zone].add(event)
 
     def find_min_start_time(self, zones: list[ZoneReq], parent_time: Time, exec_time: Time) -> Time:
         # here we look for the earliest time slot that can satisfy all the zones
@@ -53,11 +93,10 @@ class ZoneTimeline:
             i += 1
 
             wreq = queue.popleft()
-            state = self._timeline[wreq.kind]
             # we look for the earliest time slot starting from 'start' time moment
             # if we have found a time slot for the previous task,
             # we should start to find for the earliest time slot of other task since this new time
-            found_start = self._find_earliest_time_slot(state, start, exec_time, type2status[wreq.kind])
+            found_start = self._find_earliest_time_slot(wreq.kind, start, exec_time, type2status[wreq.kind])
 
             assert found_start >= start
 
@@ -79,23 +118,58 @@ class ZoneTimeline:
 
         # This should be uncommented when there are problems with zone scheduling correctness
         # for w in zones:
-        #     self._validate(start, exec_time, self._timeline[w.kind], w.required_status)
+        #     self._validate(start, exec_time, w.kind, w.required_status)
 
         return start
 
     def _match_status(self, target: int, match: int) -> bool:
         return self._config.statuses.match_status(target, match)
 
-    def _validate(self, start_time: Time, exec_time: Time, state: SortedList[ScheduleEvent], required_status: int):
+    def _last_incompatible_event(self, zone: str, start_idx: int, end_time: Time, required_status: int) -> int:
+        """
+        Searches for the last event with status not matching `required_status`
+        starting from `start_idx` and not later than `end_time`
+
+        :param zone: name of the zone
+        :param start_idx: index of the first event of the window
+        :param end_time: the end of the window, the events of this time point are included
+        :param required_status: requirements status of zone
+        :return: the index of the found event or -1 if all the statuses of the window match
+        """
+        incompatible_statuses = self._incompatible_statuses.get(required_status)
+        if incompatible_statuses is None:
+            incompatible_statuses = [status for status in range(self._config.statuses.statuses_available())
+                                     if not self._match_status(status, required_status)]
+            self._incompatible_statuses[required_status] = incompatible_statuses
+
+        state = self._timeline[zone]
+        last_idx = -1
+        for status in incompatible_statuses:
+            status_events = self._status_events[zone].get(status)
+            if status_events is None:
+                continue
+            events_count = status_events.bisect_right(end_time)
+            if events_count == 0:
+                continue
+            # the events with equal keys are kept in the insertion order in all the lists,
+            # so the event is found among them by identity
+            event = status_events[events_count - 1]
+            idx = state.bisect_key_right(event_cmp(event)) - 1
+            while state[idx] is not event:
+                idx -= 1
+            last_idx = max(last_idx, idx)
+
+        return last_idx if last_idx >= start_idx else -1
+
+    def _validate(self, start_time: Time, exec_time: Time, zone: str, required_status: int):
         # === THE INNER VALIDATION ===
 
+        state = self._timeline[zone]
         start_idx = state.bisect_right(start_time)
-        end_idx = state.bisect_right(start_time + exec_time)
         start_status = state[start_idx - 1].available_workers_count
 
-        # updating all events in between the start and the end of our current task
-        for event in state[start_idx: end_idx]:
-            assert self._config.statuses.match_status(event.available_workers_count, required_status)
+        # checking all events in between the start and the end of our current task
+        assert self._last_incompatible_event(zone, start_idx, start_time + exec_time, required_status) < 0
 
         assert state[start_idx - 1].event_type == EventType.END \
                or (state[start_idx - 1].event_type == EventType.START
@@ -106,7 +180,7 @@ class ZoneTimeline:
         # === END OF INNER VALIDATION ===
 
     def _find_earliest_time_slot(self,
-                                 state: SortedList[ScheduleEvent],
+                                 zone: str,
                                  parent_time: Time,
                                  exec_time: Time,
                                  required_status: int) -> Time:
@@ -114,12 +188,13 @@ class ZoneTimeline:
         Searches for the earliest time starting from start_time, when a time slot
         of exec_time is available, when required_worker_count of resources is available
 
-        :param state: stores Timeline for the certain resource
+        :param zone: name of the zone
         :param parent_time: the minimum start time starting from the end of the parent task
         :param exec_time: execution time of work
         :param required_status: requirements status of zone
         :return: the earliest start time
         """
+        state = self._timeline[zone]
         current_start_time = parent_time
         current_start_idx = state.bisect_right(current_start_time) - 1
 
@@ -127,14 +202,13 @@ class ZoneTimeline:
         # as long as we assured that this contractor has enough capacity at all to handle the task
         # we can stop and put the task at the very end
         i = 0
-        while len(state[current_start_idx:]) > 0:
+        while current_start_idx < len(state):
             if i > 0 and i % 50 == 0:
                 print(f'Warning! Probably cycle in looking for earliest time slot: {i} iteration')
                 print(f'Current start time: {current_start_time}, current start idx: {current_start_idx}')
             i += 1
 
             current_start_status = state[current_start_idx].available_workers_count
-            end_idx = state.bisect_right(current_start_time + exec_time)
 
             if not self._match_status(current_start_status, required_status):
                 if current_start_idx == len(state) - 1:
@@ -154,7 +228,7 @@ class ZoneTimeline:
                 # if we are outside intervals, we can be in right or wrong status, so let's check it
                 # else we are inside the interval with right status so let
 
-                if self._is_inside_interval(state, current_start_idx):
+                if self._is_inside_interval(zone, current_start_idx):
                     if not self._match_status(current_start_status, required_status):
                         # we are inside the interval with wrong status, so we can't change it, go next
                         current_start_idx += 1
@@ -164,27 +238,20 @@ class ZoneTimeline:
                     # we are outside the interval, should change status
                     # check that we can do it
                     current_start_time += self._config.time_costs[current_start_status, required_status]
-                    end_idx = state.bisect_right(current_start_time + exec_time)
 
             # here we are guaranteed that current_start_time is in right status
             # so go right and check matching statuses
             # this step performed like in MomentumTimeline
-            not_compatible_status_found = False
-            for idx in range(end_idx - 1, current_start_idx - 1, -1):
-                if not self._match_status(state[idx].available_workers_count, required_status):
-                    # we're trying to find a new slot that would start with
-                    # either the last index passing the quantity check
-                    # or the index after the execution interval
-                    # we need max here to process a corner case when the problem arises
-                    # on current_start_idx - 1
-                    # without max it would get into infinite cycle
-                    current_start_idx = max(idx, current_start_idx) + 1
-                    not_compatible_status_found = True
-                    break
-
-            if not not_compatible_status_found:
+            idx = self._last_incompatible_event(zone, current_start_idx, current_start_time + exec_time,
+                                                required_status)
+            if idx < 0:
                 break
 
+            # we're trying to find a new slot that would start with
+            # either the last index passing the quantity check
+            # or the index after the execution interval
+            current_start_idx = idx + 1
+
             if current_start_idx >= len(state):
                 # This should be uncommented when there are problems with zone scheduling correctness
 
@@ -199,21 +266,25 @@ class ZoneTimeline:
             current_start_time = state[current_start_idx].time
 
         # This should be uncommented when there are problems with zone scheduling correctness
-        self._validate(current_start_time, exec_time, state, required_status)
+        self._validate(current_start_time, exec_time, zone, required_status)
 
         return current_start_time
 
-    # noinspection PyMethodMayBeStatic
-    def _is_inside_interval(self, state: SortedList[ScheduleEvent], idx: int) -> bool:
+    def _is_inside_interval(self, zone: str, idx: int) -> bool:
         # TODO Make better algorithms to check that we can change status in point `start_time - change_cost`
-        starts_count = 0
-        ends_count = 0
-        # checking from end because it's more realistic to call this function at the almost end of timeline
-        for cpkt in state[idx:]:
-            if cpkt.event_type == EventType.START:
-                starts_count += 1
-            else:
-                ends_count += 1
+        state = self._timeline[zone]
+        if idx >= len(state):
+            return True
+
+        # counting START events since `idx` by the index of them
+        starts = self._starts[zone]
+        key = event_cmp(state[idx])
+        starts_before = starts.bisect_key_left(key)
+        if state[idx].event_type is EventType.START:
+            # the events with equal keys have the same type
+            starts_before += idx - state.bisect_key_left(key)
+        starts_count = len(starts) - starts_before
+        ends_count = len(state) - idx - starts_count
         # we are inside the interval with incompatible status, break
         return starts_count == ends_count
 
@@ -222,7 +293,6 @@ class ZoneTimeline:
             state = self._timeline[zone.kind]
 
             start_idx = state.bisect_right(start_time)
-            end_idx = state.bisect_right(start_time + exec_time)
             start_status = state[start_idx - 1].available_workers_count
 
             if not self._match_status(start_status, zone.required_status):
@@ -233,13 +303,12 @@ class ZoneTimeline:
                     # we have incompatible status inside our interval, break
                     return False
 
-                if not self._is_inside_interval(state, start_idx):
+                if not self._is_inside_interval(zone.kind, start_idx):
                     return False
 
             # checking all events in between the start and the end of our current task
-            for event in state[start_idx: end_idx]:
-                if not self._match_status(event.available_workers_count, zone.required_status):
-                    return False
+            if self._last_incompatible_event(zone.kind, start_idx, start_time + exec_time, zone.required_status) >= 0:
+                return False
 
         return True
 
@@ -252,14 +321,16 @@ class ZoneTimeline:
             start_status = state[start_idx - 1].available_workers_count
 
             # This should be uncommented when there are problems with zone scheduling correctness
-            self._validate(start_time, exec_time, state, zone.status)
+            self._validate(start_time, exec_time, zone.name, zone.status)
 
             change_cost = self._config.time_costs[start_status, zone.status] \
                 if not self._config.statuses.match_status(start_status, zone.status) \
                 else 0
 
-            state.add(ScheduleEvent(index, EventType.START, start_time - change_cost, None, zone.status))
-            state.add(ScheduleEvent(index, EventType.END, start_time - change_cost + exec_time, None, zone.status))
+            self._add_event(zone.name, ScheduleEvent(index, EventType.START, start_time - change_cost, None,
+                                                     zone.status))
+            self._add_event(zone.name, ScheduleEvent(index, EventType.END, start_time - change_cost + exec_time, None,
+                                                     zone.status))
 
             if start_status != zone.status and zone.status != 0:
                 # if we need to change status, record it
@@ -283,8 +354,10 @@ class ZoneTimeline:
                 else 0
             finish_time = latest_time + change_cost
 
-            state.add(ScheduleEvent(Time.inf().value, EventType.START, latest_time, None, zone.status))
-            state.add(ScheduleEvent(Time.inf().value, EventType.END, finish_time, None, zone.status))
+            self._add_event(zone.name, ScheduleEvent(Time.inf().value, EventType.START, latest_time, None,
+                                                     zone.status))
+            self._add_event(zone.name, ScheduleEvent(Time.inf().value, EventType.END, finish_time, None,
+                                                     zone.status))
 
             if latest_status != zone.status and zone.status != 0:
                 # if we need to change status, record it
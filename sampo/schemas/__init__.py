@@ -10,6 +10,7 @@ from sampo.schemas.project import ScheduledProject
 from sampo.schemas.requirements import BaseReq, MaterialReq, ZoneReq, EquipmentReq, WorkerReq, ConstructionObjectReq
 from sampo.schemas.resources import Resource, Worker, WorkerProductivityMode, ConstructionObject, Material, Equipment
 from sampo.schemas.schedule import Schedule
+from sampo.schemas.schedule_evaluation import ScheduleEvaluation
 from sampo.schemas.scheduled_work import ScheduledWork
 from sampo.schemas.serializable import JSONSerializable, AutoJSONSerializable
 from sampo.schemas.sorted_list import ExtendedSortedList
@@ -426,6 +426,8 @@ class WorkGraph(JSONSerializable['WorkGraph']):
         deserialized = self._deserialize(state)
         object.__setattr__(self, 'start', deserialized.start)
         object.__setattr__(self, 'finish', deserialized.finish)
+        # nodes now belong to this graph, so `__del__` of the temporary graph shouldn't clear their edges
+        object.__setattr__(deserialized, 'nodes', [])
         self.__post_init__()
 
     def __del__(self):
@@ -0,0 +1,237 @@
+from typing import Callable, Iterable
+
+import numpy as np
+
+from sampo.schemas.graph import WorkGraph
+from sampo.schemas.schedule import Schedule
+from sampo.schemas.scheduled_work import ScheduledWork
+from sampo.schemas.time import Time, TIME_INF
+
+
+class ScheduleEvaluation:
+    """
+    Lightweight array-backed representation of the schedule, used to compute fitness values.
+    Unlike `Schedule` it doesn't build DataFrame, so it is cheap to construct for every chromosome.
+
+    All arrays are indexed by work index. Works that weren't scheduled have infinite start and finish times.
+    """
+
+    def __init__(self,
+                 start: np.ndarray,
+                 finish: np.ndarray,
+                 contractor: np.ndarray,
+                 workers: np.ndarray,
+                 unit_costs: np.ndarray,
+                 worker_name2index: dict[str, int],
+                 works: list[ScheduledWork] | Callable[[], list[ScheduledWork]] | None = None,
+                 resources_sums: np.ndarray | None = None,
+                 costs_sums: np.ndarray | None = None):
+        """
+        :param start: start times of works
+        :param finish: finish times of works
+        :param contractor: index of assigned contractor for each work, -1 if there are no workers
+        :param workers: works x worker types matrix of assigned worker counts
+        :param unit_costs: works x worker types matrix of the cost of one worker unit
+        :param worker_name2index: mapping of worker names to the columns of `workers` matrix
+        :param works: source ScheduledWork objects or the function building them, needed to materialize `Schedule`
+        :param resources_sums: usage of each worker type summed over works, computed from other arrays if None
+        :param costs_sums: cost of each worker type summed over works, computed from other arrays if None
+        """
+        self.start = start
+        self.finish = finish
+        self.contractor = contractor
+        self.workers = workers
+        self.unit_costs = unit_costs
+        self._worker_name2index = worker_name2index
+        self._works = works
+        self._resources_sums = resources_sums
+        self._costs_sums = costs_sums
+        self._peaks = None
+
+    @staticmethod
+    def from_scheduled_works(works: Iterable[ScheduledWork],
+                             work_id2index: dict[str, int],
+                             worker_name2index: dict[str, int],
+                             contractor2index: dict[str, int]) -> 'ScheduleEvaluation':
+        """
+        Factory method to create a ScheduleEvaluation object from the output of schedule generation scheme
+
+        :param works: Iterable collection of ScheduledWork's
+        :param work_id2index: mapping of work ids to work indices, should contain all the works of the graph
+        :param worker_name2index: mapping of worker names to worker type indices
+        :param contractor2index: mapping of contractor ids to contractor indices
+        :return: ScheduleEvaluation
+        """
+        works = list(works)
+        works_count = len(work_id2index)
+        start = np.full(works_count, TIME_INF, dtype=np.int64)
+        finish = np.full(works_count, TIME_INF, dtype=np.int64)
+        contractor = np.full(works_count, -1, dtype=np.int64)
+        workers = np.zeros((works_count, len(worker_name2index)), dtype=np.int64)
+        unit_costs = np.zeros((works_count, len(worker_name2index)), dtype=np.float64)
+
+        for swork in works:
+            index = work_id2index[swork.id]
+            start[index] = swork.start_time.value
+            finish[index] = swork.finish_time.value
+            for worker in swork.workers:
+                worker_index = worker_name2index[worker.name]
+                workers[index, worker_index] = worker.count
+                unit_costs[index, worker_index] = worker.cost_one_unit
+                contractor[index] = contractor2index[worker.contractor_id]
+
+        return ScheduleEvaluation(start, finish, contractor, workers, unit_costs, worker_name2index, works)
+
+    @property
+    def execution_time(self) -> Time:
+        """
+        Calculates total schedule execution time.
+
+        :return: Finish time of the last work.
+        """
+        return Time(int(self.finish.max(initial=0)))
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self.finish - self.start
+
+    def _resources_columns(self, resources_names: Iterable[str] | None) -> np.ndarray:
+        if resources_names is None:
+            return np.arange(self.workers.shape[1])
+        return np.array([self._worker_name2index[name] for name in resources_names
+                         if name in self._worker_name2index], dtype=int)
+
+    def resources_usage(self, resources_names: Iterable[str] | None = None) -> dict[str, np.ndarray]:
+        """
+        Builds resource usage profiles over all the time points of the schedule.
+
+        :return: dictionary of resource usage by resource name
+        """
+        columns = self._resources_columns(resources_names)
+        points = np.unique(np.concatenate((self.start, self.finish)))
+        start_idx = np.searchsorted(points, self.start)
+        finish_idx = np.searchsorted(points, self.finish)
+
+        # difference array: count is added at the start point and removed at the finish point
+        diff = np.zeros((len(points) + 1, len(columns)), dtype=np.int64)
+        np.add.at(diff, start_idx, self.workers[:, columns])
+        np.subtract.at(diff, finish_idx, self.workers[:, columns])
+        usage = np.cumsum(diff, axis=0)[:-1]
+
+        index2worker_name = {index: name for name, index in self._worker_name2index.items()}
+        return {index2worker_name[column]: usage[:, i] for i, column in enumerate(columns)}
+
+    def resources_peaks(self, resources_names: Iterable[str] | None = None) -> dict[str, int]:
+        # peaks of all the resources are computed once by the single sweep
+        if self._peaks is None:
+            self._peaks = {res: int(res_usage.max(initial=0)) for res, res_usage in self.resources_usage().items()}
+        if resources_names is None:
+            return dict(self._peaks)
+        return {res: self._peaks[res] for res in resources_names if res in self._peaks}
+
+    def resources_peaks_sum(self, resources_names: Iterable[str] | None = None) -> int:
+        """
+        Count the summary of resources peaks usage
+        """
+        if self.execution_time.is_inf():
+            return Time.inf().value
+        return sum(self.resources_peaks(resources_names).values())
+
+    def resources_sum(self, resources_names: Iterable[str] | None = None) -> int:
+        """
+        Count the summary usage of resources
+        """
+        columns = self._resources_columns(resources_names)
+        if self._resources_sums is not None:
+            return int(self._resources_sums[columns].sum())
+        return int((self.workers[:, columns] * self.durations[:, None]).sum())
+
+    def resources_costs_sum(self, resources_names: Iterable[str] | None = None) -> float:
+        """
+        Count the summary cost of resources
+        """
+        columns = self._resources_columns(resources_names)
+        if self._costs_sums is not None:
+            return float(self._costs_sums[columns].sum())
+        return float((self.workers[:, columns] * self.unit_costs[:, columns] * self.durations[:, None]).sum())
+
+    def to_schedule(self, wg: WorkGraph | None = None) -> Schedule:
+        """
+        Materializes the full `Schedule` object. This is slow, use it only for final solutions.
+        """
+        works = self._works() if callable(self._works) else self._works
+        return Schedule.from_scheduled_works(works, wg)
+
+
+class ResourceUsageAccumulator:
+    """
+    Collects the arrays of `ScheduleEvaluation` while schedule generation scheme places works,
+    so the evaluation doesn't need the second pass over the scheduled works.
+    Usage and cost of each worker type are summed on the fly.
+    """
+
+    def __init__(self,
+                 work_id2index: dict[str, int],
+                 worker_name2index: dict[str, int],
+                 contractor2index: dict[str, int]):
+        """
+        :param work_id2index: mapping of work ids to work indices, should contain all the works of the graph
+        :param worker_name2index: mapping of worker names to worker type indices
+        :param contractor2index: mapping of contractor ids to contractor indices
+        """
+        self._work_id2index = work_id2index
+        self._worker_name2index = worker_name2index
+        self._contractor2index = contractor2index
+        works_count = len(work_id2index)
+        self.start = np.full(works_count, TIME_INF, dtype=np.int64)
+        self.finish = np.full(works_count, TIME_INF, dtype=np.int64)
+        self.contractor = np.full(works_count, -1, dtype=np.int64)
+        self.workers = np.zeros((works_count, len(worker_name2index)), dtype=np.int64)
+        self.unit_costs = np.zeros((works_count, len(worker_name2index)), dtype=np.float64)
+        self.resources_sums = np.zeros(len(worker_name2index), dtype=np.int64)
+        self.costs_sums = np.zeros(len(worker_name2index), dtype=np.float64)
+
+    def add(self, swork: ScheduledWork):
+        """
+        Registers the placed work. Each work should be registered once.
+        """
+        index = self._work_id2index[swork.id]
+        start, finish = swork.start_time.value, swork.finish_time.value
+        self.start[index] = start
+        self.finish[index] = finish
+        duration = finish - start
+        for worker in swork.workers:
+            worker_index = self._worker_name2index[worker.name]
+            self.workers[index, worker_index] = worker.count
+            self.unit_costs[index, worker_index] = worker.cost_one_unit
+            self.contractor[index] = self._contractor2index[worker.contractor_id]
+            self.resources_sums[worker_index] += worker.count * duration
+            self.costs_sums[worker_index] += worker.count * worker.cost_one_unit * duration
+
+    def add_team(self, work_id: str, start: int, finish: int, contractor_index: int,
+                 team: Iterable[tuple[int, int]], unit_costs: np.ndarray):
+        """
+        Registers the placed work by its team, so `ScheduledWork` isn't needed. Each work should be registered once.
+
+        :param team: pairs of worker type index and count
+        :param unit_costs: costs of one unit of each worker type of the assigned contractor
+        """
+        index = self._work_id2index[work_id]
+        self.start[index] = start
+        self.finish[index] = finish
+        duration = finish - start
+        for worker_index, count in team:
+            self.workers[index, worker_index] = count
+            self.unit_costs[index, worker_index] = unit_costs[worker_index]
+            self.contractor[index] = contractor_index
+            self.resources_sums[worker_index] += count * duration
+            self.costs_sums[worker_index] += count * unit_costs[worker_index] * duration
+
+    def to_evaluation(self, works: Iterable[ScheduledWork] | Callable[[], list[ScheduledWork]]) \
+            -> ScheduleEvaluation:
+        """
+        :param works: the placed works or the function building them, needed to materialize `Schedule`
+        """
+        return ScheduleEvaluation(self.start, self.finish, self.contractor, self.workers, self.unit_costs,
+                                  self._worker_name2index, works if callable(works) else list(works),
+                                  self.resources_sums, self.costs_sums)
@@ -1,8 +1,11 @@
 from abc import ABC
 from bisect import bisect_left, bisect_right
+from typing import Callable, TypeVar
 
 from sortedcontainers import SortedKeyList
 
+T = TypeVar('T')
+
 
 # TODO: describe the class (description)
 class ExtendedSortedList(SortedKeyList, ABC):
@@ -80,3 +83,26 @@ class ExtendedSortedList(SortedKeyList, ABC):
 
         if increased:
             self._len += 1
+
+
+def copy_sorted_key_list(sorted_list: SortedKeyList, item_copier: Callable[[T], T] | None = None) -> SortedKeyList:
+    """
+    Copies the sorted list reusing its internal structure, so neither sorting nor keys recalculation is performed.
+    Keys are shared with the source list, so `item_copier` should NOT modify keys of items.
+
+    Runtime complexity: `O(n)`.
+
+    :param sorted_list: the list to copy
+    :param item_copier: a function that copies mutable items. If not passed, items are shared between lists
+    :return: the copy of the list
+    """
+    new_list = sorted_list.__class__(key=sorted_list.key)
+    if item_copier is None:
+        new_list._lists = [sublist.copy() for sublist in sorted_list._lists]
+    else:
+        new_list._lists = [[item_copier(item) for item in sublist] for sublist in sorted_list._lists]
+    new_list._keys = [keys.copy() for keys in sorted_list._keys]
+    new_list._maxes = sorted_list._maxes.copy()
+    new_list._len = sorted_list._len
+    new_list._load = sorted_list._load
+    return new_list
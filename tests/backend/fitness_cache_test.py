@@ -0,0 +1,108 @@
+import numpy as np
+
+from sampo.api.genetic_api import MakespanBound
+from sampo.backend.fitness_cache import FitnessCache
+from sampo.scheduler.genetic.operators import TimeFitness
+from sampo.schemas.schedule_spec import ScheduleSpec
+
+
+def make_chromosome(seed: int):
+    rand = np.random.default_rng(seed)
+    return (rand.permutation(10), rand.integers(0, 5, (10, 3)), rand.integers(5, 10, (1, 2)),
+            ScheduleSpec(), np.zeros((10, 0), dtype=int))
+
+
+class CountingEvaluator:
+    def __init__(self):
+        self.evaluated = 0
+
+    def __call__(self, chromosomes):
+        self.evaluated += len(chromosomes)
+        return [(int(chromosome[0][0]),) for chromosome in chromosomes]
+
+
+def test_duplicates_evaluated_once():
+    cache = FitnessCache()
+    evaluator = CountingEvaluator()
+    fitness = TimeFitness()
+
+    chromosomes = [make_chromosome(0), make_chromosome(1), make_chromosome(0)]
+    result = cache.compute(fitness, chromosomes, evaluator)
+
+    assert evaluator.evaluated == 2
+    assert result[0] == result[2]
+    assert cache.hits == 1 and cache.misses == 2
+
+    # the next generation reuses computed values
+    result2 = cache.compute(fitness, [make_chromosome(1)], evaluator)
+    assert evaluator.evaluated == 2
+    assert result2[0] == result[1]
+
+
+def test_cache_bound_to_fitness():
+    cache = FitnessCache()
+    evaluator = CountingEvaluator()
+
+    cache.compute(TimeFitness(), [make_chromosome(0)], evaluator)
+    cache.compute(TimeFitness(), [make_chromosome(0)], evaluator)
+
+    assert evaluator.evaluated == 2
+
+
+def test_lru_eviction():
+    cache = FitnessCache(max_size=2)
+    evaluator = CountingEvaluator()
+    fitness = TimeFitness()
+
+    cache.compute(fitness, [make_chromosome(0), make_chromosome(1)], evaluator)
+    # touch the first chromosome, so the second one is the least recently used
+    cache.compute(fitness, [make_chromosome(0)], evaluator)
+    cache.compute(fitness, [make_chromosome(2)], evaluator)
+    assert len(cache) == 2
+
+    cache.compute(fitness, [make_chromosome(0)], evaluator)
+    assert evaluator.evaluated == 3
+    cache.compute(fitness, [make_chromosome(1)], evaluator)
+    assert evaluator.evaluated == 4
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hit_rate == 0
+
+
+def test_makespan_bound_reused_only_above_cutoff():
+    cache = FitnessCache()
+    evaluator = CountingEvaluator()
+    fitness = TimeFitness()
+    chromosome = make_chromosome(0)
+
+    def bounding_evaluator(chromosomes):
+        evaluator.evaluated += len(chromosomes)
+        return [MakespanBound((100,)) for _ in chromosomes]
+
+    cache.compute(fitness, [chromosome], bounding_evaluator, cutoff=50)
+    # the bound still proves, that the chromosome is worse than the same or lower cutoff
+    assert cache.compute(fitness, [chromosome], evaluator, cutoff=50) == [(100,)]
+    assert evaluator.evaluated == 1
+
+    # exact value is required without cutoff or with the higher one
+    assert cache.compute(fitness, [chromosome], evaluator, cutoff=150) == [(int(chromosome[0][0]),)]
+    assert evaluator.evaluated == 2
+    assert cache.compute(fitness, [chromosome], evaluator) == [(int(chromosome[0][0]),)]
+    assert evaluator.evaluated == 2
+
+
+def test_single_chromosome_get_put():
+    cache = FitnessCache()
+    fitness = TimeFitness()
+
+    assert cache.get(fitness, make_chromosome(0)) is None
+    cache.put(fitness, make_chromosome(0), (5,))
+    assert cache.get(fitness, make_chromosome(0)) == (5,)
+    assert cache.hits == 1 and cache.misses == 1
+
+    # values are shared with the batch evaluation
+    assert cache.compute(fitness, [make_chromosome(0)], CountingEvaluator()) == [(5,)]
+
+    # bounds are never returned, because asynchronous evaluation has no cutoff
+    cache.put(fitness, make_chromosome(1), MakespanBound((100,)))
+    assert cache.get(fitness, make_chromosome(1)) is None
@@ -0,0 +1,82 @@
+from random import Random
+
+from sampo.backend.multiproc import MultiprocessingComputationalBackend
+from sampo.base import SAMPO
+from sampo.scheduler.genetic.base import GeneticScheduler
+from sampo.schemas.time import Time
+
+
+def test_pool_reused_across_calls(setup_scheduler_parameters):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    def schedule(mutate_order: float) -> Time:
+        genetic = GeneticScheduler(number_of_generation=2,
+                                   mutate_order=mutate_order,
+                                   size_of_population=10,
+                                   rand=Random(1))
+        return genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)[0].execution_time
+
+    default_backend = SAMPO.backend
+    with MultiprocessingComputationalBackend(n_cpus=2) as backend:
+        SAMPO.backend = backend
+        try:
+            first = schedule(0.05)
+            pool = backend._pool
+
+            # changed parameters are pushed to the same pool
+            schedule(0.1)
+            assert backend._pool is pool
+
+            # the previous state is still cached by workers
+            assert schedule(0.05) == first
+            assert backend._pool is pool
+        finally:
+            SAMPO.backend = default_backend
+
+    # worker processes are terminated on exit
+    assert backend._pool is None
+
+
+def test_steady_state_uses_fitness_cache(setup_scheduler_parameters):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    default_backend = SAMPO.backend
+    with MultiprocessingComputationalBackend(n_cpus=2, steady_state=True) as backend:
+        SAMPO.backend = backend
+        try:
+            genetic = GeneticScheduler(number_of_generation=2,
+                                       size_of_population=10,
+                                       rand=Random(1))
+            genetic.schedule(setup_wg, setup_contractors, validate=True, landscape=setup_landscape)
+
+            # the first population is at most 10 lookups, the rest are asynchronous evaluations of offspring
+            assert backend.fitness_cache.hits + backend.fitness_cache.misses > 10
+            assert len(backend.fitness_cache) > 10
+        finally:
+            SAMPO.backend = default_backend
+
+
+def test_worker_state_keys(setup_scheduler_parameters):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    default_backend = SAMPO.backend
+    with MultiprocessingComputationalBackend(n_cpus=2) as backend:
+        SAMPO.backend = backend
+        try:
+            # the same generator is used by successive calls
+            genetic = GeneticScheduler(number_of_generation=1, size_of_population=10, rand=Random(1))
+
+            genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+            (problem_key, _), (params_key, _) = backend._worker_state
+
+            genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+            assert backend._worker_state[0][0] == problem_key
+            assert backend._worker_state[1][0] == params_key
+
+            # contractors modified in place are sent to the workers again
+            worker = next(iter(setup_contractors[0].workers.values()))
+            worker.count += 1
+            genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+            assert backend._worker_state[0][0] != problem_key
+        finally:
+            SAMPO.backend = default_backend
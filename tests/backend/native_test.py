@@ -0,0 +1,77 @@
+import pytest
+
+from sampo.api.genetic_api import ScheduleGenerationScheme
+from sampo.backend.default import DefaultComputationalBackend
+from sampo.backend.native import NativeComputationalBackend, is_native_applicable
+from sampo.scheduler.genetic.operators import TimeFitness, SumOfResourcesPeaksFitness
+from sampo.scheduler.genetic.utils import prepare_optimized_data_structures
+from sampo.scheduler.native_wrapper import NativeWrapper, native
+from sampo.schemas.schedule_spec import ScheduleSpec
+from sampo.schemas.time import Time
+from sampo.schemas.time_estimator import DefaultWorkEstimator
+
+from tests.scheduler.genetic.fixtures import setup_toolbox
+
+
+def make_population(tb, size: int = 5):
+    population = tb.population(n=size)
+    for individual in list(population):
+        mutant = tb.copy_individual(individual)
+        tb.mutate(mutant)
+        population.append(mutant)
+    return population
+
+
+def cache_problem(backend, wg, contractors, landscape, init_schedules,
+                  sgs_type: ScheduleGenerationScheme = ScheduleGenerationScheme.Parallel):
+    backend.cache_scheduler_info(wg, contractors, landscape, ScheduleSpec(), work_estimator=DefaultWorkEstimator())
+    backend.cache_genetic_info(10, 0.05, 0.05, 0.05, None, None, init_schedules, Time(0), (-1,), sgs_type,
+                               False, False)
+
+
+@pytest.mark.skipif(not native, reason='native module is not built')
+def test_native_evaluator_matches_parallel_sgs(setup_toolbox):
+    tb, _, setup_wg, setup_contractors, _, setup_landscape = setup_toolbox
+    if not is_native_applicable(setup_wg, setup_landscape, ScheduleSpec(), ScheduleGenerationScheme.Parallel,
+                                Time(0)):
+        pytest.skip('Native evaluator supports only works without zones and materials')
+
+    _, _, _, _, worker_name2index, _, worker_pool_indices, _, _, _, parents, _, _ = \
+        prepare_optimized_data_structures(setup_wg, setup_contractors, setup_landscape)
+    wrapper = NativeWrapper(tb, setup_wg, setup_contractors, worker_name2index, worker_pool_indices, parents,
+                            DefaultWorkEstimator())
+    population = make_population(tb)
+    try:
+        makespans = wrapper.evaluate(population)
+    finally:
+        wrapper.close()
+
+    for individual, makespan in zip(population, makespans):
+        sworks = tb.chromosome_to_schedule(individual, sgs_type=ScheduleGenerationScheme.Parallel)[0]
+        assert makespan == max(swork.finish_time.value for swork in sworks.values())
+
+
+def test_native_backend_matches_default_backend(setup_toolbox):
+    tb, _, setup_wg, setup_contractors, setup_default_schedules, setup_landscape = setup_toolbox
+    population = make_population(tb)
+
+    default_backend = DefaultComputationalBackend()
+    native_backend = NativeComputationalBackend()
+    for backend in (default_backend, native_backend):
+        cache_problem(backend, setup_wg, setup_contractors, setup_landscape, setup_default_schedules)
+    assert native_backend.is_native == (native and is_native_applicable(setup_wg, setup_landscape, ScheduleSpec(),
+                                                                        ScheduleGenerationScheme.Parallel,
+                                                                        Time(0)))
+
+    for fitness in (TimeFitness(), SumOfResourcesPeaksFitness()):
+        assert native_backend.compute_chromosomes(fitness, population) == \
+               default_backend.compute_chromosomes(fitness, population)
+
+
+def test_native_backend_falls_back_for_serial_sgs(setup_toolbox):
+    tb, _, setup_wg, setup_contractors, setup_default_schedules, setup_landscape = setup_toolbox
+
+    backend = NativeComputationalBackend()
+    cache_problem(backend, setup_wg, setup_contractors, setup_landscape, setup_default_schedules,
+                  ScheduleGenerationScheme.Serial)
+    assert not backend.is_native
@@ -0,0 +1,46 @@
+import numpy as np
+
+from sampo.backend.shared_memory import ChromosomeArena, SharedArray, attach_chromosome_parts, read_shared_bytes
+from sampo.schemas.schedule_spec import ScheduleSpec
+
+
+def make_chromosome(seed: int, works_count: int = 10):
+    rand = np.random.default_rng(seed)
+    return (rand.permutation(works_count), rand.integers(0, 5, (works_count, 3)), rand.integers(5, 10, (1, 2)),
+            ScheduleSpec(), np.zeros((works_count, 0), dtype=int))
+
+
+def test_arena_roundtrip():
+    arena = ChromosomeArena()
+    try:
+        chromosomes = [make_chromosome(seed) for seed in range(5)]
+        order, resources, borders, zones = attach_chromosome_parts(arena.write(chromosomes))
+        for i, chromosome in enumerate(chromosomes):
+            assert np.array_equal(order[i], chromosome[0])
+            assert np.array_equal(resources[i], chromosome[1])
+            assert np.array_equal(borders[i], chromosome[2])
+            assert np.array_equal(zones[i], chromosome[4])
+
+        # bigger population reallocates blocks
+        chromosomes = [make_chromosome(seed) for seed in range(20)]
+        order, resources, _, _ = attach_chromosome_parts(arena.write(chromosomes))
+        assert np.array_equal(order[19], chromosomes[19][0])
+        assert np.array_equal(resources[19], chromosomes[19][1])
+    finally:
+        arena.close()
+
+
+def test_arena_rejects_different_shapes():
+    arena = ChromosomeArena()
+    try:
+        assert arena.write([make_chromosome(0), make_chromosome(1, works_count=11)]) is None
+    finally:
+        arena.close()
+
+
+def test_shared_bytes():
+    shared = SharedArray.from_bytes(b'state')
+    try:
+        assert read_shared_bytes(shared.descriptor) == b'state'
+    finally:
+        shared.close()
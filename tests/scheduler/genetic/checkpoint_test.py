@@ -0,0 +1,83 @@
+from random import Random
+
+import pytest
+
+from sampo.backend.default import DefaultComputationalBackend
+from sampo.base import SAMPO
+from sampo.scheduler.genetic import GenerationRecord
+from sampo.scheduler.genetic.base import GeneticScheduler
+from sampo.scheduler.genetic.checkpoint import GeneticCheckpoint
+
+
+def test_resume_continues_run_exactly(setup_scheduler_parameters, tmp_path):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+    checkpoint_path = str(tmp_path / 'checkpoint.npz')
+
+    def schedule(number_of_generation: int, **kwargs):
+        genetic = GeneticScheduler(number_of_generation=number_of_generation,
+                                   size_of_population=10,
+                                   rand=Random(231),
+                                   **kwargs)
+        genetic.set_max_plateau_steps(number_of_generation * 2)
+        schedule = genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)[0]
+        return schedule.execution_time, schedule.full_schedule_df.start.tolist()
+
+    full_run = schedule(4)
+
+    schedule(2, checkpoint_path=checkpoint_path)
+    checkpoint = GeneticCheckpoint.load(checkpoint_path)
+    assert checkpoint.completed and checkpoint.generation == 3
+    # simulate interrupted run
+    checkpoint.completed = False
+    checkpoint.save(checkpoint_path)
+
+    assert schedule(4, resume_from=checkpoint_path) == full_run
+
+
+def test_warm_start(setup_scheduler_parameters, tmp_path):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+    checkpoint_path = str(tmp_path / 'checkpoint.npz')
+
+    genetic = GeneticScheduler(number_of_generation=2, size_of_population=10, checkpoint_path=checkpoint_path)
+    genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+
+    checkpoint = GeneticCheckpoint.load(checkpoint_path)
+    checkpoint_best = min(fitness[0] for fitness in checkpoint.hall_of_fame_fitness)
+
+    records: list[GenerationRecord] = []
+    genetic = GeneticScheduler(number_of_generation=2, size_of_population=10, resume_from=checkpoint_path,
+                               telemetry=records.append)
+    genetic.schedule(setup_wg, setup_contractors, validate=True, landscape=setup_landscape)
+
+    # the first population is seeded by the checkpoint
+    assert records[0].generation == 0
+    assert records[0].best_fitness[0] <= checkpoint_best
+
+
+@pytest.mark.parametrize('backend', [DefaultComputationalBackend(islands_count=2, migration_interval=2),
+                                     DefaultComputationalBackend(steady_state=True)],
+                         ids=['islands', 'steady-state'])
+def test_periodic_checkpoints_of_alternative_modes(setup_scheduler_parameters, tmp_path, monkeypatch, backend):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+    checkpoint_path = str(tmp_path / 'checkpoint.npz')
+
+    saved = []
+    original_save = GeneticCheckpoint.save
+
+    def recording_save(checkpoint: GeneticCheckpoint, path: str):
+        saved.append((checkpoint.generation, checkpoint.completed))
+        original_save(checkpoint, path)
+
+    monkeypatch.setattr(GeneticCheckpoint, 'save', recording_save)
+
+    default_backend = SAMPO.backend
+    SAMPO.backend = backend
+    try:
+        genetic = GeneticScheduler(number_of_generation=6, size_of_population=10,
+                                   checkpoint_path=checkpoint_path, checkpoint_interval=2)
+        genetic.set_max_plateau_steps(100)
+        genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+    finally:
+        SAMPO.backend = default_backend
+
+    assert saved == [(3, False), (5, False), (7, False), (7, True)]
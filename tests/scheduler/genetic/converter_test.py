@@ -1,11 +1,19 @@
+from functools import partial
 from uuid import uuid4
 
 import pytest
 
+from sampo.api.genetic_api import ScheduleGenerationScheme
+from sampo.scheduler.genetic.converter import SerialSGSCheckpoints, MakespanCutoffExceeded, makespan_tails, \
+    _EligibleWorks, is_profile_sgs_applicable, profile_serial_schedule_generation_scheme
 from sampo.scheduler.heft.base import HEFTScheduler
+from sampo.scheduler.utils import get_worker_contractor_pool
 from sampo.schemas.contractor import Contractor
+from sampo.schemas.landscape import LandscapeConfiguration
 from sampo.schemas.resources import Worker
 from sampo.schemas.schedule import Schedule
+from sampo.schemas.schedule_evaluation import ScheduleEvaluation, ResourceUsageAccumulator
+from sampo.utilities.resource_usage import resources_peaks_sum, resources_sum, resources_costs_sum
 from sampo.utilities.validation import validate_schedule
 
 from tests.scheduler.genetic.fixtures import setup_toolbox
@@ -59,3 +67,171 @@ def test_converter_with_borders_contractor_accounting(setup_toolbox):
     schedule = Schedule.from_scheduled_works(schedule.values(), setup_wg)
 
     validate_schedule(schedule, setup_wg, contractors)
+
+
+def test_evaluation_matches_schedule(setup_toolbox):
+    tb, _, setup_wg, _, _, _ = setup_toolbox
+
+    chromosome = tb.generate_chromosome()
+    evaluation = tb.evaluate_chromosome(chromosome)
+    schedule = Schedule.from_scheduled_works(tb.chromosome_to_schedule(chromosome)[0].values(), setup_wg)
+
+    assert evaluation.execution_time == schedule.execution_time
+    assert evaluation.resources_peaks_sum() == resources_peaks_sum(schedule)
+    assert evaluation.resources_sum() == resources_sum(schedule)
+    assert abs(evaluation.resources_costs_sum() - resources_costs_sum(schedule)) < 1e-6
+
+
+def test_incremental_serial_sgs_matches_full_replay(setup_toolbox):
+    tb, _, _, _, _, _ = setup_toolbox
+
+    checkpoints = SerialSGSCheckpoints()
+    chromosome = tb.generate_chromosome()
+    offspring = [chromosome]
+    for _ in range(5):
+        mutant = tb.copy_individual(chromosome)
+        tb.mutate(mutant)
+        offspring.append(mutant)
+    # the same chromosome once again, it should be restored from its own state
+    offspring.append(chromosome)
+
+    for individual in offspring:
+        full = tb.chromosome_to_schedule(individual, sgs_type=ScheduleGenerationScheme.Serial)[0]
+        incremental = tb.chromosome_to_schedule(individual, sgs_type=ScheduleGenerationScheme.IncrementalSerial,
+                                                checkpoints=checkpoints)[0]
+
+        assert full.keys() == incremental.keys()
+        for node, swork in full.items():
+            assert swork.start_end_time == incremental[node].start_end_time
+            assert swork.workers == incremental[node].workers
+
+    assert checkpoints.restored > 0
+
+
+@pytest.mark.parametrize('sgs_type', [ScheduleGenerationScheme.Parallel, ScheduleGenerationScheme.Serial])
+def test_makespan_cutoff(setup_toolbox, sgs_type):
+    tb, _, setup_wg, setup_contractors, _, _ = setup_toolbox
+    tails = makespan_tails(setup_wg.nodes, get_worker_contractor_pool(setup_contractors))
+
+    chromosome = tb.generate_chromosome()
+    sworks = tb.chromosome_to_schedule(chromosome, sgs_type=sgs_type)[0]
+    makespan = max(swork.finish_time for swork in sworks.values()).value
+
+    # the bound never exceeds the real makespan, so decoding isn't aborted
+    bounded = tb.chromosome_to_schedule(chromosome, sgs_type=sgs_type, cutoff=makespan, tails=tails)[0]
+    assert all(swork.start_end_time == bounded[node].start_end_time for node, swork in sworks.items())
+
+    cutoff = makespan // 2
+    with pytest.raises(MakespanCutoffExceeded) as e:
+        tb.chromosome_to_schedule(chromosome, sgs_type=sgs_type, cutoff=cutoff, tails=tails)
+    assert cutoff < e.value.lower_bound <= makespan
+
+
+@pytest.mark.parametrize('sgs_type', list(ScheduleGenerationScheme))
+def test_accumulated_evaluation_matches_scheduled_works(setup_toolbox, sgs_type):
+    tb, _, _, _, _, _ = setup_toolbox
+    mapping = {name: tb.evaluate_chromosome.keywords[name]
+               for name in ('work_id2index', 'worker_name2index', 'contractor2index')}
+
+    checkpoints = SerialSGSCheckpoints()
+    chromosome = tb.generate_chromosome()
+    mutant = tb.copy_individual(chromosome)
+    tb.mutate(mutant)
+    # the mutant is decoded from the saved state of the chromosome by incremental scheme
+    for individual in [chromosome, mutant]:
+        accumulator = ResourceUsageAccumulator(**mapping)
+        sworks = tb.chromosome_to_schedule(individual, sgs_type=sgs_type, checkpoints=checkpoints,
+                                           accumulator=accumulator)[0]
+        accumulated = accumulator.to_evaluation(sworks.values())
+        expected = ScheduleEvaluation.from_scheduled_works(sworks.values(), **mapping)
+
+        for name in ('start', 'finish', 'contractor', 'workers', 'unit_costs'):
+            assert (getattr(accumulated, name) == getattr(expected, name)).all()
+        assert accumulated.resources_sum() == expected.resources_sum()
+        assert abs(accumulated.resources_costs_sum() - expected.resources_costs_sum()) < 1e-6
+        assert accumulated.resources_peaks_sum() == expected.resources_peaks_sum()
+
+
+def test_array_parallel_sgs_matches_parallel_sgs(setup_toolbox):
+    tb, _, setup_wg, _, _, _ = setup_toolbox
+    mapping = {name: tb.evaluate_chromosome.keywords[name]
+               for name in ('work_id2index', 'worker_name2index', 'contractor2index')}
+    assert tb.evaluate_chromosome.keywords['array_sgs'] is not None
+
+    population = tb.population(n=5)
+    for individual in list(population):
+        mutant = tb.copy_individual(individual)
+        tb.mutate(mutant)
+        population.append(mutant)
+
+    for individual in population:
+        accumulator = ResourceUsageAccumulator(**mapping)
+        sworks = tb.chromosome_to_schedule(individual, sgs_type=ScheduleGenerationScheme.Parallel,
+                                           accumulator=accumulator)[0]
+        expected = accumulator.to_evaluation(sworks.values())
+        evaluation = tb.evaluate_chromosome(individual)
+
+        for name in ('start', 'finish', 'contractor', 'workers', 'unit_costs'):
+            assert (getattr(evaluation, name) == getattr(expected, name)).all()
+        assert evaluation.resources_sum() == expected.resources_sum()
+        assert abs(evaluation.resources_costs_sum() - expected.resources_costs_sum()) < 1e-6
+
+        # scheduled works are materialized on demand
+        materialized = evaluation.to_schedule(setup_wg).to_schedule_work_dict
+        assert materialized.keys() == {swork.id for swork in sworks.values()}
+        for swork in sworks.values():
+            assert str(materialized[swork.id]) == str(swork)
+            assert materialized[swork.id].zones_pre == swork.zones_pre
+
+
+def test_eligible_works_wait_for_parents(setup_toolbox):
+    _, _, setup_wg, _, _, _ = setup_toolbox
+
+    nodes = [node for node in setup_wg.nodes if not node.is_inseparable_son()]
+    # positions don't have to follow the precedence
+    nodes.reverse()
+    eligible = _EligibleWorks(nodes, [False] * len(nodes))
+
+    placed = set()
+    while eligible.remaining > 0:
+        position = next(eligible.scan())
+        assert all(parent in placed for parent in eligible.parents[position])
+        eligible.place(position)
+        placed.update(nodes[position].get_inseparable_chain_with_self())
+
+    assert placed == set(setup_wg.nodes)
+
+
+def test_profile_serial_sgs_matches_serial_sgs(setup_toolbox):
+    tb, _, setup_wg, _, _, _ = setup_toolbox
+    if not is_profile_sgs_applicable(setup_wg.nodes, LandscapeConfiguration()):
+        pytest.skip('Profile scheme supports only works without zones and materials')
+
+    mapping = {name: tb.evaluate_chromosome.keywords[name]
+               for name in ('work_id2index', 'worker_name2index', 'contractor2index')}
+    array_sgs = tb.evaluate_chromosome.keywords['array_sgs']
+    profile_sgs = partial(profile_serial_schedule_generation_scheme,
+                          **{name: array_sgs.keywords[name] for name in ('array_pool', 'index2node', 'index2contractor',
+                                                                         'assigned_parent_time', 'work_estimator')})
+
+    population = tb.population(n=5)
+    for individual in list(population):
+        mutant = tb.copy_individual(individual)
+        tb.mutate(mutant)
+        population.append(mutant)
+
+    for individual in population:
+        accumulator = ResourceUsageAccumulator(**mapping)
+        sworks = tb.chromosome_to_schedule(individual, sgs_type=ScheduleGenerationScheme.Serial,
+                                           accumulator=accumulator)[0]
+        expected = accumulator.to_evaluation(sworks.values())
+        accumulator = ResourceUsageAccumulator(**mapping)
+        evaluation = accumulator.to_evaluation(profile_sgs(individual, accumulator=accumulator))
+
+        for name in ('start', 'finish', 'contractor', 'workers', 'unit_costs'):
+            assert (getattr(evaluation, name) == getattr(expected, name)).all()
+
+        materialized = evaluation.to_schedule(setup_wg).to_schedule_work_dict
+        assert materialized.keys() == {swork.id for swork in sworks.values()}
+        for swork in sworks.values():
+            assert str(materialized[swork.id]) == str(swork)
@@ -0,0 +1,42 @@
+from tests.scheduler.genetic.fixtures import *
+from sampo.scheduler.genetic.encoding import ChromosomeLayout, narrowest_int_dtype
+from sampo.schemas.schedule_spec import ScheduleSpec
+
+
+def test_narrowest_int_dtype():
+    assert narrowest_int_dtype(100) == np.int16
+    assert narrowest_int_dtype(2 ** 15) == np.int32
+    assert narrowest_int_dtype(2 ** 40) == np.int64
+
+
+def test_layout_packs_chromosome_into_one_buffer():
+    layout = ChromosomeLayout(works_count=5, resources_count=3, contractors_count=2, zones_count=1, max_value=50)
+    spec = ScheduleSpec()
+    chromosome = (np.arange(5), np.arange(20).reshape(5, 4), np.full((2, 3), 50), spec, np.ones((5, 1), dtype=int))
+
+    packed = layout.pack(chromosome)
+    assert layout.is_packed(packed) and not layout.is_packed(chromosome)
+    assert packed[0].dtype == np.int16
+    for part, original in zip(packed, chromosome):
+        assert np.array_equal(part, original) if isinstance(part, np.ndarray) else part is original
+    assert layout.pack(packed)[0] is packed[0]
+
+    copy = layout.copy(packed)
+    assert copy[3] is spec
+    copy[1][0, 0] = 7
+    assert packed[1][0, 0] == 0
+    assert layout.buffer(copy) is not layout.buffer(packed)
+
+
+def test_toolbox_individuals_are_packed(setup_toolbox):
+    tb, _, _, _, _, _ = setup_toolbox
+
+    chromosome = tb.population(n=1)[0]
+    copy = tb.copy_individual(chromosome)
+
+    assert chromosome[0].base is not None and copy[0].base is not chromosome[0].base
+    assert all(part.base is copy[0].base for part in (copy[1], copy[2], copy[4]))
+    assert copy[3] is chromosome[3]
+    for part, original in zip(copy, chromosome):
+        if isinstance(part, np.ndarray):
+            assert np.array_equal(part, original)
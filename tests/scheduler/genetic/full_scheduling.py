@@ -21,11 +21,12 @@ def _test_multiprocessing(setup_scheduler_parameters):
     time_default = time.time() - start_default
 
     n_cpus = 10
-    SAMPO.backend = MultiprocessingComputationalBackend(n_cpus=n_cpus)
+    with MultiprocessingComputationalBackend(n_cpus=n_cpus) as backend:
+        SAMPO.backend = backend
 
-    start_multiproc = time.time()
-    genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
-    time_multiproc = time.time() - start_multiproc
+        start_multiproc = time.time()
+        genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+        time_multiproc = time.time() - start_multiproc
 
     print('\n------------------\n')
     print(f'Graph size: {setup_wg.vertex_count}')
@@ -0,0 +1,73 @@
+from sampo.scheduler import GeneticScheduler
+from sampo.backend.default import DefaultComputationalBackend
+from sampo.backend.fitness_cache import chromosome_digest
+from sampo.base import SAMPO
+
+
+class IslandsRecordingBackend(DefaultComputationalBackend):
+    """
+    Records islands passed to and returned from each `evolve_islands` call
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def evolve_islands(self, fitness, islands, generations, optimize_resources, seeds):
+        received = [[(chromosome_digest(ind), ind.fitness.values) for ind in island] for island in islands]
+        islands = super().evolve_islands(fitness, islands, generations, optimize_resources, seeds)
+        returned = [[(chromosome_digest(ind), ind.fitness.values) for ind in island] for island in islands]
+        self.calls.append((generations, received, returned))
+        return islands
+
+
+def test_island_model(setup_scheduler_parameters):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    default_backend = SAMPO.backend
+    backend = IslandsRecordingBackend(islands_count=2, migration_interval=2, migration_size=2)
+    SAMPO.backend = backend
+    try:
+        genetic = GeneticScheduler(number_of_generation=5,
+                                   mutate_order=0.05,
+                                   mutate_resources=0.05,
+                                   size_of_population=10)
+        genetic.set_max_plateau_steps(100)
+        genetic.schedule(setup_wg, setup_contractors, validate=True, landscape=setup_landscape)
+    finally:
+        SAMPO.backend = default_backend
+
+    # generations 1-2, 3-4 and 5
+    assert [generations for generations, _, _ in backend.calls] == [2, 2, 1]
+    for _, received, _ in backend.calls:
+        assert len(received) == 2
+        assert sum(len(island) for island in received) == 10
+
+    # migrants are the best individuals of the previous island in the ring,
+    # they are placed at the end of the next island
+    for (_, _, returned), (_, next_received, _) in zip(backend.calls, backend.calls[1:]):
+        for i, island in enumerate(next_received):
+            source = returned[i - 1]
+            migrants = island[-2:]
+            assert {digest for digest, _ in migrants} <= {digest for digest, _ in source}
+            assert sorted(fitness for _, fitness in migrants) == sorted(fitness for _, fitness in source)[:2]
+
+
+def test_island_model_small_population(setup_scheduler_parameters):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    default_backend = SAMPO.backend
+    backend = IslandsRecordingBackend(islands_count=2)
+    SAMPO.backend = backend
+    try:
+        genetic = GeneticScheduler(number_of_generation=2,
+                                   mutate_order=0.05,
+                                   mutate_resources=0.05,
+                                   size_of_population=1)
+        schedule = genetic.schedule(setup_wg, setup_contractors, validate=True, landscape=setup_landscape)
+    finally:
+        SAMPO.backend = default_backend
+
+    # the population can't be split into islands, so it evolves by the generational loop
+    assert not backend.calls
+    assert schedule
@@ -2,6 +2,10 @@ from tests.scheduler.genetic.fixtures import *
 from sampo.scheduler.genetic.converter import ChromosomeType
 import random
 
+from sampo.scheduler.genetic.operators import (stack_population, build_adjacency_arrays, build_precedence_arrays,
+                                               is_population_order_correct, mutate_scheduling_order,
+                                               mutate_scheduling_order_population)
+
 
 TEST_ITERATIONS = 10
 
@@ -88,3 +92,93 @@ def test_mate_resources(setup_toolbox, setup_wg):
         assert tb.validate(individual2)
 
 
+def test_mate_population(setup_toolbox, setup_wg):
+    tb, resources_border, _, _, _, _ = setup_toolbox
+    _, _, _, population_size = get_params(setup_wg.vertex_count)
+
+    population = tb.population(n=population_size)
+
+    for optimize_resources in (False, True):
+        orders, resources, borders = tb.mate_population(*stack_population(population), optimize_resources)
+
+        assert len(orders) == len(resources) == len(borders) == population_size // 2 * 2
+        for order, res, border, parent in zip(orders, resources, borders, population):
+            child = tb.Individual((order, res, border, parent[3], parent[4]))
+
+            # check there are no duplications
+            assert len(order) == len(set(order))
+            assert (resources_border[0] <= res.T[:-1]).all() and (res.T[:-1] <= resources_border[1]).all()
+            assert tb.validate(child)
+
+
+def test_mutate_population(setup_toolbox, setup_wg):
+    tb, resources_border, _, _, _, _ = setup_toolbox
+    _, _, _, population_size = get_params(setup_wg.vertex_count)
+
+    population = tb.population(n=population_size)
+
+    for i in range(TEST_ITERATIONS):
+        orders, resources, borders = stack_population(population)
+        tb.mutate_resource_borders_population(resources, borders)
+        tb.mutate_population(orders, resources, borders)
+
+        for order, res, border, parent in zip(orders, resources, borders, population):
+            mutant = tb.Individual((order, res, border, parent[3], parent[4]))
+
+            # check there are no duplications
+            assert len(order) == len(set(order))
+            assert (resources_border[0] <= res.T[:-1]).all() and (res.T[:-1] <= resources_border[1]).all()
+            assert tb.validate(mutant)
+
+
+def test_mutate_order_population_moves_works():
+    # chain 0 -> 1 -> 4 and independent works 2, 3 between start and finish
+    parents = {0: set(), 1: {0}, 2: {0}, 3: {0}, 4: {1, 2, 3}}
+    children = {0: {1, 2, 3}, 1: {4}, 2: {4}, 3: {4}, 4: set()}
+    orders = np.tile(np.arange(5), (20, 1))
+
+    mutate_scheduling_order_population(orders, 1, np.random.default_rng(0),
+                                       build_adjacency_arrays(parents, 5), build_adjacency_arrays(children, 5))
+
+    assert (orders[:, 0] == 0).all() and (orders[:, -1] == 4).all()
+    assert any((order != np.arange(5)).any() for order in orders)
+    for order in orders:
+        assert sorted(order) == list(range(5))
+
+
+def test_mutate_order_moves_works():
+    parents = {0: set(), 1: {0}, 2: {0}, 3: {0}, 4: {1, 2, 3}}
+    children = {0: {1, 2, 3}, 1: {4}, 2: {4}, 3: {4}, 4: set()}
+    precedence = build_precedence_arrays(parents, 5)
+    rand = random.Random(0)
+
+    orders = []
+    for i in range(TEST_ITERATIONS):
+        individual = [np.arange(5)]
+        mutate_scheduling_order(individual, 1, rand, parents, children)
+        orders.append(individual[0])
+    orders = np.stack(orders)
+
+    assert is_population_order_correct(orders, precedence).all()
+    assert any((order != np.arange(5)).any() for order in orders)
+
+
+def test_population_operators_keep_order_correct(setup_toolbox, setup_wg):
+    tb, _, _, _, _, _ = setup_toolbox
+    _, _, _, population_size = get_params(setup_wg.vertex_count)
+    population = tb.population(n=population_size)
+    precedence = tb.validate.keywords['precedence']
+
+    orders, resources, borders = stack_population(population)
+    for i in range(TEST_ITERATIONS):
+        orders, resources, borders = tb.mate_population(orders, resources, borders, False)
+        tb.mutate_population(orders, resources, borders)
+        assert is_population_order_correct(orders, precedence).all()
+
+
+def test_population_order_validation():
+    parents = {0: set(), 1: {0}, 2: {0}, 3: {1, 2}}
+    precedence = build_precedence_arrays(parents, 4)
+    orders = np.array([[0, 1, 2, 3], [0, 2, 1, 3], [1, 0, 2, 3], [0, 1, 1, 3]])
+
+    assert is_population_order_correct(orders, precedence).tolist() == [True, True, False, False]
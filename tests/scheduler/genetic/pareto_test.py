@@ -0,0 +1,84 @@
+import random
+
+import numpy as np
+import pytest
+from deap import base, tools
+
+from sampo.api.genetic_api import Individual
+from sampo.scheduler.genetic.operators import select_nsga2
+from sampo.scheduler.genetic.pareto import ParetoArchive, non_dominated_ranks, crowding_distances
+
+
+def make_individuals(weights: tuple[int, ...], count: int, rand: random.Random,
+                     max_value: int = 20) -> list[Individual]:
+    class IndividualFitness(base.Fitness):
+        pass
+
+    IndividualFitness.weights = weights
+    constructor = Individual.prepare(IndividualFitness)
+    individuals = []
+    for _ in range(count):
+        ind = constructor((np.array([rand.randint(0, 5)]),))
+        # small ranges give many equal and dominated points
+        ind.fitness.values = tuple(rand.randint(0, max_value) for _ in weights)
+        individuals.append(ind)
+    return individuals
+
+
+@pytest.mark.parametrize('weights', [(-1,), (-1, -1), (-1, 1), (-1, -1, -1)])
+def test_archive_matches_deap_pareto_front(weights):
+    rand = random.Random(17)
+    archive = ParetoArchive()
+    # individuals with equal fitness values are twins, as in the genetic algorithm
+    front = tools.ParetoFront(similar=lambda first, second: first.fitness == second.fitness)
+
+    for _ in range(20):
+        population = make_individuals(weights, 30, rand)
+        archive.update(population)
+        front.update(population)
+        assert [ind.fitness.values for ind in archive] == [ind.fitness.values for ind in front]
+
+    restored = ParetoArchive()
+    restored.restore(list(archive))
+    population = make_individuals(weights, 30, rand)
+    restored.update(population)
+    front.update(population)
+    assert [ind.fitness.values for ind in restored] == [ind.fitness.values for ind in front]
+
+
+@pytest.mark.parametrize('objectives', [1, 2, 3])
+def test_non_dominated_ranks_match_deap_sorting(objectives):
+    rand = random.Random(5)
+    weights = (-1,) * objectives
+    population = make_individuals(weights, 200, rand)
+
+    ranks = non_dominated_ranks(np.array([ind.fitness.values for ind in population], dtype=float))
+
+    fronts = tools.sortNondominated(population, len(population))
+    assert ranks.max() + 1 == len(fronts)
+    for rank, front in enumerate(fronts):
+        assert sorted(id(ind) for ind in front) == sorted(id(ind) for ind, ind_rank in zip(population, ranks)
+                                                          if ind_rank == rank)
+
+
+@pytest.mark.parametrize('weights', [(-1, -1), (-1, 1), (-1, -1, -1)])
+def test_select_nsga2_matches_deap(weights):
+    rand = random.Random(11)
+    # crowding distances of equal points depend on the order of sorting
+    population = make_individuals(weights, 100, rand, max_value=10 ** 9)
+    k = 37
+
+    chosen = select_nsga2(population, k)
+    expected = tools.selNSGA2(population, k)
+
+    assert len(chosen) == k and len({id(ind) for ind in chosen}) == k
+    # both take the same whole fronts and the same crowding distances from the last one
+    points = -np.array([ind.fitness.wvalues for ind in population])
+    ranks = dict(zip(map(id, population), non_dominated_ranks(points)))
+    assert sorted(ranks[id(ind)] for ind in chosen) == sorted(ranks[id(ind)] for ind in expected)
+    last_rank = max(ranks[id(ind)] for ind in chosen)
+    last_front = [ind for ind in population if ranks[id(ind)] == last_rank]
+    distances = dict(zip(map(id, last_front), crowding_distances(-np.array([ind.fitness.wvalues
+                                                                            for ind in last_front]))))
+    assert sorted(distances[id(ind)] for ind in chosen if ranks[id(ind)] == last_rank) \
+        == sorted(ind.fitness.crowding_dist for ind in expected if ranks[id(ind)] == last_rank)
@@ -0,0 +1,58 @@
+from sampo.scheduler import GeneticScheduler
+from sampo.backend.default import DefaultComputationalBackend
+from sampo.base import SAMPO
+from sampo.scheduler.genetic import schedule_builder
+
+
+def run_steady_state(setup_scheduler_parameters, monkeypatch, generation_number: int, max_plateau_steps: int,
+                     population_size: int = 10) -> list[tuple]:
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    runs = []
+
+    def recording_run_steady_state(*args, **kwargs):
+        result = original_run_steady_state(*args, **kwargs)
+        runs.append(result)
+        return result
+
+    original_run_steady_state = schedule_builder.run_steady_state
+    monkeypatch.setattr(schedule_builder, 'run_steady_state', recording_run_steady_state)
+
+    default_backend = SAMPO.backend
+    SAMPO.backend = DefaultComputationalBackend(steady_state=True)
+    try:
+        genetic = GeneticScheduler(number_of_generation=generation_number,
+                                   mutate_order=0.05,
+                                   mutate_resources=0.05,
+                                   size_of_population=population_size)
+        genetic.set_max_plateau_steps(max_plateau_steps)
+        genetic.schedule(setup_wg, setup_contractors, validate=True, landscape=setup_landscape)
+    finally:
+        SAMPO.backend = default_backend
+
+    return runs
+
+
+def test_steady_state_stops_by_plateau(setup_scheduler_parameters, monkeypatch):
+    runs = run_steady_state(setup_scheduler_parameters, monkeypatch, 100, 2)
+    assert len(runs) == 1
+    population, generation, plateau_steps = runs[0]
+
+    assert len(population) == 10
+    assert plateau_steps == 2
+    assert generation <= 101
+
+
+def test_steady_state_stops_by_generation_number(setup_scheduler_parameters, monkeypatch):
+    runs = run_steady_state(setup_scheduler_parameters, monkeypatch, 3, 100)
+    assert len(runs) == 1
+    population, generation, plateau_steps = runs[0]
+
+    assert len(population) == 10
+    assert generation == 4
+    assert plateau_steps < 100
+
+
+def test_steady_state_small_population(setup_scheduler_parameters, monkeypatch):
+    # offspring can't be made of the single individual, so the population evolves by the generational loop
+    assert not run_steady_state(setup_scheduler_parameters, monkeypatch, 2, 100, population_size=1)
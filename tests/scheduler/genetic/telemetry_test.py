@@ -0,0 +1,88 @@
+import csv
+import json
+
+import numpy as np
+
+from sampo.backend.default import DefaultComputationalBackend
+from sampo.base import SAMPO
+from sampo.scheduler.genetic import GeneticScheduler, GenerationRecord, GenerationRecordWriter
+from sampo.scheduler.genetic.telemetry import population_diversity
+
+
+def test_population_diversity():
+    orders = np.array([[0, 1, 2, 3]] * 4)
+    assert population_diversity(orders) == 0
+
+    orders = np.array([[0, 1, 2, 3], [1, 2, 3, 0], [2, 3, 0, 1], [3, 0, 1, 2]])
+    assert population_diversity(orders) == 1
+
+    orders = np.array([[0, 1, 2, 3], [0, 1, 3, 2]])
+    assert population_diversity(orders) == 0.5
+
+
+def test_generation_records(setup_scheduler_parameters, tmp_path):
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    records: list[GenerationRecord] = []
+    genetic = GeneticScheduler(number_of_generation=3, size_of_population=10, telemetry=records.append)
+    genetic.set_max_plateau_steps(10)
+    genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+
+    assert [record.generation for record in records] == [0, 1, 2, 3]
+    for record in records:
+        assert record.population_size > 0
+        assert record.evaluation_time >= 0 and record.operators_time >= 0 and record.selection_time >= 0
+        assert 0 <= record.diversity <= 1
+        assert record.best_fitness[0] <= record.median_fitness[0]
+
+    with GenerationRecordWriter(str(tmp_path / 'telemetry.csv')) as writer:
+        for record in records:
+            writer(record)
+    with open(tmp_path / 'telemetry.csv') as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row['generation']) for row in rows] == [0, 1, 2, 3]
+    assert float(rows[-1]['best_fitness_0']) == records[-1].best_fitness[0]
+
+    with GenerationRecordWriter(str(tmp_path / 'telemetry.jsonl')) as writer:
+        for record in records:
+            writer(record)
+    with open(tmp_path / 'telemetry.jsonl') as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[1]['cache_hits'] == records[1].cache_hits
+
+
+def schedule_with_telemetry(setup_scheduler_parameters, backend) -> list[GenerationRecord]:
+    setup_wg, setup_contractors, setup_landscape = setup_scheduler_parameters
+
+    records: list[GenerationRecord] = []
+    default_backend = SAMPO.backend
+    SAMPO.backend = backend
+    try:
+        genetic = GeneticScheduler(number_of_generation=6, size_of_population=10, telemetry=records.append)
+        genetic.set_max_plateau_steps(100)
+        genetic.schedule(setup_wg, setup_contractors, landscape=setup_landscape)
+    finally:
+        SAMPO.backend = default_backend
+    return records
+
+
+def test_steady_state_generation_records(setup_scheduler_parameters):
+    records = schedule_with_telemetry(setup_scheduler_parameters, DefaultComputationalBackend(steady_state=True))
+
+    assert [record.generation for record in records] == [0, 1, 2, 3, 4, 5, 6]
+    for record in records[1:]:
+        assert record.population_size == 10
+        assert record.cache_hits + record.cache_misses == 10
+        assert record.evaluation_time >= 0 and record.operators_time >= 0 and record.selection_time >= 0
+
+
+def test_islands_generation_records(setup_scheduler_parameters):
+    records = schedule_with_telemetry(setup_scheduler_parameters,
+                                      DefaultComputationalBackend(islands_count=2, migration_interval=2))
+
+    # records are made after each migration
+    assert [record.generation for record in records] == [0, 2, 4, 6]
+    for record in records[1:]:
+        assert record.population_size == 10
+        assert record.evaluation_time >= 0 and record.selection_time >= 0
+        assert record.best_fitness[0] <= record.median_fitness[0]
@@ -7,8 +7,11 @@ from sampo.scheduler.heft.prioritization import prioritization
 from sampo.scheduler.timeline.just_in_time_timeline import JustInTimeTimeline
 from sampo.scheduler.utils import get_worker_contractor_pool
 from sampo.schemas.graph import GraphNode
+from sampo.schemas.landscape import LandscapeConfiguration
+from sampo.schemas.resources import Worker
 from sampo.schemas.schedule_spec import WorkSpec
 from sampo.schemas.scheduled_work import ScheduledWork
+from sampo.schemas.time import Time
 from sampo.schemas.time_estimator import DefaultWorkEstimator
 from sampo.utilities.collections_util import build_index
 
@@ -30,6 +33,24 @@ def test_init_resource_structure(setup_timeline):
         assert setup_timeline[0][0] == 0
 
 
+def test_update_keeps_release_order():
+    worker = Worker('1', 'worker', 10, contractor_id='contractor')
+    timeline = JustInTimeTimeline({worker.name: {worker.contractor_id: worker}}, LandscapeConfiguration())
+
+    def occupy(finish_time: int, count: int):
+        timeline.update_timeline(Time(finish_time), Time(1), None, [worker.copy().with_count(count)], WorkSpec())
+
+    occupy(5, 3)
+    occupy(3, 2)
+    # the pair with the same release time goes after the existing one
+    occupy(5, 5)
+    assert timeline._timeline[worker.get_agent_id()] == [(Time(5), 3), (Time(5), 5), (Time(3), 2)]
+
+    assert timeline.find_min_agents_time([worker.copy().with_count(2)], WorkSpec()) == 3
+    assert timeline.find_min_agents_time([worker.copy().with_count(4)], WorkSpec()) == 5
+    assert timeline.find_min_agents_time([worker.copy().with_count(0)], WorkSpec()) == 0
+
+
 # def test_update_resource_structure(setup_timeline):
 #     setup_timeline, _, _, setup_worker_pool = setup_timeline
 #
@@ -71,3 +92,28 @@ def test_schedule(setup_timeline):
     for swork in node2swork.values():
         assert not swork.finish_time.is_inf()
 
+
+def test_fork_and_rollback(setup_timeline):
+    setup_timeline, setup_wg, setup_contractors, setup_worker_pool = setup_timeline
+
+    ordered_nodes = prioritization(setup_wg, DefaultWorkEstimator())
+    contractor = setup_contractors[0]
+    middle = len(ordered_nodes) // 2
+
+    def schedule_nodes(timeline: JustInTimeTimeline, nodes: list[GraphNode], node2swork: dict):
+        for node in reversed(nodes):
+            worker_team = [setup_worker_pool[req.kind][contractor.id].copy().with_count(req.min_count)
+                           for req in node.work_unit.worker_reqs]
+            timeline.schedule(node, node2swork, worker_team, contractor, WorkSpec(),
+                              work_estimator=DefaultWorkEstimator())
+
+    node2swork: Dict[GraphNode, ScheduledWork] = {}
+    schedule_nodes(setup_timeline, ordered_nodes[middle:], node2swork)
+    base_state = {agent: list(stack) for agent, stack in setup_timeline._timeline.items()}
+
+    fork = setup_timeline.fork()
+    schedule_nodes(fork, ordered_nodes[:middle], dict(node2swork))
+    assert {agent: list(stack) for agent, stack in setup_timeline._timeline.items()} == base_state
+
+    fork.rollback()
+    assert {agent: list(stack) for agent, stack in fork._timeline.items()} == base_state
@@ -0,0 +1,30 @@
+from random import Random
+
+from sampo.scheduler.timeline import SupplyTimeline
+from sampo.schemas.interval import IntervalGaussian
+from sampo.schemas.landscape import LandscapeConfiguration, ResourceHolder
+from sampo.schemas.resources import Material
+from sampo.schemas.time import Time
+
+
+def test_best_supply_is_least_loaded_depot():
+    rand = Random(25)
+    holders = [ResourceHolder(f'depot{i}', f'depot{i}', IntervalGaussian(rand.choice([10, 20, 30]), 0),
+                              materials=[Material(f'{i}_{name}', name, rand.randint(1000, 3000))
+                                         for name in ('mat1', 'mat2') if rand.random() < 0.8])
+               for i in range(10)]
+    timeline = SupplyTimeline(LandscapeConfiguration(holders=holders))
+
+    for i in range(100):
+        start_time = Time(rand.randint(0, 200))
+        materials = [Material(str(i), name, rand.randint(10, 100)) for name in ('mat1', 'mat2')]
+        timeline.deliver_materials(str(i), start_time, start_time + 10, materials, 50)
+
+        deadline = Time(rand.randint(0, 300))
+        for material in materials:
+            # depots with the least deliveries before the deadline, then with the greatest capacity
+            depots = [(timeline._timeline[depot_id].bisect_key_left(deadline.value), -timeline._capacity[depot_id],
+                       order, depot_id)
+                      for order, (depot_id, count) in enumerate(timeline.resource_sources[material.name].items())
+                      if count >= material.count]
+            assert timeline._find_best_supply(material.name, material.count, deadline) == min(depots)[-1]
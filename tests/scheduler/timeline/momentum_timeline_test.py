@@ -96,3 +96,45 @@ def test_insert_works_with_one_worker_kind(setup_timeline_context):
 #     assert len(node2swork) == 1
 #     for swork in node2swork.values():
 #         assert not swork.finish_time.is_inf()
+
+
+def test_fork_and_rollback(setup_timeline_context):
+    timeline, wg, contractors, worker_pool, worker_kinds = setup_timeline_context
+
+    def timeline_state(t: MomentumTimeline):
+        return {(contractor, worker_name): [(event.time, event.seq_id, event.available_workers_count)
+                                            for event in state]
+                for contractor, contractor_timeline in t._timeline.items()
+                for worker_name, state in contractor_timeline.items()}
+
+    worker_kind = next(iter(worker_kinds))
+    contractor = contractors[0]
+    worker_count = contractor.workers[worker_kind].count
+
+    def schedule_works(t: MomentumTimeline, prefix: str):
+        node2swork = {}
+        for i in range(5):
+            work_unit = WorkUnit(id=f'{prefix}{i}', name=f'Work {prefix}{i}',
+                                 worker_reqs=[WorkerReq(kind=worker_kind, volume=Time(50),
+                                                        min_count=1, max_count=worker_count)])
+            node = GraphNode(work_unit=work_unit, parent_works=[])
+            worker_team = [Worker(id=str(i), name=worker_kind, count=worker_count // 2, contractor_id=contractor.id)]
+            t.schedule(node, node2swork, worker_team, contractor, WorkSpec())
+
+    schedule_works(timeline, 'base')
+    base_state = timeline_state(timeline)
+
+    fork = timeline.fork()
+    assert timeline_state(fork) == base_state
+
+    schedule_works(fork, 'fork')
+    fork_state = timeline_state(fork)
+    assert fork_state != base_state
+    assert timeline_state(timeline) == base_state
+
+    # modifications of the original timeline don't affect the fork
+    schedule_works(timeline, 'other')
+    assert timeline_state(fork) == fork_state
+
+    fork.rollback()
+    assert timeline_state(fork) == base_state
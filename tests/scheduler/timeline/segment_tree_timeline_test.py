@@ -0,0 +1,47 @@
+from random import Random
+
+from sampo.scheduler.lft.base import LFTScheduler
+from sampo.scheduler.timeline import MomentumTimeline, SegmentTreeTimeline
+from sampo.scheduler.timeline.segment_tree_timeline import ResourceSegmentTree
+
+
+def test_resource_segment_tree_matches_array():
+    rand = Random(231)
+    horizon = 200
+    capacity = 10
+    tree = ResourceSegmentTree(capacity)
+    available = [capacity] * horizon
+
+    for _ in range(100):
+        start = rand.randint(0, horizon - 1)
+        end = rand.randint(start + 1, horizon)
+        delta = rand.randint(-3, 3)
+        tree.add(start, end, delta)
+        for t in range(start, end):
+            available[t] += delta
+
+        count = rand.randint(capacity - 5, capacity + 2)
+        start = rand.randint(0, horizon - 1)
+        end = rand.randint(start + 1, horizon)
+        lacks = [t for t in range(start, end) if available[t] < count]
+        assert tree.find_last_less(start, end, count) == (lacks[-1] if lacks else -1)
+        # after the horizon all the workers are available
+        enough = [t for t in range(start, horizon) if available[t] >= count] \
+            + [horizon if count <= capacity else -1]
+        assert tree.find_first_at_least(start, count) == enough[0]
+
+    copy = tree.copy()
+    copy.add(0, horizon, -capacity)
+    assert tree.find_last_less(0, horizon, min(available) + 1) >= 0
+    assert tree.find_last_less(0, horizon, min(available)) == -1
+
+
+def test_same_schedule_as_momentum_timeline(setup_scheduler_parameters):
+    setup_wg, setup_contractors, landscape = setup_scheduler_parameters
+
+    momentum_schedule = LFTScheduler(timeline_type=MomentumTimeline) \
+        .schedule(setup_wg, setup_contractors, landscape=landscape)[0]
+    segment_tree_schedule = LFTScheduler(timeline_type=SegmentTreeTimeline) \
+        .schedule(setup_wg, setup_contractors, landscape=landscape)[0]
+
+    assert sorted(map(str, momentum_schedule.works)) == sorted(map(str, segment_tree_schedule.works))
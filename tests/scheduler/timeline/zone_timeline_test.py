@@ -1,3 +1,5 @@
+from random import Random
+
 import numpy as np
 from pytest import fixture
 
@@ -5,7 +7,10 @@ from sampo.generator import SyntheticGraphType
 from sampo.generator.environment.contractor_by_wg import get_contractor_by_wg
 from sampo.schemas.graph import WorkGraph
 from sampo.schemas.landscape import LandscapeConfiguration
+from sampo.scheduler.timeline import ZoneTimeline
 from sampo.schemas.requirements import ZoneReq
+from sampo.schemas.time import Time
+from sampo.schemas.types import EventType
 from sampo.schemas.zones import ZoneConfiguration
 
 
@@ -59,3 +64,36 @@ def test_zoned_scheduling(setup_zoned_wg, setup_landscape_config, setup_schedule
     contractors = [get_contractor_by_wg(setup_zoned_wg, scaler=1000)]
     schedule = setup_scheduler.schedule(wg=setup_zoned_wg, contractors=contractors, landscape=setup_landscape_config)[0]
     print(schedule.execution_time)
+
+
+def test_indexed_searches_match_events_scan():
+    rand = Random(24)
+    time_costs = np.array([
+        [0, 3, 5],
+        [0, 0, 4],
+        [0, 2, 0]
+    ])
+    timeline = ZoneTimeline(ZoneConfiguration(start_statuses={'zone1': 1}, time_costs=time_costs))
+
+    for index in range(100):
+        zone_req = ZoneReq(kind='zone1', required_status=rand.randint(0, 2))
+        exec_time = Time(rand.randint(0, 10))
+        start_time = timeline.find_min_start_time([zone_req], Time(rand.randint(0, 300)), exec_time)
+        timeline.update_timeline(index, [zone_req.to_zone()], start_time, exec_time)
+        # the copy should be indexed the same way
+        timeline = timeline.copy()
+
+    state = timeline._timeline['zone1']
+    for idx in range(len(state) + 1):
+        starts_count = sum(1 for event in state[idx:] if event.event_type is EventType.START)
+        assert timeline._is_inside_interval('zone1', idx) == (2 * starts_count == len(state) - idx)
+
+    for _ in range(200):
+        start_idx = rand.randint(0, len(state) - 1)
+        end_time = state[start_idx].time + rand.randint(0, 50)
+        required_status = rand.randint(0, 2)
+        end_idx = state.bisect_right(end_time)
+        incompatible = [idx for idx in range(start_idx, end_idx)
+                        if not timeline._match_status(state[idx].available_workers_count, required_status)]
+        assert timeline._last_incompatible_event('zone1', start_idx, end_time, required_status) \
+               == (incompatible[-1] if incompatible else -1)